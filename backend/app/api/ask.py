@@ -1,12 +1,17 @@
 """RAG-powered Q&A API endpoint."""
+import asyncio
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional
 import os
+from app.api import documents
 from app.core.config import settings
 
 router = APIRouter()
 
+# Strong references to fire-and-forget tasks (the event loop only keeps weak ones)
+_background_tasks: set[asyncio.Task] = set()
+
 
 class AskRequest(BaseModel):
     """Question request model."""
@@ -46,6 +51,13 @@ async def ask_question(request: AskRequest):
             pipeline = get_rag_pipeline()
             response = await pipeline.ask(request.question, request.fiscal_year)
             
+            # Render cited pages in the background so click-through is a cache hit
+            cited = documents.record_citations(response.citations)
+            if cited:
+                task = asyncio.create_task(documents.prewarm_pages(cited))
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+            
             return AskResponse(
                 answer=response.answer,
                 numbers=response.numbers,
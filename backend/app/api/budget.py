@@ -1,11 +1,43 @@
 """Budget API endpoints."""
-from fastapi import APIRouter, Depends
+import base64
+import binascii
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from typing import Optional
 from datetime import date
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.ministries import ministry_code
+from app.core.responses import FastJSONResponse
+from app.db.database import get_db
+from app.db.models import BudgetItem, Document, Ministry
 
 router = APIRouter()
 
+# Projectable line item fields -> column expressions
+ITEM_FIELDS = {
+    "id": BudgetItem.id,
+    "fiscal_year": BudgetItem.fiscal_year,
+    "ministry_code": Ministry.code,
+    "ministry": Ministry.name,
+    "item_code": BudgetItem.item_code,
+    "item_name": BudgetItem.item_name,
+    "category": BudgetItem.category,
+    "amount": BudgetItem.amount,
+    "previous_year_amount": BudgetItem.previous_year_amount,
+    "source_document": Document.filename,
+    "source_page": BudgetItem.source_page,
+}
+# sort parameter -> (key column, descending)
+ITEM_SORTS = {
+    "id": (BudgetItem.id, False),
+    "amount": (BudgetItem.amount, False),
+    "-amount": (BudgetItem.amount, True),
+}
+MAX_ITEMS_PAGE = 1000
+
 
 class BudgetSummary(BaseModel):
     """Budget summary response model."""
@@ -65,7 +97,7 @@ async def get_budget_summary(fiscal_year: Optional[str] = None):
 @router.get("/priorities")
 async def get_budget_priorities():
     """Get the four budget priorities/pillars."""
-    return {
+    return FastJSONResponse({
         "fiscal_year": "2025/26",
         "priorities": [
             {
@@ -91,14 +123,14 @@ async def get_budget_priorities():
         ],
         "source_document": "Budget_Communication_25_26_final_1.pdf",
         "source_page": 3,
-    }
+    })
 
 
 @router.get("/historical")
 async def get_historical_budgets(years: int = 10):
     """Get historical budget data for trend analysis from Fiscal Summary."""
     # Real data from Fiscal Summary table (Page 34)
-    return {
+    return FastJSONResponse({
         "years": [
             {"year": "2020/21", "revenue": 1_908_600_000, "expenditure": 3_243_600_000, "debt": 9_934_800_000, "debt_gdp": 88.7},
             {"year": "2021/22", "revenue": 2_605_300_000, "expenditure": 3_327_900_000, "debt": 10_792_400_000, "debt_gdp": 83.2},
@@ -109,13 +141,13 @@ async def get_historical_budgets(years: int = 10):
         ],
         "source_document": "Bahamas BudgetFINAL_2025-2026_.pdf",
         "source_page": 34,
-    }
+    })
 
 
 @router.get("/sector-breakdown")
 async def get_sector_breakdown():
     """Get expenditure breakdown by major sectors."""
-    return {
+    return FastJSONResponse({
         "fiscal_year": "2025/26",
         "sectors": [
             {"name": "Education", "amount": 353_413_898, "color": "#00CED1"},  # MOE + Dept Education + Technical
@@ -130,5 +162,110 @@ async def get_sector_breakdown():
         "total": 3_444_518_797,
         "source_document": "Bahamas BudgetFINAL_2025-2026_.pdf",
         "source_page": 71,
-    }
+    })
+
+
+
+def _encode_cursor(sort: str, key, item_id: int) -> str:
+    payload = json.dumps([sort, key, item_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _decode_cursor(cursor: str, sort: str) -> tuple:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(payload, list):
+            raise ValueError("cursor is not a list")
+        cursor_sort, key, item_id = payload
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if cursor_sort != sort:
+        raise HTTPException(status_code=400, detail="Cursor was issued for a different sort order")
+    # Values go straight into the keyset comparison, so their types must match the columns
+    key_column = ITEM_SORTS[sort][0]
+    key_valid = _is_int(key) if key_column is BudgetItem.id else (
+        key is None or _is_int(key) or isinstance(key, float)
+    )
+    if not (_is_int(item_id) and key_valid):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return key, item_id
 
+
+@router.get("/items")
+async def list_budget_items(
+    fiscal_year: Optional[str] = None,
+    ministry: Optional[str] = Query(None, description="Ministry id (e.g. 'health') or code (e.g. 'MOH')"),
+    category: Optional[str] = None,
+    min_amount: Optional[float] = None,
+    max_amount: Optional[float] = None,
+    sort: str = Query("id", description="id, amount or -amount"),
+    fields: Optional[str] = Query(None, description=f"Comma-separated subset of: {', '.join(ITEM_FIELDS)}"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(100, ge=1, le=MAX_ITEMS_PAGE),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Page through budget line items.
+    
+    Uses keyset pagination on (sort key, id): pass the returned next_cursor
+    to fetch the following page. Every page costs the same regardless of
+    depth, unlike OFFSET.
+    """
+    if sort not in ITEM_SORTS:
+        raise HTTPException(status_code=400, detail=f"Sort must be one of {list(ITEM_SORTS)}")
+    selected = [f.strip() for f in fields.split(",") if f.strip()] if fields else list(ITEM_FIELDS)
+    unknown = [f for f in selected if f not in ITEM_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {unknown}")
+    
+    key_column, descending = ITEM_SORTS[sort]
+    columns = [ITEM_FIELDS[f].label(f) for f in selected]
+    stmt = select(*columns, BudgetItem.id.label("_id"), key_column.label("_key")).select_from(BudgetItem)
+    if {"ministry_code", "ministry"} & set(selected):
+        stmt = stmt.outerjoin(Ministry, Ministry.id == BudgetItem.ministry_id)
+    if "source_document" in selected:
+        stmt = stmt.outerjoin(Document, Document.id == BudgetItem.source_document_id)
+    
+    if fiscal_year:
+        stmt = stmt.where(BudgetItem.fiscal_year == fiscal_year)
+    if ministry:
+        ministry_id = select(Ministry.id).where(Ministry.code == ministry_code(ministry)).scalar_subquery()
+        stmt = stmt.where(BudgetItem.ministry_id == ministry_id)
+    if category:
+        stmt = stmt.where(BudgetItem.category == category)
+    if min_amount is not None:
+        stmt = stmt.where(BudgetItem.amount >= min_amount)
+    if max_amount is not None:
+        stmt = stmt.where(BudgetItem.amount <= max_amount)
+    
+    if cursor:
+        key, item_id = _decode_cursor(cursor, sort)
+        if key_column is BudgetItem.id:
+            stmt = stmt.where(BudgetItem.id > item_id)
+        elif descending:
+            stmt = stmt.where(tuple_(key_column, BudgetItem.id) < tuple_(key, item_id))
+        else:
+            stmt = stmt.where(tuple_(key_column, BudgetItem.id) > tuple_(key, item_id))
+    
+    if key_column is BudgetItem.id:
+        stmt = stmt.order_by(BudgetItem.id)
+    elif descending:
+        stmt = stmt.order_by(key_column.desc(), BudgetItem.id.desc())
+    else:
+        stmt = stmt.order_by(key_column, BudgetItem.id)
+    
+    rows = (await db.execute(stmt.limit(limit + 1))).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(sort, rows[-1]._key, rows[-1]._id)
+    
+    return FastJSONResponse({
+        "items": [{f: getattr(row, f) for f in selected} for row in rows],
+        "next_cursor": next_cursor,
+        "limit": limit,
+    })
@@ -0,0 +1,154 @@
+"""Dashboard bootstrap endpoint: every homepage payload in one response."""
+import asyncio
+import hashlib
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Header, Request
+from fastapi.responses import Response
+
+from app.core.config import settings
+from app.db.data_version import data_version
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Response key -> API path. Sections only change on ingest, so their
+# composite is cached per data version.
+SECTIONS = {
+    "budget_summary": "/budget/summary",
+    "historical": "/budget/historical",
+    "sector_breakdown": "/budget/sector-breakdown",
+    "ministries": "/ministries",
+    "revenue": "/revenue",
+    "debt": "/debt",
+    "economic_comparison": "/economic/comparison",
+}
+# Sections that change between ingests (served from their own short-lived caches)
+LIVE_SECTIONS = {
+    "active_poll": "/polls/active",
+}
+DASHBOARD_CACHE_CONTROL = "public, max-age=5, stale-while-revalidate=60"
+
+
+async def _internal_get(app, path: str) -> tuple[int, bytes]:
+    """
+    Run a GET through the full ASGI app in-process.
+
+    Each section gets its own DB session and goes through the response
+    cache, so cached sections cost a dictionary lookup.
+    """
+    path = f"{settings.API_V1_PREFIX}{path}"
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"dashboard.internal")],
+        "client": None,
+        "server": None,
+    }
+    status = 500
+    chunks: list[bytes] = []
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
+
+
+async def _gather(app, sections: dict[str, str]) -> tuple[bytes, bool]:
+    """
+    Fetch sections concurrently and join them as raw JSON members (no re-parsing).
+
+    Returns the joined members and whether every section loaded.
+    """
+    results = await asyncio.gather(
+        *(_internal_get(app, path) for path in sections.values()),
+        return_exceptions=True,
+    )
+    members = []
+    complete = True
+    for key, result in zip(sections, results):
+        if isinstance(result, Exception):
+            logger.warning("Dashboard section %s failed: %s", key, result)
+            body = b"null"
+            complete = False
+        elif result[0] != 200 or not result[1]:
+            logger.warning("Dashboard section %s returned HTTP %s", key, result[0])
+            body = b"null"
+            complete = False
+        else:
+            body = result[1]
+        members.append(b'"' + key.encode() + b'":' + body)
+    return b",".join(members), complete
+
+
+class DashboardCache:
+    """
+    Composite of the ingest-bound sections, rebuilt once per data version.
+
+    A composite with a failed section is served but not kept, so the next
+    request retries instead of serving null until the next ingest.
+    """
+
+    def __init__(self):
+        self._version: Optional[int] = None
+        self._body = b""
+        self._lock = asyncio.Lock()
+
+    async def get(self, app, version: int) -> bytes:
+        if self._version == version:
+            return self._body
+        async with self._lock:
+            if self._version == version:
+                return self._body
+            body, complete = await _gather(app, SECTIONS)
+            if complete:
+                self._body, self._version = body, version
+        return body
+
+
+dashboard_cache = DashboardCache()
+
+
+@router.get("")
+async def get_dashboard(request: Request, if_none_match: Optional[str] = Header(None)):
+    """
+    Everything the homepage needs in one round trip.
+
+    Returns the budget summary, historical series, sector breakdown,
+    ministries, revenue, debt, income comparison and active poll, keyed as
+    in SECTIONS / LIVE_SECTIONS. A section is null if it failed to load.
+    """
+    version = await data_version.current()
+    cached, (live, _) = await asyncio.gather(
+        dashboard_cache.get(request.app, version),
+        _gather(request.app, LIVE_SECTIONS),
+    )
+    body = b'{"data_version":' + str(version).encode() + b"," + cached + b"," + live + b"}"
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": DASHBOARD_CACHE_CONTROL}
+    if if_none_match:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
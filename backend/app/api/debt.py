@@ -4,6 +4,8 @@ from pydantic import BaseModel
 from typing import Optional
 from datetime import date
 
+from app.core.responses import FastJSONResponse
+
 router = APIRouter()
 
 
@@ -124,7 +126,7 @@ async def get_repayment_schedule():
 async def get_debt_historical(years: int = 10):
     """Get historical debt levels."""
     # TODO: Fetch from database
-    return {
+    return FastJSONResponse({
         "years": [
             {"year": "2015/16", "total": 6_800_000_000, "domestic": 3_800_000_000, "external": 3_000_000_000, "gdp_ratio": 62.5},
             {"year": "2016/17", "total": 7_200_000_000, "domestic": 4_000_000_000, "external": 3_200_000_000, "gdp_ratio": 65.0},
@@ -137,5 +139,5 @@ async def get_debt_historical(years: int = 10):
             {"year": "2023/24", "total": 11_300_000_000, "domestic": 6_100_000_000, "external": 5_200_000_000, "gdp_ratio": 82.8},
             {"year": "2024/25", "total": 11_500_000_000, "domestic": 6_200_000_000, "external": 5_300_000_000, "gdp_ratio": 82.5},
         ]
-    }
+    })
 
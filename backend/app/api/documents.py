@@ -1,94 +1,364 @@
 """Document serving API endpoints."""
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import FileResponse, Response
-from pathlib import Path
+import hashlib
+import json
+import logging
 import os
+import re
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from typing import Optional
+from urllib.parse import quote, unquote
+
+import anyio
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from app.core.config import settings
+from app.core.pdf_pages import (
+    MAX_SLICE_PAGES,
+    CitationCounter,
+    PageCache,
+    PageOutOfRange,
+    render_page_png,
+    slice_pdf,
+)
+from app.core.responses import FastJSONResponse
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Path to data directory (absolute path)
-DATA_DIR = Path("/home/ubuntu/apps/bahamasopendata/data/raw")
+# Cache-Control for URLs carrying the file hash (?v=...) vs. bare filenames
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DEFAULT_CACHE_CONTROL = "public, max-age=300, must-revalidate"
+RANGE_CHUNK_SIZE = 64 * 1024
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+_PAGES_PATTERN = re.compile(r"^(\d+)(?:-(\d+))?$")
+PAGE_MEDIA_TYPES = {"pdf": "application/pdf", "png": "image/png"}
+
+
+def normalize_document_name(name: str) -> str:
+    """Normalize a filename for lookup (ignore case, spaces and underscores)."""
+    return name.lower().replace(" ", "").replace("_", "")
+
+
+class DocumentIndex:
+    """
+    Normalized filename -> path index over a directory of PDFs.
+
+    At most every ``check_interval`` seconds the directory is scanned and
+    each file's (st_mtime_ns, st_size) compared with the last build, along
+    with document_metadata.json's; the index is rebuilt only when one of
+    them changed, so lookups stay O(1). Hashes from the metadata are used
+    only for files not modified after it was written.
+    """
+
+    def __init__(self, directory: Path, check_interval: float):
+        self.directory = directory
+        self.metadata_file = directory.parent / "document_metadata.json"
+        self.check_interval = check_interval
+        self._by_name: dict[str, Path] = {}
+        self._hashes: dict[str, str] = {}  # filename -> SHA-256
+        self._computed_hashes: dict[Path, tuple[int, int, str]] = {}
+        self._documents: list[dict] = []
+        self._signature: Optional[tuple] = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def refresh(self, force: bool = False) -> None:
+        """Rebuild the index if any file (or the metadata) changed since the last build."""
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+        files = self._scan()
+        try:
+            stat = self.metadata_file.stat()
+            metadata_key = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            metadata_key = None
+        signature = (files, metadata_key)
+        if not force and signature == self._signature:
+            return
+
+        with self._lock:
+            by_name: dict[str, Path] = {}
+            hashes = {
+                name: digest for name, digest in self._load_metadata_hashes().items()
+                if metadata_key and name in files and files[name][0] <= metadata_key[0]
+            }
+            documents: list[dict] = []
+            for name, (_, size) in files.items():
+                path = self.directory / name
+                # Exact names win over normalized collisions
+                by_name[name] = path
+                by_name.setdefault(normalize_document_name(name), path)
+                documents.append({"filename": name, "size": size, "file_hash": hashes.get(name)})
+            documents.sort(key=lambda d: d["filename"])
+            self._by_name, self._hashes, self._documents, self._signature = by_name, hashes, documents, signature
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        """Filename -> (st_mtime_ns, st_size) for every PDF in the directory."""
+        files = {}
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.lower().endswith(".pdf"):
+                        stat = entry.stat()
+                        files[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            pass
+        return files
+
+    def _load_metadata_hashes(self) -> dict[str, str]:
+        """SHA-256 hashes recorded by the ingestion pipeline, keyed by filename."""
+        try:
+            with open(self.metadata_file) as f:
+                metadata = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return {
+            doc["filename"]: doc["file_hash"]
+            for doc in metadata.get("documents", [])
+            if doc.get("filename") and doc.get("file_hash")
+        }
+
+    async def file_hash(self, path: Path) -> str:
+        """Stored SHA-256 of a document, computed once per file version if unknown."""
+        if path.name in self._hashes:
+            return self._hashes[path.name]
+        stat = path.stat()
+        cached = self._computed_hashes.get(path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        digest = await run_in_threadpool(_sha256_file, path)
+        self._computed_hashes[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def resolve(self, filename: str) -> Optional[Path]:
+        """Find a document by exact or normalized filename."""
+        self.refresh()
+        return self._by_name.get(filename) or self._by_name.get(normalize_document_name(filename))
+
+    def documents(self) -> list[dict]:
+        self.refresh()
+        return self._documents
+
+
+def _sha256_file(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _parse_range(range_header: str, size: int) -> Optional[tuple[int, int]]:
+    """
+    Parse a single "bytes=start-end" range into inclusive offsets.
+
+    Returns None for headers we don't handle (multiple ranges, other units),
+    in which case the whole file is served. Raises 416 if unsatisfiable.
+    """
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None
+    start_text, end_text = match.groups()
+    if not start_text and not end_text:
+        return None
+    if start_text:
+        start = int(start_text)
+        end = min(int(end_text), size - 1) if end_text else size - 1
+    else:
+        # Suffix range: last N bytes
+        start = max(size - int(end_text), 0)
+        end = size - 1
+    if start >= size or start > end:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+async def _iter_file_range(path: Path, start: int, end: int):
+    async with await anyio.open_file(path, "rb") as f:
+        await f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await f.read(min(RANGE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+document_index = DocumentIndex(
+    settings.DATA_DIR / "raw",
+    check_interval=settings.DOCUMENT_INDEX_CHECK_SECONDS,
+)
+
+page_cache = PageCache(settings.DATA_DIR / "page_cache", max_bytes=settings.PAGE_CACHE_MAX_BYTES)
+citation_counter = CitationCounter(settings.DATA_DIR / "page_cache" / "citations.json")
+
+
+def _parse_pages(pages: str) -> tuple[int, int]:
+    """Parse "5" or "5-7" into an inclusive 1-based page range."""
+    match = _PAGES_PATTERN.match(pages)
+    if not match:
+        raise HTTPException(status_code=400, detail="Pages must look like '5' or '5-7'")
+    first = int(match.group(1))
+    last = int(match.group(2) or first)
+    if first < 1 or last < first:
+        raise HTTPException(status_code=400, detail="Invalid page range")
+    if last - first + 1 > MAX_SLICE_PAGES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_SLICE_PAGES} pages per request")
+    return first, last
+
+
+async def _cached_page(file_path: Path, file_hash: str, first: int, last: int, fmt: str) -> Path:
+    """Fetch a page slice or thumbnail from the disk cache, rendering it on a miss."""
+    key = page_cache.key(file_hash, first, last, fmt)
+    if fmt == "png":
+        render = partial(render_page_png, file_path, first)
+    else:
+        render = partial(slice_pdf, file_path, first, last)
+    return await run_in_threadpool(page_cache.get_or_create, key, render)
+
+
+def record_citations(citations) -> list[tuple[str, int]]:
+    """Count cited (document, page) pairs so the hottest pages get pre-warmed."""
+    pairs = [(c.document, c.page) for c in citations if c.page]
+    for document, page in pairs:
+        citation_counter.record(document, page)
+    return pairs
+
+
+async def prewarm_pages(pairs: list[tuple[str, int]]) -> int:
+    """Render single-page PDFs for the given (document, page) pairs; returns how many were warmed."""
+    warmed = 0
+    for document, page in pairs:
+        file_path = document_index.resolve(document)
+        if not file_path:
+            continue
+        try:
+            file_hash = await document_index.file_hash(file_path)
+            await _cached_page(file_path, file_hash, page, page, "pdf")
+            warmed += 1
+        except Exception as exc:
+            logger.warning("Could not pre-warm %s page %d: %s", document, page, exc)
+    return warmed
+
+
+async def prewarm_most_cited(limit: int) -> int:
+    """Pre-warm the most frequently cited pages (run at startup)."""
+    return await prewarm_pages(citation_counter.most_common(limit))
+
+
+@router.get("/{filename}/pages/{pages}")
+async def get_document_pages(
+    filename: str,
+    pages: str,
+    format: str = Query("pdf", pattern="^(pdf|png)$", description="pdf (page slice) or png (thumbnail of the first page)"),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Serve a single page or a small page range ("5" or "5-7") of a document.
+    
+    Slices are small standalone PDFs; format=png renders the first page as a
+    thumbnail. Artifacts are cached on disk keyed by the document's SHA-256,
+    so responses are immutable for a given document version.
+    """
+    filename = unquote(filename)
+    first, last = _parse_pages(pages)
+    
+    file_path = document_index.resolve(filename)
+    if not file_path or not file_path.exists():
+        raise HTTPException(status_code=404, detail=f"Document '{filename}' not found")
+    
+    file_hash = await document_index.file_hash(file_path)
+    if format == "png":
+        last = first
+    etag = f'"{file_hash}-{first}-{last}-{format}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        "Content-Disposition": f"inline; filename*=UTF-8''{quote(f'{Path(filename).stem}-p{pages}.{format}')}",
+    }
+    if if_none_match:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    
+    try:
+        cached = await _cached_page(file_path, file_hash, first, last, format)
+    except PageOutOfRange as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    return FileResponse(cached, media_type=PAGE_MEDIA_TYPES[format], headers=headers)
 
 
 @router.get("/{filename}")
 async def get_document(
     filename: str,
-    page: int = Query(None, description="Page number to jump to in PDF viewer")
+    page: int = Query(None, description="Page number to jump to in PDF viewer"),
+    v: Optional[str] = Query(None, description="File hash for content-addressed (immutable) URLs"),
+    range_header: Optional[str] = Header(None, alias="Range"),
+    if_range: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     Serve a PDF document.
     
-    If page is provided, returns a response that can be used to open the PDF
-    at a specific page (browser-dependent).
+    Supports byte ranges (for PDF.js partial loading), a strong ETag from the
+    document's SHA-256 and 304 revalidation. URLs with ?v=<file_hash> are
+    served as immutable. The page parameter is accepted for link
+    compatibility; browsers jump to the page via the #page=N fragment.
     """
     # Decode URL encoding
-    from urllib.parse import unquote
     filename = unquote(filename)
     
-    # Try to find the file - check both with and without underscores
-    file_path = None
+    file_path = document_index.resolve(filename)
+    if not file_path or not file_path.exists():
+        raise HTTPException(status_code=404, detail=f"Document '{filename}' not found")
     
-    # First try exact match
-    if (DATA_DIR / filename).exists():
-        file_path = DATA_DIR / filename
-    # Try with underscores replaced by spaces
-    elif (DATA_DIR / filename.replace('_', ' ')).exists():
-        file_path = DATA_DIR / filename.replace('_', ' ')
-    # Try with spaces replaced by underscores
-    elif (DATA_DIR / filename.replace(' ', '_')).exists():
-        file_path = DATA_DIR / filename.replace(' ', '_')
-    else:
-        # List all PDFs and try fuzzy match
-        for pdf_file in DATA_DIR.glob("*.pdf"):
-            # Compare normalized names (ignore case, spaces, underscores)
-            normalized_pdf = pdf_file.name.lower().replace(' ', '_').replace('_', '')
-            normalized_search = filename.lower().replace(' ', '_').replace('_', '')
-            if normalized_pdf == normalized_search or pdf_file.name.lower() == filename.lower():
-                file_path = pdf_file
-                break
+    file_hash = await document_index.file_hash(file_path)
+    etag = f'"{file_hash}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if v == file_hash else DEFAULT_CACHE_CONTROL,
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f"inline; filename*=UTF-8''{quote(filename)}",
+    }
     
-    if not file_path or not file_path.exists():
-        raise HTTPException(
-            status_code=404,
-            detail=f"Document '{filename}' not found. Available: {[f.name for f in DATA_DIR.glob('*.pdf')]}"
-        )
+    if if_none_match:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
     
-    # Return PDF file
-    if page:
-        # For PDFs with page numbers, we can use a data URI or return the file
-        # Most browsers support #page=N in the URL, but we'll return the file
-        # and let the frontend handle the page navigation
-        response = FileResponse(
-            file_path,
-            media_type="application/pdf",
-            filename=filename,
-            headers={
-                "Content-Disposition": f'inline; filename="{filename}"',
-            }
-        )
-        return response
-    else:
-        return FileResponse(
-            file_path,
-            media_type="application/pdf",
-            filename=filename,
-            headers={
-                "Content-Disposition": f'inline; filename="{filename}"',
-            }
-        )
+    size = file_path.stat().st_size
+    byte_range = None
+    if range_header and (not if_range or if_range.strip() == etag):
+        byte_range = _parse_range(range_header, size)
+    
+    if byte_range is None:
+        return FileResponse(file_path, media_type="application/pdf", headers=headers)
+    
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        _iter_file_range(file_path, start, end),
+        status_code=206,
+        media_type="application/pdf",
+        headers=headers,
+    )
 
 
 @router.get("")
 async def list_documents():
     """List all available documents."""
-    documents = []
-    
-    if DATA_DIR.exists():
-        for file_path in DATA_DIR.glob("*.pdf"):
-            documents.append({
-                "filename": file_path.name,
-                "size": file_path.stat().st_size,
-            })
-    
-    return {"documents": documents}
-
+    return FastJSONResponse({"documents": document_index.documents()})
@@ -1,8 +1,19 @@
 """Economic Indicators API endpoints."""
-from fastapi import APIRouter, HTTPException
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from typing import Optional, List, Dict
+from typing import Optional, List
 from datetime import date
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.core.indicator_series import IndicatorSeries, to_json_list
+from app.core.responses import FastJSONResponse
+from app.db.data_version import data_version
+from app.db.database import AsyncSessionLocal, get_db
+from app.db.models import EconomicIndicator as IndicatorRow
 
 router = APIRouter()
 
@@ -40,79 +51,225 @@ class IncomeComparison(BaseModel):
     difference_amount: float
 
 
-# Mock data based on the 2024 study
-# TODO: Replace with database queries
-MOCK_DATA = {
-    "new_providence": {
-        "middle_class": {
-            "indicator_type": "middle_class",
-            "island": "new_providence",
-            "year": 2024,
-            "month_amount": 10200.0,
-            "annual_amount": 122400.0,
-            "breakdown": {
-                "food": 2500.0,
-                "housing_utilities": 2142.0,
-                "nfnh": 3508.0,
-                "savings": 2040.0
-            },
-            "source_document": "How Much Does It Cost to Be Middle Class in The Bahamas?",
-            "source_url": "https://www.ub.edu.bs/wp-content/uploads/Archer2024Final.pdf",
-            "author": "Lesvie Archer",
-            "published_date": date(2024, 3, 1)
-        },
-        "working_class": {
-            "indicator_type": "working_class",
-            "island": "new_providence",
-            "year": 2024,
-            "month_amount": 5000.0,
-            "annual_amount": 60000.0,
-            "breakdown": None,
-            "source_document": "The Bahamas Living Wages Survey (updated to 2024)",
-            "source_url": "https://www.ub.edu.bs/wp-content/uploads/2016/10/GPPI_Living-Wage-Survey_revised_27-May-2021.pdf",
-            "author": "Lesvie Archer et al.",
-            "published_date": date(2020, 3, 1)
-        }
-    },
-    "grand_bahama": {
-        "middle_class": {
-            "indicator_type": "middle_class",
-            "island": "grand_bahama",
-            "year": 2024,
-            "month_amount": 10100.0,
-            "annual_amount": 121200.0,
-            "breakdown": {
-                "food": 2850.0,
-                "housing_utilities": 1692.0,
-                "nfnh": 3508.0,
-                "savings": 2020.0
-            },
-            "source_document": "How Much Does It Cost to Be Middle Class in The Bahamas?",
-            "source_url": "https://www.ub.edu.bs/wp-content/uploads/Archer2024Final.pdf",
-            "author": "Lesvie Archer",
-            "published_date": date(2024, 3, 1)
-        },
-        "working_class": {
-            "indicator_type": "working_class",
-            "island": "grand_bahama",
-            "year": 2024,
-            "month_amount": 6600.0,
-            "annual_amount": 79200.0,
-            "breakdown": None,
-            "source_document": "The Bahamas Living Wages Survey (updated to 2024)",
-            "source_url": "https://www.ub.edu.bs/wp-content/uploads/2016/10/GPPI_Living-Wage-Survey_revised_27-May-2021.pdf",
-            "author": "Lesvie Archer et al.",
-            "published_date": date(2020, 3, 1)
-        }
-    }
-}
+# Data from the 2024 University of The Bahamas study.
+# Served until economic indicators have been seeded (see backend/seed_economic_data.py).
+FALLBACK_INDICATORS = [
+    EconomicIndicator(
+        indicator_type="middle_class",
+        island="new_providence",
+        year=2024,
+        month_amount=10200.0,
+        annual_amount=122400.0,
+        breakdown=IncomeBreakdown(food=2500.0, housing_utilities=2142.0, nfnh=3508.0, savings=2040.0),
+        source_document="How Much Does It Cost to Be Middle Class in The Bahamas?",
+        source_url="https://www.ub.edu.bs/wp-content/uploads/Archer2024Final.pdf",
+        author="Lesvie Archer",
+        published_date=date(2024, 3, 1),
+    ),
+    EconomicIndicator(
+        indicator_type="working_class",
+        island="new_providence",
+        year=2024,
+        month_amount=5000.0,
+        annual_amount=60000.0,
+        source_document="The Bahamas Living Wages Survey (updated to 2024)",
+        source_url="https://www.ub.edu.bs/wp-content/uploads/2016/10/GPPI_Living-Wage-Survey_revised_27-May-2021.pdf",
+        author="Lesvie Archer et al.",
+        published_date=date(2020, 3, 1),
+    ),
+    EconomicIndicator(
+        indicator_type="middle_class",
+        island="grand_bahama",
+        year=2024,
+        month_amount=10100.0,
+        annual_amount=121200.0,
+        breakdown=IncomeBreakdown(food=2850.0, housing_utilities=1692.0, nfnh=3508.0, savings=2020.0),
+        source_document="How Much Does It Cost to Be Middle Class in The Bahamas?",
+        source_url="https://www.ub.edu.bs/wp-content/uploads/Archer2024Final.pdf",
+        author="Lesvie Archer",
+        published_date=date(2024, 3, 1),
+    ),
+    EconomicIndicator(
+        indicator_type="working_class",
+        island="grand_bahama",
+        year=2024,
+        month_amount=6600.0,
+        annual_amount=79200.0,
+        source_document="The Bahamas Living Wages Survey (updated to 2024)",
+        source_url="https://www.ub.edu.bs/wp-content/uploads/2016/10/GPPI_Living-Wage-Survey_revised_27-May-2021.pdf",
+        author="Lesvie Archer et al.",
+        published_date=date(2020, 3, 1),
+    ),
+]
+
+INDICATOR_FIELDS = tuple(EconomicIndicator.model_fields)
+
+
+def _to_indicator(row: IndicatorRow) -> EconomicIndicator:
+    return EconomicIndicator(**{field: getattr(row, field) for field in INDICATOR_FIELDS})
+
+
+def _indicator_query(
+    indicator_type: Optional[str] = None,
+    island: Optional[str] = None,
+    year: Optional[int] = None,
+):
+    """Indicators matching the filters, in idx_economic_type_island_year order."""
+    query = select(IndicatorRow)
+    if indicator_type:
+        query = query.where(IndicatorRow.indicator_type == indicator_type)
+    if island:
+        query = query.where(IndicatorRow.island == island)
+    if year is not None:
+        query = query.where(IndicatorRow.year == year)
+    return query.order_by(
+        IndicatorRow.indicator_type, IndicatorRow.island, IndicatorRow.year, IndicatorRow.id
+    )
+
+
+def _comparison_query(island: Optional[str] = None, year: Optional[int] = None):
+    """
+    Middle vs working class for every (island, year) that has both, in one statement.
+
+    The grouped subquery picks the latest row of each type per island and
+    year; the outer query joins both rows back and computes the difference.
+    """
+    pairs = (
+        select(
+            IndicatorRow.island,
+            IndicatorRow.year,
+            func.max(case((IndicatorRow.indicator_type == "middle_class", IndicatorRow.id))).label("middle_id"),
+            func.max(case((IndicatorRow.indicator_type == "working_class", IndicatorRow.id))).label("working_id"),
+        )
+        .where(IndicatorRow.indicator_type.in_(("middle_class", "working_class")))
+        .group_by(IndicatorRow.island, IndicatorRow.year)
+    )
+    if island:
+        pairs = pairs.where(IndicatorRow.island == island)
+    if year is not None:
+        pairs = pairs.where(IndicatorRow.year == year)
+    pairs = pairs.subquery()
+
+    middle = aliased(IndicatorRow)
+    working = aliased(IndicatorRow)
+    difference = middle.month_amount - working.month_amount
+    return (
+        select(
+            middle,
+            working,
+            difference.label("difference_amount"),
+            (difference * 100.0 / func.nullif(working.month_amount, 0)).label("difference_percent"),
+        )
+        .select_from(pairs)
+        .join(middle, middle.id == pairs.c.middle_id)
+        .join(working, working.id == pairs.c.working_id)
+        .order_by(pairs.c.island, pairs.c.year)
+    )
+
+
+def _comparison(
+    middle_class: EconomicIndicator,
+    working_class: EconomicIndicator,
+    difference_amount: float,
+    difference_percent: Optional[float],
+) -> IncomeComparison:
+    return IncomeComparison(
+        island=middle_class.island,
+        year=middle_class.year,
+        middle_class=middle_class,
+        working_class=working_class,
+        difference_percent=round(difference_percent or 0.0, 2),
+        difference_amount=round(difference_amount, 2),
+    )
+
+
+def _fallback_comparisons() -> List[IncomeComparison]:
+    by_key = {(i.indicator_type, i.island, i.year): i for i in FALLBACK_INDICATORS}
+    results = []
+    for (indicator_type, island, year), middle_class in by_key.items():
+        working_class = by_key.get(("working_class", island, year))
+        if indicator_type != "middle_class" or working_class is None:
+            continue
+        difference = middle_class.month_amount - working_class.month_amount
+        results.append(_comparison(middle_class, working_class, difference, difference / working_class.month_amount * 100))
+    # Same order as _comparison_query
+    return sorted(results, key=lambda c: (c.island, c.year))
+
+
+class IndicatorSnapshot:
+    """
+    Process-wide copy of every indicator, the unfiltered comparison and
+    the indicator time series.
+
+    Reloaded on first use after the data version changes (ingestion and
+    seed_economic_data.py bump it). Serves FALLBACK_INDICATORS while the
+    table is empty.
+    """
+
+    def __init__(self):
+        self.indicators: List[EconomicIndicator] = []
+        self.comparisons: List[IncomeComparison] = []
+        self.series = IndicatorSeries.from_rows([])
+        self.from_database = False
+        self._version: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> "IndicatorSnapshot":
+        version = await data_version.current()
+        if version != self._version:
+            async with self._lock:
+                if version != self._version:
+                    await self._load()
+                    self._version = version
+        return self
+
+    async def _load(self) -> None:
+        async with AsyncSessionLocal() as db:
+            indicators = [_to_indicator(row) for row in (await db.execute(_indicator_query())).scalars()]
+            comparisons = [
+                _comparison(_to_indicator(middle), _to_indicator(working), amount, percent)
+                for middle, working, amount, percent in await db.execute(_comparison_query())
+            ]
+        self.from_database = bool(indicators)
+        self.indicators = indicators if indicators else sorted(
+            FALLBACK_INDICATORS, key=lambda i: (i.indicator_type, i.island, i.year)
+        )
+        self.comparisons = comparisons if indicators else _fallback_comparisons()
+        self.series = IndicatorSeries.from_rows(
+            (i.indicator_type, i.island, i.year, i.month_amount) for i in self.indicators
+        )
+
+
+indicator_snapshot = IndicatorSnapshot()
+
+
+async def _find_indicators(
+    db: AsyncSession,
+    indicator_type: Optional[str] = None,
+    island: Optional[str] = None,
+    year: Optional[int] = None,
+) -> List[EconomicIndicator]:
+    """Filtered indicators: from the snapshot when unfiltered, else via the composite index."""
+    snapshot = await indicator_snapshot.get()
+    if not (indicator_type or island or year is not None):
+        return snapshot.indicators
+    if snapshot.from_database:
+        result = await db.execute(_indicator_query(indicator_type, island, year))
+        return [_to_indicator(row) for row in result.scalars()]
+    return [
+        i for i in snapshot.indicators
+        if (not indicator_type or i.indicator_type == indicator_type)
+        and (not island or i.island == island)
+        and (year is None or i.year == year)
+    ]
 
 
 @router.get("/indicators", response_model=List[EconomicIndicator])
 async def get_all_indicators(
     indicator_type: Optional[str] = None,
     island: Optional[str] = None,
-    year: Optional[int] = None
+    year: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get all economic indicators.
@@ -122,102 +279,173 @@ async def get_all_indicators(
     - island: "new_providence" or "grand_bahama"
     - year: Filter by year
     """
-    # TODO: Fetch from database
-    results = []
-    
-    for island_key, island_data in MOCK_DATA.items():
-        if island and island_key != island:
-            continue
-            
-        for class_type, data in island_data.items():
-            if indicator_type and class_type != indicator_type:
-                continue
-            if year and data["year"] != year:
-                continue
-                
-            indicator = EconomicIndicator(**data)
-            results.append(indicator)
-    
-    return results
+    return await _find_indicators(db, indicator_type, island, year)
 
 
 @router.get("/indicators/{island}", response_model=List[EconomicIndicator])
-async def get_indicators_by_island(island: str):
+async def get_indicators_by_island(island: str, db: AsyncSession = Depends(get_db)):
     """
     Get all economic indicators for a specific island.
     
     Island options: "new_providence" or "grand_bahama"
     """
-    if island not in MOCK_DATA:
+    results = await _find_indicators(db, island=island)
+    if not results:
         raise HTTPException(status_code=404, detail=f"Island '{island}' not found")
-    
-    # TODO: Fetch from database
-    results = []
-    for class_type, data in MOCK_DATA[island].items():
-        indicator = EconomicIndicator(**data)
-        results.append(indicator)
-    
     return results
 
 
 @router.get("/indicators/{island}/{indicator_type}", response_model=EconomicIndicator)
-async def get_specific_indicator(island: str, indicator_type: str):
+async def get_specific_indicator(island: str, indicator_type: str, db: AsyncSession = Depends(get_db)):
     """
-    Get a specific economic indicator.
+    Get the latest year of a specific economic indicator.
     
     Island options: "new_providence" or "grand_bahama"
     Indicator type options: "middle_class" or "working_class"
     """
-    if island not in MOCK_DATA:
-        raise HTTPException(status_code=404, detail=f"Island '{island}' not found")
-    
-    if indicator_type not in MOCK_DATA[island]:
+    results = await _find_indicators(db, indicator_type, island)
+    if not results:
+        if not await _find_indicators(db, island=island):
+            raise HTTPException(status_code=404, detail=f"Island '{island}' not found")
         raise HTTPException(status_code=404, detail=f"Indicator type '{indicator_type}' not found for {island}")
-    
-    # TODO: Fetch from database
-    data = MOCK_DATA[island][indicator_type]
-    return EconomicIndicator(**data)
+    return results[-1]
 
 
 @router.get("/comparison", response_model=List[IncomeComparison])
-async def get_comparison(island: Optional[str] = None, year: Optional[int] = None):
+async def get_comparison(
+    island: Optional[str] = None,
+    year: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
+):
     """
     Compare middle class vs working class income requirements.
     
     Optional filters:
-    - island: "new_providence" or "grand_bahama" (if not provided, returns both)
+    - island: "new_providence" or "grand_bahama" (if not provided, returns all)
     - year: Filter by year
     """
-    # TODO: Fetch from database
-    results = []
-    
-    islands_to_process = [island] if island else list(MOCK_DATA.keys())
-    
-    for island_key in islands_to_process:
-        if island_key not in MOCK_DATA:
-            continue
-            
-        island_data = MOCK_DATA[island_key]
-        middle_class_data = island_data["middle_class"]
-        working_class_data = island_data["working_class"]
-        
-        if year and (middle_class_data["year"] != year or working_class_data["year"] != year):
+    snapshot = await indicator_snapshot.get()
+    if not (island or year is not None):
+        return snapshot.comparisons
+    if snapshot.from_database:
+        result = await db.execute(_comparison_query(island, year))
+        return [
+            _comparison(_to_indicator(middle), _to_indicator(working), amount, percent)
+            for middle, working, amount, percent in result
+        ]
+    return [
+        c for c in snapshot.comparisons
+        if (not island or c.island == island) and (year is None or c.year == year)
+    ]
+
+
+def _series_keys(series: IndicatorSeries, indicator_type: Optional[str], island: Optional[str]):
+    """(type index, type, island index, island) for the selected series."""
+    for t, type_name in enumerate(series.types):
+        if indicator_type and type_name != indicator_type:
             continue
-        
-        middle_class = EconomicIndicator(**middle_class_data)
-        working_class = EconomicIndicator(**working_class_data)
-        
-        difference_amount = middle_class.month_amount - working_class.month_amount
-        difference_percent = (difference_amount / working_class.month_amount) * 100
-        
-        comparison = IncomeComparison(
-            island=island_key,
-            year=middle_class.year,
-            middle_class=middle_class,
-            working_class=working_class,
-            difference_percent=round(difference_percent, 2),
-            difference_amount=round(difference_amount, 2)
+        for i, island_name in enumerate(series.islands):
+            if island and island_name != island:
+                continue
+            yield t, type_name, i, island_name
+
+
+@router.get("/series")
+async def get_series(indicator_type: Optional[str] = None, island: Optional[str] = None):
+    """
+    Monthly income required per indicator type and island, by year.
+
+    Missing years inside a series are linearly interpolated (``observed``
+    is false for those); ``yoy_percent`` is the change from the previous year.
+    """
+    series = (await indicator_snapshot.get()).series
+    monthly = to_json_list(series.values)
+    annual = to_json_list(series.values * 12)
+    yoy = to_json_list(series.yoy_percent())
+    observed = series.observed.tolist()
+    return FastJSONResponse({
+        "years": series.years.tolist(),
+        "series": [
+            {
+                "indicator_type": type_name,
+                "island": island_name,
+                "monthly": monthly[t][i],
+                "annual": annual[t][i],
+                "yoy_percent": yoy[t][i],
+                "observed": observed[t][i],
+            }
+            for t, type_name, i, island_name in _series_keys(series, indicator_type, island)
+        ],
+    })
+
+
+@router.get("/series/projections")
+async def get_series_projections(
+    through_year: Optional[int] = Query(None, description="Last projected year (default: latest year + 5)"),
+    cpi: float = Query(settings.CPI_INFLATION_PERCENT, ge=-20, le=50, description="Annual CPI inflation, percent"),
+    indicator_type: Optional[str] = None,
+    island: Optional[str] = None,
+):
+    """
+    Series extended forward by compounding CPI inflation from each series' latest value.
+
+    ``projected`` marks years that are projections rather than data.
+    """
+    series = (await indicator_snapshot.get()).series
+    latest = int(series.years[-1]) if len(series.years) else date.today().year
+    through_year = through_year or latest + 5
+    if not latest <= through_year <= latest + settings.MAX_PROJECTION_YEARS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"through_year must be between {latest} and {latest + settings.MAX_PROJECTION_YEARS}",
         )
-        results.append(comparison)
-    
-    return results
+    years, values, projected = series.project(through_year, cpi)
+    monthly = to_json_list(values)
+    projected = projected.tolist()
+    return FastJSONResponse({
+        "years": years.tolist(),
+        "cpi_percent": cpi,
+        "series": [
+            {
+                "indicator_type": type_name,
+                "island": island_name,
+                "monthly": monthly[t][i],
+                "projected": projected[t][i],
+            }
+            for t, type_name, i, island_name in _series_keys(series, indicator_type, island)
+        ],
+    })
+
+
+@router.get("/series/comparison")
+async def get_series_comparison(indicator_type: str = "middle_class", base_island: str = "new_providence"):
+    """
+    Cross-island comparison by year.
+
+    For each island: its monthly amount for ``indicator_type``, the percent
+    difference from ``base_island``, and the middle vs working class gap.
+    """
+    series = (await indicator_snapshot.get()).series
+    if series.type_index(indicator_type) is None:
+        raise HTTPException(status_code=404, detail=f"Indicator type '{indicator_type}' not found")
+    if series.island_index(base_island) is None:
+        raise HTTPException(status_code=404, detail=f"Island '{base_island}' not found")
+
+    monthly = to_json_list(series.values[series.type_index(indicator_type)])
+    difference = to_json_list(series.island_difference_percent(indicator_type, base_island))
+    gap = series.class_gap_percent()
+    gap = to_json_list(gap) if gap is not None else [None] * len(series.islands)
+    return FastJSONResponse({
+        "years": series.years.tolist(),
+        "indicator_type": indicator_type,
+        "base_island": base_island,
+        "islands": [
+            {
+                "island": island_name,
+                "monthly": monthly[i],
+                "difference_percent": difference[i],
+                "class_gap_percent": gap[i],
+            }
+            for i, island_name in enumerate(series.islands)
+        ],
+    })
@@ -1,134 +1,225 @@
 """Data export API endpoints."""
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
-from typing import Optional
-import json
-import io
+import importlib.util
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.compression import ENCODINGS, negotiate
+from app.core.config import settings
+from app.core.responses import FastJSONResponse
+from app.db.database import get_db
+from app.db.export_snapshots import SNAPSHOT_DIR, ExportSnapshots
+from app.db.exports import (
+    COLUMNAR_COMPRESSION,
+    EXPORT_DATASETS,
+    EXPORT_FORMATS,
+    arrow_schema,
+    encode_export,
+    parse_fiscal_years,
+    table_batches,
+)
 
 router = APIRouter()
 
+# Cache-Control for snapshot URLs pinned to a version (?v=...) vs. unpinned ones
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+EXPORT_CACHE_CONTROL = "public, max-age=300, must-revalidate"
+
+export_snapshots = ExportSnapshots(SNAPSHOT_DIR, check_interval=settings.DOCUMENT_INDEX_CHECK_SECONDS)
+
+# Served when the backing table is still empty (before the first ingest) or,
+# for budget_summary, has no table of its own. Every fallback covers one fiscal year.
+FALLBACK_DATASETS = {
+    "budget_summary": {
+        "data": [
+            {
+                "fiscal_year": "2024/25",
+                "total_revenue": 2850000000,
+                "total_expenditure": 3200000000,
+                "deficit_surplus": -350000000,
+                "national_debt": 11500000000,
+                "debt_to_gdp_ratio": 82.5,
+            }
+        ],
+        "source": "Budget Communication 2024-25.pdf",
+        "fiscal_year": "2024/25",
+    },
+    "ministries": {
+        "data": [
+            {"name": "Ministry of Education", "allocation": 450000000, "change_yoy": 7.1},
+            {"name": "Ministry of Health", "allocation": 380000000, "change_yoy": 8.6},
+            {"name": "Ministry of National Security", "allocation": 320000000, "change_yoy": 3.2},
+            {"name": "Ministry of Works & Infrastructure", "allocation": 280000000, "change_yoy": 12.0},
+            {"name": "Ministry of Finance", "allocation": 250000000, "change_yoy": 2.0},
+            {"name": "Ministry of Tourism", "allocation": 180000000, "change_yoy": 9.1},
+            {"name": "Ministry of Social Services", "allocation": 150000000, "change_yoy": 7.1},
+            {"name": "Ministry of Agriculture", "allocation": 85000000, "change_yoy": 6.3},
+            {"name": "Ministry of Environment", "allocation": 65000000, "change_yoy": 12.1},
+            {"name": "Office of the Prime Minister", "allocation": 120000000, "change_yoy": 4.3},
+        ],
+        "source": "Budget Book 2024-25.pdf",
+        "fiscal_year": "2024/25",
+    },
+    "revenue": {
+        "data": [
+            {"source": "Value Added Tax (VAT)", "amount": 1100000000, "percent_of_total": 38.6},
+            {"source": "Customs & Import Duties", "amount": 650000000, "percent_of_total": 22.8},
+            {"source": "Tourism Taxes & Fees", "amount": 420000000, "percent_of_total": 14.7},
+            {"source": "Business License Fees", "amount": 280000000, "percent_of_total": 9.8},
+            {"source": "Property Tax", "amount": 150000000, "percent_of_total": 5.3},
+            {"source": "Stamp Tax", "amount": 120000000, "percent_of_total": 4.2},
+            {"source": "Other Revenue", "amount": 130000000, "percent_of_total": 4.6},
+        ],
+        "source": "Budget Book 2024-25.pdf",
+        "fiscal_year": "2024/25",
+    },
+    "debt": {
+        "data": [
+            {
+                "fiscal_year": "2024/25",
+                "total_debt": 11500000000,
+                "domestic_debt": 6200000000,
+                "external_debt": 5300000000,
+                "debt_to_gdp_ratio": 82.5,
+                "annual_interest_cost": 580000000,
+            }
+        ],
+        "source": "Debt Report 2024-25.pdf",
+        "fiscal_year": "2024/25",
+    },
+}
+
+
+async def _fallback_batches(rows: list[dict]) -> AsyncIterator[list[tuple]]:
+    if rows:
+        yield [tuple(row.values()) for row in rows]
+
+
+async def _has_rows(db: AsyncSession, dataset: str) -> bool:
+    stmt = select(EXPORT_DATASETS[dataset].fiscal_year_column).limit(1)
+    return (await db.execute(stmt)).first() is not None
+
+
+def _snapshot_response(
+    dataset: str,
+    format: str,
+    entry: dict,
+    v: Optional[str],
+    accept_encoding: Optional[str],
+    if_none_match: Optional[str],
+) -> Response:
+    """Serve a prebuilt artifact, picking the best pre-compressed variant that is on disk."""
+    variants = [
+        e for e in ENCODINGS
+        if e in entry["encodings"] and (SNAPSHOT_DIR / entry["encodings"][e]["file"]).exists()
+    ]
+    encoding = negotiate(accept_encoding, variants)
+    etag = f'"{entry["hash"]}-{encoding}"' if encoding else f'"{entry["hash"]}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if v and v == export_snapshots.version else EXPORT_CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+        "Content-Disposition": f"attachment; filename={dataset}.{format}",
+        "X-Export-Version": export_snapshots.version or "",
+    }
+    if if_none_match:
+        # The compression middleware maps "<hash>-<encoding>" back to "<hash>"
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in tags or f'"{entry["hash"]}"' in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        path = SNAPSHOT_DIR / entry["encodings"][encoding]["file"]
+    else:
+        path = SNAPSHOT_DIR / entry["file"]
+    return FileResponse(path, media_type=EXPORT_FORMATS[format], headers=headers)
+
 
 @router.get("/{dataset}")
 async def export_dataset(
     dataset: str,
-    format: str = "json",
-    fiscal_year: Optional[str] = None,
+    format: str = Query("json", description="json, csv, ndjson, parquet or arrow"),
+    fiscal_year: Optional[str] = Query(None, description="Fiscal year, or a comma-separated list of years"),
+    compression: Optional[str] = Query(None, description="Parquet: zstd, snappy, gzip, none. Arrow: zstd, lz4, none"),
+    v: Optional[str] = Query(None, description="Snapshot version for immutable caching"),
+    accept_encoding: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
 ):
     """
-    Export a dataset in JSON or CSV format.
+    Export a dataset as JSON, CSV, NDJSON, Parquet or Arrow IPC.
     
-    Available datasets:
-    - budget_summary
-    - ministries
-    - revenue
-    - debt
-    - historical
-    """
-    # TODO: Fetch real data from database
-    
-    datasets = {
-        "budget_summary": {
-            "data": [
-                {
-                    "fiscal_year": "2024/25",
-                    "total_revenue": 2850000000,
-                    "total_expenditure": 3200000000,
-                    "deficit_surplus": -350000000,
-                    "national_debt": 11500000000,
-                    "debt_to_gdp_ratio": 82.5,
-                }
-            ],
-            "source": "Budget Communication 2024-25.pdf",
-        },
-        "ministries": {
-            "data": [
-                {"name": "Ministry of Education", "allocation": 450000000, "change_yoy": 7.1},
-                {"name": "Ministry of Health", "allocation": 380000000, "change_yoy": 8.6},
-                {"name": "Ministry of National Security", "allocation": 320000000, "change_yoy": 3.2},
-                {"name": "Ministry of Works & Infrastructure", "allocation": 280000000, "change_yoy": 12.0},
-                {"name": "Ministry of Finance", "allocation": 250000000, "change_yoy": 2.0},
-                {"name": "Ministry of Tourism", "allocation": 180000000, "change_yoy": 9.1},
-                {"name": "Ministry of Social Services", "allocation": 150000000, "change_yoy": 7.1},
-                {"name": "Ministry of Agriculture", "allocation": 85000000, "change_yoy": 6.3},
-                {"name": "Ministry of Environment", "allocation": 65000000, "change_yoy": 12.1},
-                {"name": "Office of the Prime Minister", "allocation": 120000000, "change_yoy": 4.3},
-            ],
-            "source": "Budget Book 2024-25.pdf",
-        },
-        "revenue": {
-            "data": [
-                {"source": "Value Added Tax (VAT)", "amount": 1100000000, "percent_of_total": 38.6},
-                {"source": "Customs & Import Duties", "amount": 650000000, "percent_of_total": 22.8},
-                {"source": "Tourism Taxes & Fees", "amount": 420000000, "percent_of_total": 14.7},
-                {"source": "Business License Fees", "amount": 280000000, "percent_of_total": 9.8},
-                {"source": "Property Tax", "amount": 150000000, "percent_of_total": 5.3},
-                {"source": "Stamp Tax", "amount": 120000000, "percent_of_total": 4.2},
-                {"source": "Other Revenue", "amount": 130000000, "percent_of_total": 4.6},
-            ],
-            "source": "Budget Book 2024-25.pdf",
-        },
-        "debt": {
-            "data": [
-                {
-                    "fiscal_year": "2024/25",
-                    "total_debt": 11500000000,
-                    "domestic_debt": 6200000000,
-                    "external_debt": 5300000000,
-                    "debt_to_gdp_ratio": 82.5,
-                    "annual_interest_cost": 580000000,
-                }
-            ],
-            "source": "Debt Report 2024-25.pdf",
-        },
-    }
+    Rows are read through a server-side cursor and encoded as they arrive,
+    so large exports start immediately and use constant memory. Parquet
+    and Arrow keep column types and are compressed (zstd by default).
     
-    if dataset not in datasets:
+    Combinations built by the export snapshot job (after each ingest) are
+    served as pre-compressed static files with ETags instead.
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Format must be one of {list(EXPORT_FORMATS)}")
+    if format in COLUMNAR_COMPRESSION:
+        if compression and compression not in COLUMNAR_COMPRESSION[format]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Compression for {format} must be one of {list(COLUMNAR_COMPRESSION[format])}",
+            )
+        if importlib.util.find_spec("pyarrow") is None:
+            raise HTTPException(status_code=501, detail=f"{format} export requires pyarrow")
+    available = list(EXPORT_DATASETS) + [d for d in FALLBACK_DATASETS if d not in EXPORT_DATASETS]
+    if dataset not in available:
         raise HTTPException(
             status_code=404,
-            detail=f"Dataset '{dataset}' not found. Available: {list(datasets.keys())}",
+            detail=f"Dataset '{dataset}' not found. Available: {available}",
         )
+    if fiscal_year is not None:
+        # Must fail here: once streaming starts the 200 status has been sent
+        try:
+            parse_fiscal_years(fiscal_year)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
     
-    data = datasets[dataset]
-    
-    if format == "json":
-        return {
-            "dataset": dataset,
-            "fiscal_year": fiscal_year or "2024/25",
-            "source": data["source"],
-            "data": data["data"],
-            "download_note": "Data from Bahamas Open Data - https://bahamasopendata.com",
-        }
+    if compression in (None, COLUMNAR_COMPRESSION.get(format, (None,))[0]):
+        entry = export_snapshots.lookup(dataset, format, fiscal_year)
+        if entry and (SNAPSHOT_DIR / entry["file"]).exists():
+            return _snapshot_response(dataset, format, entry, v, accept_encoding, if_none_match)
     
-    elif format == "csv":
-        # Generate CSV
-        import csv
-        output = io.StringIO()
-        if data["data"]:
-            writer = csv.DictWriter(output, fieldnames=data["data"][0].keys())
-            writer.writeheader()
-            writer.writerows(data["data"])
-        
-        output.seek(0)
-        return StreamingResponse(
-            io.BytesIO(output.getvalue().encode()),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={dataset}.csv"},
+    if dataset in EXPORT_DATASETS and (dataset not in FALLBACK_DATASETS or await _has_rows(db, dataset)):
+        table = EXPORT_DATASETS[dataset]
+        schema = arrow_schema(table) if format in COLUMNAR_COMPRESSION else None
+        body = encode_export(
+            format, dataset, table.columns, table_batches(table, fiscal_year),
+            fiscal_year=fiscal_year, schema=schema, compression=compression,
         )
-    
     else:
-        raise HTTPException(status_code=400, detail="Format must be 'json' or 'csv'")
+        fallback = FALLBACK_DATASETS[dataset]
+        # Like a filtered table: no rows unless the fallback's year was asked for
+        selected = fiscal_year is None or fallback["fiscal_year"] in parse_fiscal_years(fiscal_year)
+        body = encode_export(
+            format, dataset, list(fallback["data"][0].keys()),
+            _fallback_batches(fallback["data"] if selected else []),
+            fiscal_year=fiscal_year or fallback["fiscal_year"], source=fallback["source"], compression=compression,
+        )
+    
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f"attachment; filename={dataset}.{format}"},
+    )
 
 
 @router.get("")
 async def list_datasets():
     """List all available datasets for export."""
-    return {
+    return FastJSONResponse({
         "datasets": [
             {"name": "budget_summary", "description": "Overall budget summary with revenue, expenditure, and debt"},
-            {"name": "ministries", "description": "All ministry allocations with YoY change"},
-            {"name": "revenue", "description": "Revenue breakdown by source"},
-            {"name": "debt", "description": "National debt breakdown"},
+        ] + [
+            {"name": d.name, "description": d.description} for d in EXPORT_DATASETS.values()
         ],
-        "formats": ["json", "csv"],
-    }
-
+        "formats": list(EXPORT_FORMATS),
+        "snapshot_version": export_snapshots.version,
+    })
@@ -1,91 +1,151 @@
 """Hot Topics / featured reports API. Serves extracted report data (highlights, key_stats, chart_data)."""
+import hashlib
 import json
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import Response
+
+from app.core.config import settings
+from app.core.responses import dumps
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# Resolve paths relative to this module so they work from any cwd (e.g. deployment)
+# Resolve the static fallback relative to this module so it works from any cwd (e.g. deployment)
 _API_DIR = Path(__file__).resolve().parent
-_BACKEND_ROOT = _API_DIR.parent.parent
-_REPO_ROOT = _BACKEND_ROOT.parent
-_PROCESSED_DIR = _REPO_ROOT / "data" / "processed"
 _STATIC_REPORTS = _API_DIR / "static" / "reports"
+_REPORT_PATTERN = "*_report.json"
+SUMMARY_LENGTH = 300
+REPORT_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+
+def _report_summary(slug: str, data: dict[str, Any]) -> dict[str, Any]:
+    """Card fields shown in the reports list."""
+    summary = data.get("overview") or (data.get("highlights") or [None])[0] or ""
+    return {
+        "slug": slug,
+        "title": data.get("title", ""),
+        "source": data.get("source", ""),
+        "year": data.get("year", ""),
+        "summary": summary[:SUMMARY_LENGTH] + ("..." if len(summary) > SUMMARY_LENGTH else ""),
+        "stat_count": len(data.get("key_stats") or []),
+        "chart_count": len(data.get("charts") or []),
+        "highlight_count": len(data.get("highlights") or []),
+    }
+
+
+class _LoadedReport:
+    __slots__ = ("path", "mtime", "size", "slug", "body", "etag", "summary")
 
+    def __init__(self, path: Path, mtime: float, size: int):
+        raw = path.read_bytes()
+        data = json.loads(raw)
+        self.path, self.mtime, self.size = path, mtime, size
+        self.slug = data.get("slug", path.stem.replace("_report", ""))
+        # Serve the file's bytes as-is; the ETag is their hash
+        self.body = raw
+        self.etag = f'"{hashlib.sha256(raw).hexdigest()[:32]}"'
+        self.summary = _report_summary(self.slug, data)
 
-def _load_report(path: Path) -> dict[str, Any]:
-    with open(path) as f:
-        return json.load(f)
 
+class ReportIndex:
+    """
+    Slug -> report index over the processed and static report directories.
 
-def _all_report_paths() -> list[Path]:
-    """Collect *_report.json from processed dir and static dir (static as fallback)."""
-    paths: list[Path] = []
-    if _PROCESSED_DIR.exists():
-        paths.extend(_PROCESSED_DIR.glob("*_report.json"))
-    if _STATIC_REPORTS.exists():
-        paths.extend(_STATIC_REPORTS.glob("*_report.json"))
-    return paths
+    Directories are re-scanned at most every ``check_interval`` seconds and
+    only files whose mtime or size changed are re-parsed. Earlier
+    directories win on slug collisions (processed over static stubs).
+    """
+
+    def __init__(self, directories: list[Path], check_interval: float):
+        self.directories = directories
+        self.check_interval = check_interval
+        self._files: dict[Path, _LoadedReport] = {}
+        self._by_slug: dict[str, _LoadedReport] = {}
+        self._list_body = b"[]"
+        self._list_etag = '""'
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+
+        with self._lock:
+            files: dict[Path, _LoadedReport] = {}
+            changed = False
+            for directory in self.directories:
+                if not directory.exists():
+                    continue
+                for path in sorted(directory.glob(_REPORT_PATTERN)):
+                    try:
+                        stat = path.stat()
+                        loaded = self._files.get(path)
+                        if loaded is None or (loaded.mtime, loaded.size) != (stat.st_mtime, stat.st_size):
+                            loaded = _LoadedReport(path, stat.st_mtime, stat.st_size)
+                            changed = True
+                        files[path] = loaded
+                    except Exception as e:
+                        logger.warning("hot-topics: skip report %s: %s", path, e)
+            if not changed and files.keys() == self._files.keys():
+                return
+
+            by_slug: dict[str, _LoadedReport] = {}
+            for loaded in files.values():
+                by_slug.setdefault(loaded.slug, loaded)
+            summaries = sorted(
+                (r.summary for r in by_slug.values()),
+                key=lambda r: (r.get("year") or "", r.get("title") or ""),
+                reverse=True,
+            )
+            list_body = dumps(summaries)
+            self._files, self._by_slug = files, by_slug
+            self._list_body = list_body
+            self._list_etag = f'"{hashlib.sha256(list_body).hexdigest()[:32]}"'
+            logger.debug("hot-topics: indexed %d reports from %d files", len(by_slug), len(files))
+
+    def listing(self) -> tuple[bytes, str]:
+        self.refresh()
+        return self._list_body, self._list_etag
+
+    def get(self, slug: str) -> Optional[_LoadedReport]:
+        self.refresh()
+        return self._by_slug.get(slug)
+
+
+report_index = ReportIndex(
+    [settings.DATA_DIR / "processed", _STATIC_REPORTS],
+    check_interval=settings.DOCUMENT_INDEX_CHECK_SECONDS,
+)
+
+
+def _json_response(body: bytes, etag: str, if_none_match: Optional[str]) -> Response:
+    headers = {"ETag": etag, "Cache-Control": REPORT_CACHE_CONTROL}
+    if if_none_match:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/reports")
-async def list_reports() -> list[dict[str, Any]]:
+async def list_reports(if_none_match: Optional[str] = Header(None)):
     """List available hot topic reports (slug, title, source, year for cards)."""
-    seen: set[str] = set()
-    reports: list[dict[str, Any]] = []
-    try:
-        paths = _all_report_paths()
-        logger.debug("hot-topics: found %d report paths (processed=%s, static=%s)", len(paths), _PROCESSED_DIR, _STATIC_REPORTS)
-        for path in paths:
-            try:
-                data = _load_report(path)
-                slug = data.get("slug", path.stem.replace("_report", ""))
-                if slug in seen:
-                    continue
-                seen.add(slug)
-                summary = data.get("overview") or (data.get("highlights") or [None])[0] or ""
-                reports.append({
-                    "slug": slug,
-                    "title": data.get("title", ""),
-                    "source": data.get("source", ""),
-                    "year": data.get("year", ""),
-                    "summary": summary[:300] + ("..." if len(summary) > 300 else ""),
-                    "stat_count": len(data.get("key_stats") or []),
-                    "chart_count": len(data.get("charts") or []),
-                    "highlight_count": len(data.get("highlights") or []),
-                })
-            except Exception as e:
-                logger.warning("hot-topics: skip report %s: %s", path, e)
-                continue
-        reports.sort(key=lambda r: (r.get("year") or "", r.get("title") or ""), reverse=True)
-        return reports
-    except Exception as e:
-        logger.exception("hot-topics: list_reports failed: %s", e)
-        raise HTTPException(status_code=500, detail="Failed to load reports list")
+    body, etag = report_index.listing()
+    return _json_response(body, etag, if_none_match)
 
 
 @router.get("/reports/{slug}")
-async def get_report(slug: str) -> dict[str, Any]:
+async def get_report(slug: str, if_none_match: Optional[str] = Header(None)):
     """Get full report by slug (highlights, key_stats, chart_data, pdf_filename)."""
-    # Prefer processed (extracted) over static stub
-    if _PROCESSED_DIR.exists():
-        for path in _PROCESSED_DIR.glob("*_report.json"):
-            try:
-                data = _load_report(path)
-                if data.get("slug") == slug:
-                    return data
-            except Exception:
-                continue
-    if _STATIC_REPORTS.exists():
-        for path in _STATIC_REPORTS.glob("*_report.json"):
-            try:
-                data = _load_report(path)
-                if data.get("slug") == slug:
-                    return data
-            except Exception:
-                continue
-    raise HTTPException(status_code=404, detail="Report not found")
+    report = report_index.get(slug)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Report not found")
+    return _json_response(report.body, report.etag, if_none_match)
@@ -1,18 +1,28 @@
 """Polls API endpoints."""
+import asyncio
+import json
+import logging
+import time
 from datetime import date
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Header, Request
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import select, func
+from sqlalchemy import exists, func, insert, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_db
-from app.db.models import Poll, PollOption, PollVote
+from app.core.broadcast import RESYNC, CountBroadcaster
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, get_db
+from app.db.models import Poll, PollOption, PollOptionCount, PollVote
+from app.db.notify import POLL_CHANNEL, POLL_VOTES_CHANNEL, change_listener, notify
 
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 class PollOptionCreate(BaseModel):
@@ -75,6 +85,265 @@ class VoteRequest(BaseModel):
     fingerprint: Optional[str] = None
 
 
+class ActivePollCache:
+    """
+    Process-local cache of the active poll's results.
+
+    Entries expire after ``ttl`` seconds. Votes on this worker write the fresh
+    result through; poll create/update/delete invalidate it here and, via
+    Postgres NOTIFY, on every other worker.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._result: Optional[PollResult] = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self, payload: str = "") -> None:
+        self._generation += 1
+        self._expires_at = 0.0
+
+    def update(self, result: PollResult) -> None:
+        """Replace the cached result if it is for the same (still fresh) poll."""
+        if self._result is not None and self._result.id == result.id and time.monotonic() < self._expires_at:
+            self._result = result
+
+    def peek(self, poll_id: int) -> Optional[PollResult]:
+        """Return the cached result for ``poll_id`` if fresh, without loading."""
+        if self._result is not None and self._result.id == poll_id and time.monotonic() < self._expires_at:
+            return self._result
+        return None
+
+    async def get(self, load) -> Optional[PollResult]:
+        if time.monotonic() < self._expires_at:
+            return self._result
+        async with self._lock:
+            # Another request may have refreshed it while we waited
+            if time.monotonic() < self._expires_at:
+                return self._result
+            generation = self._generation
+            result = await load()
+            self._result = result
+            # Don't keep a value that was invalidated while it was loading
+            if generation == self._generation:
+                self._expires_at = time.monotonic() + self.ttl
+            return result
+
+
+active_poll_cache = ActivePollCache(ttl=settings.ACTIVE_POLL_CACHE_SECONDS)
+change_listener.subscribe(POLL_CHANNEL, active_poll_cache.invalidate)
+change_listener.subscribe(POLL_CHANNEL, lambda payload: _poll_option_ids.clear())
+
+# Buffered votes: poll_id -> (expires_at, option ids or None if the poll does not exist)
+OPTION_MAP_TTL_SECONDS = 30
+_poll_option_ids: dict[int, tuple[float, Optional[frozenset[int]]]] = {}
+
+
+async def _get_poll_option_ids(db: AsyncSession, poll_id: int) -> Optional[frozenset[int]]:
+    """Option ids for a poll from the cached option map (None if no such poll)."""
+    cached = _poll_option_ids.get(poll_id)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+    poll_exists = await db.scalar(select(exists().where(Poll.id == poll_id)))
+    option_ids = None
+    if poll_exists:
+        result = await db.execute(select(PollOption.id).where(PollOption.poll_id == poll_id))
+        option_ids = frozenset(result.scalars().all())
+    _poll_option_ids[poll_id] = (time.monotonic() + OPTION_MAP_TTL_SECONDS, option_ids)
+    return option_ids
+
+
+class VoteBuffer:
+    """
+    In-process buffer of accepted votes, flushed with multi-row inserts.
+
+    Each flush inserts the batch with INSERT ... ON CONFLICT DO NOTHING (the
+    uq_poll_vote_fingerprint index still rejects repeat voters), bumps the
+    option counters by the rows actually inserted and publishes the deltas,
+    one transaction per chunk of ``batch_size`` votes (keeping each INSERT
+    under the drivers' bind-parameter limits). Votes for options deleted
+    since they were queued are dropped; chunks whose write fails are
+    re-queued and retried with backoff.
+    """
+
+    MAX_RETRY_SECONDS = 30.0
+
+    def __init__(self, interval: float, batch_size: int):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._votes: dict[tuple[int, str], int] = {}  # (poll_id, fingerprint) -> option_id
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self._failures = 0
+
+    def add(self, poll_id: int, option_id: int, fingerprint: str) -> bool:
+        """Queue a vote. Returns False if this fingerprint already has one queued."""
+        key = (poll_id, fingerprint)
+        if key in self._votes:
+            return False
+        self._votes[key] = option_id
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        # A full batch flushes early, unless the last flush failed (keep backing off)
+        if len(self._votes) >= self.batch_size and not self._failures:
+            self._wakeup.set()
+        return True
+
+    async def _run(self) -> None:
+        while self._votes and not self._closing:
+            delay = min(self.interval * 2 ** self._failures, self.MAX_RETRY_SECONDS)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as exc:
+                logger.error(
+                    "Vote buffer flush failed (%d votes queued, attempt %d): %s",
+                    len(self._votes), self._failures, exc,
+                )
+
+    async def flush(self) -> int:
+        """Insert every queued vote. Returns the number of new (non-duplicate) votes."""
+        if not self._votes:
+            return 0
+        batch, self._votes = list(self._votes.items()), {}
+        inserted = 0
+        failed: dict[tuple[int, str], int] = {}
+        error: Optional[Exception] = None
+        for start in range(0, len(batch), self.batch_size):
+            chunk = dict(batch[start:start + self.batch_size])
+            try:
+                inserted += await self._insert(chunk)
+            except Exception as exc:
+                failed.update(chunk)
+                error = exc
+        if error is not None:
+            self._failures += 1
+            # Re-queue ahead of votes added meanwhile (first accepted vote per voter wins)
+            for key, option_id in self._votes.items():
+                failed.setdefault(key, option_id)
+            self._votes = failed
+            raise error
+        self._failures = 0
+        return inserted
+
+    async def _insert(self, batch: dict[tuple[int, str], int]) -> int:
+        async with AsyncSessionLocal() as db:
+            # Options (or whole polls) may have been deleted since the votes were accepted
+            result = await db.execute(
+                select(PollOption.id, PollOption.poll_id)
+                .where(PollOption.id.in_(set(batch.values())))
+            )
+            option_polls = dict(result.all())
+            rows = [
+                {"poll_id": poll_id, "option_id": option_id, "fingerprint": fingerprint}
+                for (poll_id, fingerprint), option_id in batch.items()
+                if option_polls.get(option_id) == poll_id
+            ]
+            if len(rows) < len(batch):
+                logger.warning("Vote buffer dropped %d votes for deleted options", len(batch) - len(rows))
+            if not rows:
+                return 0
+
+            dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+            result = await db.execute(
+                dialect.insert(PollVote)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["poll_id", "fingerprint"])
+                .returning(PollVote.poll_id, PollVote.option_id)
+            )
+            deltas: dict[tuple[int, int], int] = {}
+            for poll_id, option_id in result.all():
+                deltas[(poll_id, option_id)] = deltas.get((poll_id, option_id), 0) + 1
+
+            if deltas:
+                await _add_vote_counts(db, deltas)
+                await _publish_votes(db, deltas)
+            await db.commit()
+
+        duplicates = len(rows) - sum(deltas.values())
+        if duplicates:
+            logger.debug("Vote buffer dropped %d duplicate votes", duplicates)
+        return sum(deltas.values())
+
+    async def close(self) -> None:
+        """Flush remaining votes (call on shutdown); stops retrying after this attempt."""
+        self._closing = True
+        if self._task is not None and not self._task.done():
+            self._wakeup.set()
+            await self._task
+        await self.flush()
+
+
+vote_buffer = VoteBuffer(
+    interval=settings.POLL_VOTE_FLUSH_SECONDS,
+    batch_size=settings.POLL_VOTE_BATCH_SIZE,
+)
+
+
+def _with_vote(result: PollResult, option_id: int) -> PollResult:
+    """Optimistic copy of a result with one more vote for ``option_id``."""
+    options = [
+        opt.model_copy(update={"votes": opt.votes + 1}) if opt.id == option_id else opt
+        for opt in result.options
+    ]
+    return result.model_copy(update={"options": options, "total_votes": result.total_votes + 1})
+
+
+# Seconds between keep-alive comments on idle result streams
+STREAM_HEARTBEAT_SECONDS = 15
+
+poll_broadcaster = CountBroadcaster(interval=settings.POLL_STREAM_INTERVAL_SECONDS)
+
+
+def _record_vote_notification(payload: str) -> None:
+    """Feed vote deltas committed on any worker into the local broadcaster."""
+    for part in payload.split(","):
+        poll_id, option_id, count = (int(v) for v in part.split(":"))
+        poll_broadcaster.record(poll_id, option_id, count)
+
+
+change_listener.subscribe(POLL_VOTES_CHANNEL, _record_vote_notification)
+
+
+async def _resync_after_reconnect() -> None:
+    """Poll changes and votes announced while the listener was down were missed."""
+    active_poll_cache.invalidate()
+    _poll_option_ids.clear()
+    poll_broadcaster.resync_all()
+
+
+change_listener.on_reconnect(_resync_after_reconnect)
+
+
+async def _publish_votes(db: AsyncSession, deltas: dict[tuple[int, int], int]) -> None:
+    """
+    Announce committed votes to result streams.
+
+    On Postgres the NOTIFY rides the vote transaction and reaches every
+    listening worker. If this worker's own listener is down, deltas are also
+    recorded locally. Call before commit.
+    """
+    payload = ",".join(f"{p}:{o}:{n}" for (p, o), n in deltas.items())
+    await notify(db, POLL_VOTES_CHANNEL, payload)
+    if not change_listener.active:
+        for (poll_id, option_id), count in deltas.items():
+            poll_broadcaster.record(poll_id, option_id, count)
+
+
+async def _poll_changed(db: AsyncSession, poll_id: int) -> None:
+    """Invalidate active poll caches on this and other workers (on commit)."""
+    active_poll_cache.invalidate()
+    _poll_option_ids.clear()
+    await notify(db, POLL_CHANNEL, str(poll_id))
+
+
 def _aggregate_poll_result(
     poll: Poll,
     option_rows: List[PollOption],
@@ -107,23 +376,95 @@ def _aggregate_poll_result(
     )
 
 
+async def _load_polls_with_results(
+    polls: List[Poll],
+    db: AsyncSession,
+) -> List[PollResult]:
+    """Load options and vote counts for many polls in two queries total."""
+    if not polls:
+        return []
+    poll_ids = [poll.id for poll in polls]
+
+    options_result = await db.execute(
+        select(PollOption).where(PollOption.poll_id.in_(poll_ids))
+    )
+    options_by_poll: dict[int, List[PollOption]] = {}
+    for opt in options_result.scalars().all():
+        options_by_poll.setdefault(opt.poll_id, []).append(opt)
+
+    # Denormalized counters: O(options) regardless of vote volume
+    counts_result = await db.execute(
+        select(PollOptionCount.poll_id, PollOptionCount.option_id, PollOptionCount.votes)
+        .where(PollOptionCount.poll_id.in_(poll_ids))
+    )
+    counts_by_poll: dict[int, dict[int, int]] = {}
+    for poll_id, option_id, count in counts_result.all():
+        counts_by_poll.setdefault(poll_id, {})[option_id] = count
+
+    return [
+        _aggregate_poll_result(
+            poll,
+            options_by_poll.get(poll.id, []),
+            counts_by_poll.get(poll.id, {}),
+        )
+        for poll in polls
+    ]
+
+
 async def _load_poll_with_results(
     poll: Poll,
     db: AsyncSession,
 ) -> PollResult:
-    options_result = await db.execute(
-        select(PollOption).where(PollOption.poll_id == poll.id)
+    return (await _load_polls_with_results([poll], db))[0]
+
+
+async def _add_vote_counts(db: AsyncSession, deltas: dict[tuple[int, int], int]) -> None:
+    """
+    Add ``{(poll_id, option_id): votes}`` to the option counters in the caller's transaction.
+
+    A single upsert, so concurrent first votes for an option (no counter row
+    yet) both land instead of one failing on the primary key.
+    """
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(PollOptionCount).values([
+        {"poll_id": poll_id, "option_id": option_id, "votes": votes}
+        for (poll_id, option_id), votes in deltas.items()
+    ])
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["option_id"],
+            set_={"votes": PollOptionCount.votes + stmt.excluded.votes, "updated_at": func.now()},
+        )
     )
-    option_rows = list(options_result.scalars().all())
 
-    votes_result = await db.execute(
-        select(PollVote.option_id, func.count(PollVote.id))
-        .where(PollVote.poll_id == poll.id)
-        .group_by(PollVote.option_id)
+
+async def reconcile_vote_counts(db: AsyncSession) -> int:
+    """
+    Bring poll_option_counts back in line with poll_votes.
+
+    Creates counter rows for options that lack one and rewrites any counter
+    that differs from the real vote count. Returns the number of corrected rows.
+    """
+    missing = select(PollOption.id, PollOption.poll_id, literal(0)).where(
+        ~exists().where(PollOptionCount.option_id == PollOption.id)
+    )
+    created = await db.execute(
+        insert(PollOptionCount).from_select(["option_id", "poll_id", "votes"], missing)
     )
-    vote_counts = {row[0]: row[1] for row in votes_result.all()}
 
-    return _aggregate_poll_result(poll, option_rows, vote_counts)
+    actual = (
+        select(func.count(PollVote.id))
+        .where(PollVote.option_id == PollOptionCount.option_id)
+        .scalar_subquery()
+    )
+    corrected = await db.execute(
+        update(PollOptionCount)
+        .where(PollOptionCount.votes != actual)
+        .values(votes=actual)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return max(created.rowcount, 0) + max(corrected.rowcount, 0)
 
 
 def _require_admin(api_key: Optional[str], expected: Optional[str]) -> None:
@@ -136,35 +477,45 @@ def _require_admin(api_key: Optional[str], expected: Optional[str]) -> None:
 
 
 @router.get("", response_model=List[PollResult])
-async def list_polls(db: AsyncSession = Depends(get_db)) -> List[PollResult]:
+async def list_polls(
+    status: Optional[str] = Query(None, description='Filter by status: "draft", "active" or "closed"'),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+) -> List[PollResult]:
     """
-    List all polls with aggregated results, newest first.
-    Includes both active and recently closed polls.
+    List polls with aggregated results, newest first.
+    Includes both active and recently closed polls unless filtered by status.
+    Results for the whole page are loaded in a fixed number of queries.
     """
-    result = await db.execute(
-        select(Poll).order_by(Poll.created_at.desc())
-    )
-    polls = result.scalars().all()
+    query = select(Poll).order_by(Poll.created_at.desc(), Poll.id.desc())
+    if status:
+        query = query.where(Poll.status == status)
+    result = await db.execute(query.limit(limit).offset(offset))
+    polls = list(result.scalars().all())
 
-    output: List[PollResult] = []
-    for poll in polls:
-        output.append(await _load_poll_with_results(poll, db))
-    return output
+    return await _load_polls_with_results(polls, db)
 
 
 @router.get("/active", response_model=Optional[PollResult])
 async def get_active_poll(db: AsyncSession = Depends(get_db)) -> Optional[PollResult]:
-    """Get the currently active poll, if any."""
-    result = await db.execute(
-        select(Poll)
-            .where(Poll.status == "active")
-            .order_by(Poll.start_date.desc().nullslast(), Poll.created_at.desc())
-            .limit(1)
-    )
-    poll = result.scalars().first()
-    if not poll:
-        return None
-    return await _load_poll_with_results(poll, db)
+    """
+    Get the currently active poll, if any.
+    Served from the process-local cache; the DB is only read on a miss.
+    """
+    async def load() -> Optional[PollResult]:
+        result = await db.execute(
+            select(Poll)
+                .where(Poll.status == "active")
+                .order_by(Poll.start_date.desc().nullslast(), Poll.created_at.desc())
+                .limit(1)
+        )
+        poll = result.scalars().first()
+        if not poll:
+            return None
+        return await _load_poll_with_results(poll, db)
+
+    return await active_poll_cache.get(load)
 
 
 @router.get("/{poll_id}", response_model=PollResult)
@@ -177,6 +528,60 @@ async def get_poll(poll_id: int, db: AsyncSession = Depends(get_db)) -> PollResu
     return await _load_poll_with_results(poll, db)
 
 
+def _sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@router.get("/{poll_id}/stream")
+async def stream_poll_results(
+    poll_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Stream a poll's results as Server-Sent Events.
+
+    Sends a "snapshot" event with the full PollResult, then "delta" events
+    with vote counts per option id, coalesced every POLL_STREAM_INTERVAL_SECONDS.
+    """
+    result = await db.execute(select(Poll).where(Poll.id == poll_id))
+    poll = result.scalars().first()
+    if not poll:
+        raise HTTPException(status_code=404, detail="Poll not found")
+    snapshot = await _load_poll_with_results(poll, db)
+
+    async def events():
+        queue = poll_broadcaster.subscribe(poll_id)
+        try:
+            yield _sse("snapshot", snapshot.model_dump_json())
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is RESYNC:
+                    # Client fell behind; resend full results from a fresh session.
+                    # Deltas already queued are covered by the new snapshot.
+                    while not queue.empty():
+                        queue.get_nowait()
+                    async with AsyncSessionLocal() as session:
+                        fresh = await session.get(Poll, poll_id)
+                        if fresh is None:
+                            break
+                        yield _sse("snapshot", (await _load_poll_with_results(fresh, session)).model_dump_json())
+                    continue
+                yield _sse("delta", json.dumps(event))
+        finally:
+            poll_broadcaster.unsubscribe(poll_id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("", response_model=PollResult)
 async def create_poll(
     payload: PollCreate,
@@ -208,9 +613,11 @@ async def create_poll(
             poll_id=poll.id,
             option_text=opt.option_text,
             display_order=opt.display_order,
+            vote_count=PollOptionCount(poll_id=poll.id, votes=0),
         )
         db.add(option)
 
+    await _poll_changed(db, poll.id)
     await db.commit()
     await db.refresh(poll)
 
@@ -237,6 +644,7 @@ async def update_poll(
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(poll, field, value)
 
+    await _poll_changed(db, poll.id)
     await db.commit()
     await db.refresh(poll)
     return await _load_poll_with_results(poll, db)
@@ -259,6 +667,7 @@ async def delete_poll(
         raise HTTPException(status_code=404, detail="Poll not found")
 
     await db.delete(poll)
+    await _poll_changed(db, poll_id)
     await db.commit()
 
 
@@ -274,7 +683,34 @@ async def cast_vote(
 
     Public endpoint. Basic duplicate protection using poll_id + fingerprint.
     If no fingerprint is provided, the client IP address is used.
+
+    With POLL_VOTE_BUFFERING enabled the vote is validated against the cached
+    option map and queued for a batched insert; the response then carries
+    optimistic results and repeat votes are dropped silently at flush time.
     """
+    # Use client-provided fingerprint when available, otherwise fall back to IP
+    fingerprint = payload.fingerprint or request.client.host
+
+    if settings.POLL_VOTE_BUFFERING:
+        option_ids = await _get_poll_option_ids(db, poll_id)
+        if option_ids is None:
+            raise HTTPException(status_code=404, detail="Poll not found")
+        if payload.option_id not in option_ids:
+            raise HTTPException(status_code=400, detail="Invalid option for this poll")
+        if not vote_buffer.add(poll_id, payload.option_id, fingerprint):
+            raise HTTPException(
+                status_code=400,
+                detail="You have already voted in this poll from this device.",
+            )
+        cached = active_poll_cache.peek(poll_id)
+        if cached is not None:
+            return _with_vote(cached, payload.option_id)
+        poll = await db.get(Poll, poll_id)
+        if poll is None:
+            # Deleted since the option map was cached; the queued vote is dropped at flush
+            raise HTTPException(status_code=404, detail="Poll not found")
+        return _with_vote(await _load_poll_with_results(poll, db), payload.option_id)
+
     # Load poll and option
     poll_result = await db.execute(select(Poll).where(Poll.id == poll_id))
     poll = poll_result.scalars().first()
@@ -291,9 +727,6 @@ async def cast_vote(
     if not option:
         raise HTTPException(status_code=400, detail="Invalid option for this poll")
 
-    # Use client-provided fingerprint when available, otherwise fall back to IP
-    fingerprint = payload.fingerprint or request.client.host
-
     vote = PollVote(
       poll_id=poll_id,
       option_id=payload.option_id,
@@ -302,6 +735,10 @@ async def cast_vote(
     db.add(vote)
 
     try:
+        # Vote row and counter bump commit (or roll back) together
+        await db.flush()
+        await _add_vote_counts(db, {(poll_id, payload.option_id): 1})
+        await _publish_votes(db, {(poll_id, payload.option_id): 1})
         await db.commit()
     except IntegrityError:
         await db.rollback()
@@ -312,5 +749,7 @@ async def cast_vote(
 
     await db.refresh(poll)
     # Return updated results
-    return await _load_poll_with_results(poll, db)
+    poll_result = await _load_poll_with_results(poll, db)
+    active_poll_cache.update(poll_result)
+    return poll_result
 
@@ -4,6 +4,8 @@ from pydantic import BaseModel
 from typing import Optional
 from datetime import date
 
+from app.core.responses import FastJSONResponse
+
 router = APIRouter()
 
 
@@ -85,7 +87,7 @@ async def get_revenue_breakdown(fiscal_year: Optional[str] = None):
 async def get_revenue_monthly(fiscal_year: Optional[str] = None):
     """Get monthly revenue collection data."""
     # TODO: Fetch from database
-    return {
+    return FastJSONResponse({
         "fiscal_year": "2024/25",
         "monthly_data": [
             {"month": "Jul", "vat": 85_000_000, "customs": 52_000_000, "tourism": 35_000_000, "other": 48_000_000},
@@ -96,14 +98,14 @@ async def get_revenue_monthly(fiscal_year: Optional[str] = None):
             {"month": "Dec", "vat": 105_000_000, "customs": 62_000_000, "tourism": 55_000_000, "other": 58_000_000},
         ],
         "source_document": "Revenue Report Q2 2024-25.pdf",
-    }
+    })
 
 
 @router.get("/historical")
 async def get_revenue_historical(years: int = 5):
     """Get historical revenue trends."""
     # TODO: Fetch from database
-    return {
+    return FastJSONResponse({
         "years": [
             {
                 "year": "2020/21",
@@ -141,5 +143,5 @@ async def get_revenue_historical(years: int = 5):
                 "tourism": 420_000_000,
             },
         ]
-    }
+    })
 
@@ -0,0 +1,90 @@
+"""Bounded-rate fan-out of coalesced count deltas to streaming subscribers."""
+import asyncio
+import logging
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+# Queued events per subscriber before it is considered too slow and resynced
+SUBSCRIBER_QUEUE_SIZE = 16
+
+# Sent instead of deltas to a subscriber that fell behind; it should reload a snapshot
+RESYNC = {"type": "resync"}
+
+
+class CountBroadcaster:
+    """
+    Coalesces per-key count deltas and pushes them to subscribers every ``interval``.
+
+    Votes only cost a dict update; a single loop per worker does the fan-out,
+    so thousands of viewers of one poll share one batch per interval.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._pending: dict[int, Counter] = {}
+        self._subscribers: dict[int, set[asyncio.Queue]] = {}
+        self._task: asyncio.Task | None = None
+
+    def record(self, key: int, item_id: int, count: int = 1) -> None:
+        """Add a delta for ``item_id`` under ``key`` (ignored when nobody is watching)."""
+        if key in self._subscribers:
+            self._pending.setdefault(key, Counter())[item_id] += count
+
+    def subscribe(self, key: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(key, set()).add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, key: int, queue: asyncio.Queue) -> None:
+        subscribers = self._subscribers.get(key)
+        if subscribers is None:
+            return
+        subscribers.discard(queue)
+        if not subscribers:
+            del self._subscribers[key]
+            self._pending.pop(key, None)
+
+    def resync_all(self) -> None:
+        """Ask every subscriber to reload a snapshot (e.g. after deltas may have been missed)."""
+        self._pending.clear()
+        for subscribers in self._subscribers.values():
+            for queue in subscribers:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC)
+
+    def subscriber_count(self, key: int) -> int:
+        return len(self._subscribers.get(key, ()))
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            await asyncio.sleep(self.interval)
+            try:
+                self.flush()
+            except Exception as exc:
+                logger.warning("Broadcast flush failed: %s", exc)
+
+    def flush(self) -> None:
+        """Push every pending batch to its subscribers."""
+        pending, self._pending = self._pending, {}
+        for key, deltas in pending.items():
+            event = {
+                "type": "delta",
+                "deltas": {str(item_id): n for item_id, n in deltas.items()},
+                "total_delta": sum(deltas.values()),
+            }
+            for queue in self._subscribers.get(key, ()):
+                _offer(queue, event)
+
+
+def _offer(queue: asyncio.Queue, event: dict) -> None:
+    try:
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        # Slow client: drop what it has not read and ask it to resync
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(RESYNC)
@@ -0,0 +1,254 @@
+"""
+Content-encoding helpers and response compression middleware.
+
+gzip is always available; zstd and brotli are used when the zstandard and
+brotli packages are installed.
+"""
+import gzip
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+# Preferred first when a client accepts several
+ENCODINGS = tuple(
+    name for name, available in (("zstd", zstandard), ("br", brotli), ("gzip", True)) if available
+)
+FILE_SUFFIXES = {"gzip": ".gz", "zstd": ".zst", "br": ".br"}
+# Levels for on-the-fly compression (cheap enough to run per response)
+DEFAULT_LEVELS = {"gzip": 6, "zstd": 3, "br": 4}
+
+# Content types that are already compressed or must not be buffered
+SKIP_CONTENT_TYPES = (
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+    "application/vnd.apache.parquet",
+    "application/vnd.apache.arrow",
+    "image/",
+    "audio/",
+    "video/",
+    "text/event-stream",
+)
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    level = level or DEFAULT_LEVELS[encoding]
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if encoding == "zstd" and zstandard:
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    if encoding == "br" and brotli:
+        return brotli.compress(data, quality=level)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+class StreamCompressor:
+    """Incremental compressor; each chunk is flushed so streamed bodies stay live."""
+
+    def __init__(self, encoding: str, level: Optional[int] = None):
+        level = level or DEFAULT_LEVELS[encoding]
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+        elif encoding == "zstd" and zstandard:
+            self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+        elif encoding == "br" and brotli:
+            self._obj = brotli.Compressor(quality=level)
+        else:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == "gzip":
+            return self._obj.compress(chunk) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+        if self.encoding == "zstd":
+            return self._obj.compress(chunk) + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return self._obj.process(chunk) + self._obj.flush()
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._obj.finish()
+        return self._obj.flush()
+
+
+def negotiate(accept_encoding: Optional[str], available=ENCODINGS) -> Optional[str]:
+    """Pick the preferred encoding the client accepts (q=0 excluded), or None for identity."""
+    if not accept_encoding:
+        return None
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = params.strip().removeprefix("q=") if params.strip().startswith("q=") else "1"
+        try:
+            if float(q) > 0:
+                accepted.add(name.strip().lower())
+        except ValueError:
+            continue
+    for encoding in available:
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return None
+
+
+class CompressedVariantCache:
+    """Byte-bounded LRU of compressed bodies keyed by (strong ETag, encoding)."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: tuple[str, str], body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+
+def _variant_etag(etag: str, encoding: str) -> str:
+    """'"abc"' -> '"abc-gzip"' so each representation has its own strong ETag."""
+    if etag.endswith(f'-{encoding}"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with the best encoding the client accepts.
+
+    Bodies smaller than ``minimum_size``, partial/304 responses, responses
+    that already carry a Content-Encoding and SKIP_CONTENT_TYPES pass
+    through untouched. Streamed bodies are compressed chunk by chunk.
+    Single-message bodies with a strong ETag are compressed once per
+    encoding and served from ``variant_cache`` afterwards. Compressed
+    responses get a per-encoding ETag; If-None-Match is mapped back so
+    endpoints still see their own tags.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, cache_max_bytes: int = 32 * 1024 * 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.variant_cache = CompressedVariantCache(cache_max_bytes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope["headers"])
+        encoding = negotiate(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Clients revalidate with the compressed variant's ETag; endpoints know the plain one
+        revalidating_variant = False
+        if_none_match = headers.get(b"if-none-match")
+        if if_none_match:
+            suffix = f'-{encoding}"'.encode()
+            tags = [tag.strip() for tag in if_none_match.split(b",")]
+            revalidating_variant = any(tag.endswith(suffix) for tag in tags)
+            stripped = b", ".join(tag[: -len(suffix)] + b'"' if tag.endswith(suffix) else tag for tag in tags)
+            scope = dict(scope, headers=[
+                (k, stripped if k == b"if-none-match" else v) for k, v in scope["headers"]
+            ])
+
+        start_message = None
+        compressor: Optional[StreamCompressor] = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                response_headers = {k.lower(): v for k, v in start_message["headers"]}
+                content_type = response_headers.get(b"content-type", b"").decode("latin-1")
+                if start_message["status"] == 304 and revalidating_variant:
+                    start_message = {**start_message, "headers": [
+                        (k, _variant_etag(v.decode("latin-1"), encoding).encode() if k.lower() == b"etag" else v)
+                        for k, v in start_message["headers"]
+                    ]}
+                if (
+                    start_message["status"] in (204, 206, 304)
+                    or b"content-encoding" in response_headers
+                    or b"content-range" in response_headers
+                    or content_type.startswith(SKIP_CONTENT_TYPES)
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                etag = response_headers.get(b"etag", b"").decode("latin-1")
+                new_headers = [
+                    (k, v) for k, v in start_message["headers"]
+                    if k.lower() not in (b"content-length", b"etag")
+                ]
+                new_headers.append((b"content-encoding", encoding.encode()))
+                if etag.startswith('"'):
+                    new_headers.append((b"etag", _variant_etag(etag, encoding).encode()))
+                elif etag:
+                    new_headers.append((b"etag", etag.encode()))
+                vary = response_headers.get(b"vary")
+                if vary is None:
+                    new_headers.append((b"vary", b"Accept-Encoding"))
+                elif b"accept-encoding" not in vary.lower():
+                    new_headers = [(k, v) for k, v in new_headers if k.lower() != b"vary"]
+                    new_headers.append((b"vary", vary + b", Accept-Encoding"))
+
+                if not more_body:
+                    # Whole body in one message: reuse a cached variant when the ETag is strong
+                    key = (etag, encoding) if etag.startswith('"') else None
+                    compressed = self.variant_cache.get(key) if key else None
+                    if compressed is None:
+                        compressed = compress(body, encoding)
+                        if key:
+                            self.variant_cache.put(key, compressed)
+                    new_headers.append((b"content-length", str(len(compressed)).encode()))
+                    await send({**start_message, "headers": new_headers})
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+
+                compressor = StreamCompressor(encoding)
+                await send({**start_message, "headers": new_headers})
+
+            chunk = compressor.compress(body) if body else b""
+            if not more_body:
+                chunk += compressor.finish()
+            if chunk or not more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
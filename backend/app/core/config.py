@@ -8,6 +8,12 @@ class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     # Polls
     POLLS_ADMIN_API_KEY: str | None = None  # used to protect /polls admin endpoints
+    POLL_COUNTS_RECONCILE_SECONDS: int = 600  # how often poll_option_counts is checked against poll_votes
+    ACTIVE_POLL_CACHE_SECONDS: float = 2.0  # max staleness of the cached active poll across workers
+    POLL_STREAM_INTERVAL_SECONDS: float = 0.5  # how often coalesced vote deltas are pushed to stream clients
+    POLL_VOTE_BUFFERING: bool = False  # queue votes in-process and insert them in batches
+    POLL_VOTE_FLUSH_SECONDS: float = 0.2  # max time a buffered vote waits before insert
+    POLL_VOTE_BATCH_SIZE: int = 1000  # flush early once this many votes are buffered
     # App
     APP_NAME: str = "Bahamas Open Data API"
     DEBUG: bool = False
@@ -16,6 +22,28 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "postgresql://localhost:5432/nationalpulse"
     
+    # Data directory (raw/ PDFs, processed/ extraction output)
+    DATA_DIR: Path = Path(__file__).resolve().parent.parent.parent.parent / "data"
+    DOCUMENT_INDEX_CHECK_SECONDS: float = 2.0  # how often raw/ and processed/ reports are re-checked
+    PAGE_CACHE_MAX_BYTES: int = 500 * 1024 * 1024  # disk budget for sliced pages / thumbnails (DATA_DIR/page_cache)
+    PAGE_CACHE_PREWARM_PAGES: int = 200  # most-cited pages rendered at startup
+    CITATION_SAVE_SECONDS: float = 300.0  # how often each worker merges its citation counts to disk
+    
+    # Response compression (gzip, plus zstd/brotli when installed)
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # bytes; smaller bodies are sent as-is
+    COMPRESSION_CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # compressed variants of ETagged responses
+    
+    # Read-only endpoint cache, invalidated when ingestion bumps the data version
+    RESPONSE_CACHE_MAX_AGE: int = 60  # seconds browsers/CDNs may reuse a response
+    RESPONSE_CACHE_STALE_SECONDS: int = 600  # stale-while-revalidate window
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # total cached response bodies per worker
+    RESPONSE_CACHE_MAX_BODY_BYTES: int = 1024 * 1024  # larger responses are not cached
+    DATA_VERSION_CHECK_SECONDS: float = 5.0  # DB re-check interval when LISTEN/NOTIFY is unavailable
+    
+    # Economic indicator series
+    CPI_INFLATION_PERCENT: float = 2.0  # assumed annual CPI inflation for projections (overridable per request)
+    MAX_PROJECTION_YEARS: int = 25  # how far past the latest year /economic/series/projections may extend
+    
     # Pinecone
     PINECONE_API_KEY: str = ""
     PINECONE_INDEX_NAME: str = "national-pulse"
@@ -0,0 +1,126 @@
+"""
+Vectorized time series over economic indicators.
+
+Monthly amounts are held in one dense ``(indicator type, island, year)``
+array so year-over-year change, CPI projections and cross-island
+comparisons are computed for every series at once.
+"""
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+def _fill_gaps(values: np.ndarray) -> np.ndarray:
+    """
+    Linearly interpolate missing years inside each series (last axis).
+
+    Years before the first or after the last observation stay NaN.
+    """
+    observed = ~np.isnan(values)
+    n = values.shape[-1]
+    index = np.broadcast_to(np.arange(n), values.shape)
+    previous = np.maximum.accumulate(np.where(observed, index, -1), axis=-1)
+    following = np.minimum.accumulate(np.where(observed, index, n)[..., ::-1], axis=-1)[..., ::-1]
+    inside = (previous >= 0) & (following < n)
+
+    left = np.take_along_axis(values, np.clip(previous, 0, n - 1), axis=-1)
+    right = np.take_along_axis(values, np.clip(following, 0, n - 1), axis=-1)
+    span = following - previous
+    weight = np.divide(index - previous, span, out=np.zeros(values.shape), where=span > 0)
+    return np.where(observed, values, np.where(inside, left + (right - left) * weight, np.nan))
+
+
+def _percent_change(new: np.ndarray, old: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = (new - old) / old * 100
+    return np.where(np.isfinite(change), change, np.nan)
+
+
+class IndicatorSeries:
+    """
+    Monthly amounts for every (indicator type, island) over a common year range.
+
+    ``observed`` marks values that came from a row; other values inside a
+    series' observed range are interpolated.
+    """
+
+    def __init__(self, types: list[str], islands: list[str], years: np.ndarray, observed_values: np.ndarray):
+        self.types = types
+        self.islands = islands
+        self.years = years
+        self.observed = ~np.isnan(observed_values)
+        self.values = _fill_gaps(observed_values)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[str, str, int, float]]) -> "IndicatorSeries":
+        """Build from (indicator_type, island, year, month_amount) rows; the last row for a key wins."""
+        rows = list(rows)
+        if not rows:
+            return cls([], [], np.array([], dtype=int), np.empty((0, 0, 0)))
+        row_types, row_islands, row_years, amounts = zip(*rows)
+        types, type_index = np.unique(row_types, return_inverse=True)
+        islands, island_index = np.unique(row_islands, return_inverse=True)
+        row_years = np.asarray(row_years, dtype=int)
+        years = np.arange(row_years.min(), row_years.max() + 1)
+
+        values = np.full((len(types), len(islands), len(years)), np.nan)
+        values[type_index, island_index, row_years - years[0]] = amounts
+        return cls(types.tolist(), islands.tolist(), years, values)
+
+    def __len__(self) -> int:
+        return len(self.types) * len(self.islands)
+
+    def type_index(self, indicator_type: str) -> Optional[int]:
+        return self.types.index(indicator_type) if indicator_type in self.types else None
+
+    def island_index(self, island: str) -> Optional[int]:
+        return self.islands.index(island) if island in self.islands else None
+
+    def yoy_percent(self) -> np.ndarray:
+        """Percent change from the previous year; NaN for the first year and around gaps."""
+        change = np.full(self.values.shape, np.nan)
+        change[..., 1:] = _percent_change(self.values[..., 1:], self.values[..., :-1])
+        return change
+
+    def project(self, through_year: int, cpi_percent: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Extend every series to ``through_year`` by compounding CPI inflation.
+
+        Each series grows at ``cpi_percent`` a year from its own latest
+        observation. Returns (years, values, projected mask).
+        """
+        years = np.arange(self.years[0], max(through_year, self.years[-1]) + 1) if len(self.years) else self.years
+        values = np.full(self.values.shape[:-1] + (len(years),), np.nan)
+        values[..., : len(self.years)] = self.values
+        if not len(years):
+            return years, values, np.zeros(values.shape, dtype=bool)
+
+        has_data = self.observed.any(axis=-1)
+        last = len(self.years) - 1 - np.argmax(self.observed[..., ::-1], axis=-1)
+        last_value = np.take_along_axis(self.values, last[..., None], axis=-1)
+        elapsed = years - years[0] - last[..., None]
+        projected = (elapsed > 0) & has_data[..., None]
+        growth = (1 + cpi_percent / 100) ** np.maximum(elapsed, 0)
+        return years, np.where(projected, last_value * growth, values), projected
+
+    def class_gap_percent(self, upper: str = "middle_class", lower: str = "working_class") -> Optional[np.ndarray]:
+        """(island, year) percent by which ``upper`` exceeds ``lower``, or None if a type is missing."""
+        upper_index, lower_index = self.type_index(upper), self.type_index(lower)
+        if upper_index is None or lower_index is None:
+            return None
+        return _percent_change(self.values[upper_index], self.values[lower_index])
+
+    def island_difference_percent(self, indicator_type: str, base_island: str) -> Optional[np.ndarray]:
+        """(island, year) percent difference of each island from ``base_island``."""
+        type_index, base_index = self.type_index(indicator_type), self.island_index(base_island)
+        if type_index is None or base_index is None:
+            return None
+        values = self.values[type_index]
+        return _percent_change(values, values[base_index])
+
+
+def to_json_list(values: np.ndarray, decimals: int = 2) -> list:
+    """Round and convert to nested lists with NaN as None."""
+    rounded = np.round(values, decimals).astype(object)
+    rounded[np.isnan(values)] = None
+    return rounded.tolist()
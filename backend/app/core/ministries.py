@@ -0,0 +1,57 @@
+"""Reference data for government ministries and departments (budget heads)."""
+
+# Ministry code (as produced by ingestion/parser.py) -> (API id, display name, sector)
+MINISTRY_REGISTRY = {
+    "MOH": ("health", "Ministry of Health & Wellness", "Health"),
+    "DPH": ("public-health", "Department of Public Health", "Health"),
+    "DEHS": ("environmental-health", "Department of Environmental Health Services", "Health"),
+    "MOF": ("finance", "Ministry of Finance", "Finance"),
+    "DIR": ("inland-revenue", "Department of Inland Revenue", "Finance"),
+    "CUS": ("customs", "Customs Department", "Finance"),
+    "TRE": ("treasury", "Treasury Department", "Finance"),
+    "DEBT": ("public-debt", "Public Debt Servicing", "Finance"),
+    "MOE": ("education", "Ministry of Education & Technical Training", "Education"),
+    "MNS": ("national-security", "Ministry of National Security", "Security"),
+    "RBPF": ("police", "Royal Bahamas Police Force", "Security"),
+    "RBDF": ("defence", "Royal Bahamas Defence Force", "Security"),
+    "BDCS": ("correctional-services", "Bahamas Department of Correctional Services", "Security"),
+    "DOI": ("immigration", "Department of Immigration", "Security"),
+    "MOT": ("tourism", "Ministry of Tourism, Investments & Aviation", "Tourism"),
+    "MDRM": ("disaster", "Ministry of Disaster Risk Management", "Emergency"),
+    "MFA": ("foreign-affairs", "Ministry of Foreign Affairs", "Government"),
+    "MSS": ("social-services", "Department of Social Services", "Social Services"),
+    "MOW": ("works", "Ministry of Works & Family Island Affairs", "Infrastructure"),
+    "MOET": ("energy-transport", "Ministry of Energy & Transport", "Infrastructure"),
+    "MOHUR": ("housing", "Ministry of Housing & Urban Renewal", "Infrastructure"),
+    "MOA": ("agriculture", "Ministry of Agriculture & Marine Resources", "Agriculture"),
+    "MOENV": ("environment", "Ministry of Environment & Natural Resources", "Environment"),
+    "MYSC": ("youth-sports-culture", "Ministry of Youth, Sports & Culture", "Social Services"),
+    "MOL": ("labour", "Ministry of Labour", "Government"),
+    "MEA": ("economic-affairs", "Ministry of Economic Affairs", "Finance"),
+    "MGB": ("grand-bahama", "Ministry of Grand Bahama", "Government"),
+    "MPS": ("public-service", "Ministry of the Public Service", "Government"),
+    "DLG": ("local-government", "Department of Local Government", "Government"),
+    "AG": ("attorney-general", "Office of the Attorney General & Ministry of Legal Affairs", "Justice"),
+    "JUD": ("judiciary", "The Judiciary", "Justice"),
+    "RGD": ("registrar-general", "Registrar General's Department", "Justice"),
+    "PRD": ("parliamentary-registration", "Parliamentary Registration Department", "Government"),
+    "AUD": ("auditor-general", "Office of the Auditor General", "Government"),
+    "CAB": ("cabinet-office", "Cabinet Office", "Government"),
+    "GG": ("governor-general", "Governor General & Staff", "Government"),
+    "SEN": ("senate", "The Senate", "Government"),
+    "HOA": ("house-of-assembly", "House of Assembly", "Government"),
+    "PMO": ("prime-minister", "Office of the Prime Minister", "Government"),
+}
+
+
+def ministry_info(code: str) -> tuple[str, str, str]:
+    """Return (API id, name, sector) for a ministry code, falling back to the code."""
+    return MINISTRY_REGISTRY.get(code, (code.lower(), code, "Other"))
+
+
+_CODES_BY_SLUG = {slug: code for code, (slug, _, _) in MINISTRY_REGISTRY.items()}
+
+
+def ministry_code(code_or_slug: str) -> str:
+    """Resolve a ministry API id ("health") or code ("moh") to its code ("MOH")."""
+    return _CODES_BY_SLUG.get(code_or_slug.lower(), code_or_slug.upper())
@@ -0,0 +1,196 @@
+"""Single-page PDF slices and PNG thumbnails with a bounded disk cache."""
+import fcntl
+import io
+import json
+import logging
+import os
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import quote
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Most pages a single slice request may contain
+MAX_SLICE_PAGES = 10
+# PNG render scale (1.0 = 72 dpi)
+THUMBNAIL_SCALE = 1.5
+# Evict down to this fraction of the byte budget so we don't evict on every write
+EVICT_TARGET_RATIO = 0.9
+
+
+def page_url(document: str, page: int) -> str:
+    """API URL serving just the cited page of a document."""
+    return f"{settings.API_V1_PREFIX}/documents/{quote(document)}/pages/{page}"
+
+
+class PageOutOfRange(ValueError):
+    """Requested page is outside the document."""
+
+
+def slice_pdf(path: Path, first: int, last: int) -> bytes:
+    """Copy pages first..last (1-based, inclusive) into a new small PDF."""
+    import pypdfium2 as pdfium
+
+    src = pdfium.PdfDocument(str(path))
+    try:
+        if first < 1 or last > len(src):
+            raise PageOutOfRange(f"Document has {len(src)} pages")
+        dst = pdfium.PdfDocument.new()
+        try:
+            dst.import_pages(src, list(range(first - 1, last)))
+            buffer = io.BytesIO()
+            dst.save(buffer)
+            return buffer.getvalue()
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+
+def render_page_png(path: Path, page: int, scale: float = THUMBNAIL_SCALE) -> bytes:
+    """Render one page (1-based) to PNG."""
+    import pypdfium2 as pdfium
+
+    src = pdfium.PdfDocument(str(path))
+    try:
+        if page < 1 or page > len(src):
+            raise PageOutOfRange(f"Document has {len(src)} pages")
+        image = src[page - 1].render(scale=scale).to_pil()
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue()
+    finally:
+        src.close()
+
+
+class PageCache:
+    """
+    Size-bounded disk cache of rendered page artifacts.
+
+    Keys embed the source file hash, so a replaced PDF never serves stale
+    pages. Hits refresh the file mtime and eviction removes the least
+    recently used files once ``max_bytes`` is exceeded.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(file_hash: str, first: int, last: int, fmt: str) -> str:
+        pages = str(first) if first == last else f"{first}-{last}"
+        return f"{file_hash}_p{pages}.{fmt}"
+
+    def get(self, key: str) -> Optional[Path]:
+        path = self.directory / key
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def get_or_create(self, key: str, render: Callable[[], bytes]) -> Path:
+        """Return the cached artifact, rendering and storing it on a miss (blocking)."""
+        path = self.get(key)
+        if path is not None:
+            return path
+        data = render()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / key
+        tmp = path.with_name(f".{key}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        self._added(len(data))
+        return path
+
+    def _added(self, nbytes: int) -> None:
+        with self._lock:
+            if self._size is None:
+                self._size = sum(f.stat().st_size for f in self._artifacts())
+            else:
+                self._size += nbytes
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _artifacts(self) -> list[Path]:
+        """Cached renders (skips temp files and the citation counts)."""
+        return [f for f in self.directory.glob("*_p*.*") if f.suffix in (".pdf", ".png")]
+
+    def _evict(self) -> None:
+        files = sorted(self._artifacts(), key=lambda f: f.stat().st_mtime)
+        target = self.max_bytes * EVICT_TARGET_RATIO
+        for f in files:
+            if self._size <= target:
+                break
+            try:
+                size = f.stat().st_size
+                f.unlink()
+                self._size -= size
+            except FileNotFoundError:
+                continue
+
+
+class CitationCounter:
+    """
+    Counts how often (document, page) pairs are cited, persisted as JSON.
+
+    Every worker keeps its own counter over the same file, so save() merges:
+    under an exclusive lock it re-reads the file, adds what this worker
+    recorded since its last save and atomically replaces the file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._unsaved: Counter = Counter()
+        self.counts = self._read()
+
+    def _read(self) -> Counter:
+        try:
+            with open(self.path) as f:
+                saved = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return Counter()
+        counts: Counter = Counter()
+        for key, n in saved.items():
+            doc, page = key.rsplit("#", 1)
+            counts[(doc, int(page))] = n
+        return counts
+
+    def record(self, document: str, page: int) -> None:
+        with self._lock:
+            self.counts[(document, page)] += 1
+            self._unsaved[(document, page)] += 1
+
+    def most_common(self, n: int) -> list[tuple[str, int]]:
+        with self._lock:
+            return [pair for pair, _ in self.counts.most_common(n)]
+
+    def save(self) -> None:
+        """Merge unsaved citations into the file (blocking; call from a thread while serving)."""
+        with self._lock:
+            unsaved, self._unsaved = self._unsaved, Counter()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path.with_name(self.path.name + ".lock"), "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                counts = self._read()
+                counts.update(unsaved)
+                tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+                with open(tmp, "w") as f:
+                    json.dump({f"{doc}#{page}": n for (doc, page), n in counts.items()}, f)
+                os.replace(tmp, self.path)
+        except OSError as exc:
+            with self._lock:
+                self._unsaved.update(unsaved)
+            logger.warning("Could not save citation counts: %s", exc)
+            return
+        # Pick up other workers' citations too
+        with self._lock:
+            self.counts = counts + self._unsaved
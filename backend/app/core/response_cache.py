@@ -0,0 +1,124 @@
+"""In-memory cache of serialized GET responses, keyed by data version."""
+import hashlib
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+# Response headers recomputed from the cached entry
+_REPLACED_HEADERS = (b"content-length", b"etag", b"cache-control")
+
+
+class _CachedResponse:
+    __slots__ = ("headers", "body", "etag")
+
+    def __init__(self, headers: list[tuple[bytes, bytes]], body: bytes):
+        self.headers = [(k, v) for k, v in headers if k.lower() not in _REPLACED_HEADERS]
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'.encode()
+
+
+class ResponseCacheMiddleware:
+    """
+    Serve GETs under ``prefixes`` from memory until the data version changes.
+
+    Successful single-message responses are stored by (data version, path,
+    query string) with a strong ETag and ``Cache-Control`` allowing
+    stale-while-revalidate; If-None-Match is answered with 304. Bumping the
+    data version (on ingest) drops every entry.
+
+    The cache holds at most ``max_entries`` responses and ``max_bytes`` of
+    bodies (least recently used go first); bodies over ``max_body_bytes``
+    and paths under ``exclude`` (e.g. cursor-paginated listings, whose
+    query strings are unbounded) are passed through uncached.
+    """
+
+    def __init__(
+        self,
+        app,
+        prefixes: tuple[str, ...],
+        version: Callable[[], Awaitable[int]],
+        max_age: int = 60,
+        stale_while_revalidate: int = 600,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_body_bytes: int = 1024 * 1024,
+        exclude: tuple[str, ...] = (),
+    ):
+        self.app = app
+        self.prefixes = prefixes
+        self.version = version
+        self.cache_control = f"public, max-age={max_age}, stale-while-revalidate={stale_while_revalidate}".encode()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_body_bytes = max_body_bytes
+        self.exclude = exclude
+        self._entries: OrderedDict[tuple, _CachedResponse] = OrderedDict()
+        self._bytes = 0
+        self._version: Optional[int] = None
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.prefixes)
+            or (self.exclude and scope["path"].startswith(self.exclude))
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        version = await self.version()
+        if version != self._version:
+            self._entries.clear()
+            self._bytes = 0
+            self._version = version
+        key = (scope["path"], b"&".join(sorted(scope["query_string"].split(b"&"))))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        else:
+            messages = []
+
+            async def capture(message):
+                messages.append(message)
+
+            await self.app(scope, receive, capture)
+            start, bodies = messages[0], messages[1:]
+            cacheable = (
+                start["status"] == 200
+                and len(bodies) == 1
+                and not bodies[0].get("more_body", False)
+                and len(bodies[0].get("body", b"")) <= self.max_body_bytes
+                and not any(k.lower() == b"set-cookie" for k, _ in start["headers"])
+            )
+            if not cacheable:
+                for message in messages:
+                    await send(message)
+                return
+            entry = _CachedResponse(start["headers"], bodies[0].get("body", b""))
+            if self._version == version:
+                self._store(key, entry)
+
+        headers = entry.headers + [
+            (b"etag", entry.etag),
+            (b"cache-control", self.cache_control),
+            (b"x-data-version", str(version).encode()),
+        ]
+        if_none_match = dict(scope["headers"]).get(b"if-none-match")
+        if if_none_match:
+            tags = {t.strip().removeprefix(b"W/") for t in if_none_match.split(b",")}
+            if entry.etag in tags or b"*" in tags:
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+        headers.append((b"content-length", str(len(entry.body)).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": entry.body})
+
+    def _store(self, key: tuple, entry: _CachedResponse) -> None:
+        replaced = self._entries.pop(key, None)
+        if replaced is not None:
+            self._bytes -= len(replaced.body)
+        self._entries[key] = entry
+        self._bytes += len(entry.body)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted.body)
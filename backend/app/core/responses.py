@@ -0,0 +1,43 @@
+"""
+Fast JSON responses (orjson), used as the app-wide default response class.
+
+Convention: routes with a response_model return data and let FastAPI
+validate and render it. Routes without one return ``FastJSONResponse(...)``
+themselves, since the default path would run jsonable_encoder over the
+payload first for no benefit.
+"""
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value: Any):
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize to JSON bytes (dates, datetimes, UUIDs, numpy and models included)."""
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+
+    Returning one directly from an endpoint also skips FastAPI's
+    jsonable_encoder pass, which dominates for large dict/list payloads.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,81 @@
+"""Data version counter: bumped by ingestion, used to key response caches."""
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from app.db.database import engine
+from app.db.models import DataVersion
+from app.db.notify import DATA_CHANNEL, change_listener
+
+logger = logging.getLogger(__name__)
+
+
+async def bump_data_version(conn: AsyncConnection) -> int:
+    """Increment the data version inside the caller's transaction and notify other workers."""
+    result = await conn.execute(
+        update(DataVersion).where(DataVersion.id == 1)
+        .values(version=DataVersion.version + 1)
+        .returning(DataVersion.version)
+    )
+    version = result.scalar()
+    if version is None:
+        version = 1
+        await conn.execute(DataVersion.__table__.insert().values(id=1, version=version))
+    if conn.dialect.name == "postgresql":
+        await conn.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": DATA_CHANNEL, "payload": str(version)},
+        )
+    return version
+
+
+class DataVersionTracker:
+    """
+    Process-wide view of the data version.
+
+    Updated immediately by NOTIFY when the change listener is active (and
+    re-read after it reconnects), otherwise re-read from the database at
+    most every ``check_interval``.
+    """
+
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self._version = 0
+        self._next_check = 0.0
+        self._lock = asyncio.Lock()
+        change_listener.subscribe(DATA_CHANNEL, self._on_notify)
+        # Bumps announced while the listener was down were missed
+        change_listener.on_reconnect(self.reload)
+
+    def _on_notify(self, payload: str) -> None:
+        self._version = max(self._version, int(payload))
+
+    def peek(self) -> int:
+        return self._version
+
+    async def current(self) -> int:
+        if change_listener.active or time.monotonic() < self._next_check:
+            return self._version
+        async with self._lock:
+            if time.monotonic() >= self._next_check:
+                await self.reload()
+        return self._version
+
+    async def reload(self) -> Optional[int]:
+        """Read the version from the database (kept as-is if unavailable)."""
+        self._next_check = time.monotonic() + self.check_interval
+        try:
+            async with engine.connect() as conn:
+                version = (await conn.execute(select(DataVersion.version).where(DataVersion.id == 1))).scalar()
+            self._version = version or 0
+        except Exception as exc:
+            logger.warning("Could not read data version: %s", exc)
+        return self._version
+
+
+data_version = DataVersionTracker(settings.DATA_VERSION_CHECK_SECONDS)
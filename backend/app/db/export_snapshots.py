@@ -0,0 +1,198 @@
+"""
+Precomputed export artifacts, rebuilt after each ingest.
+
+Every dataset x format x fiscal year (plus "all years") is rendered once to
+DATA_DIR/exports under a content-hashed filename, with gzip/zstd/brotli
+variants for the text formats. manifest.json maps each combination to its
+files; /api/v1/export serves them as static files while the manifest is
+current.
+
+Usage:
+    python -m app.db.export_snapshots
+"""
+import asyncio
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import distinct, select
+
+from app.core.compression import ENCODINGS, FILE_SUFFIXES, compress
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.exports import (
+    COLUMNAR_COMPRESSION,
+    EXPORT_DATASETS,
+    EXPORT_FORMATS,
+    arrow_schema,
+    encode_export,
+    table_batches,
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = settings.DATA_DIR / "exports"
+MANIFEST_NAME = "manifest.json"
+ALL_YEARS = "all"
+# Formats that get pre-compressed variants (Parquet/Arrow compress internally)
+TEXT_FORMATS = ("json", "csv", "ndjson")
+# Offline build, so spend more CPU than on-the-fly compression would
+SNAPSHOT_LEVELS = {"gzip": 9, "zstd": 15, "br": 10}
+# Workers reload the manifest within one check interval, so files dropped
+# from it are kept at least that long (twice, for margin) before removal
+RETAIN_SECONDS = 2 * settings.DOCUMENT_INDEX_CHECK_SECONDS
+
+
+def snapshot_key(dataset: str, format: str, fiscal_year: Optional[str]) -> str:
+    return f"{dataset}/{format}/{fiscal_year or ALL_YEARS}"
+
+
+async def _write_artifact(directory: Path, dataset: str, format: str, fiscal_year: Optional[str]) -> dict:
+    """Render one export to a content-hashed file (plus compressed variants)."""
+    table = EXPORT_DATASETS[dataset]
+    schema = arrow_schema(table) if format in COLUMNAR_COMPRESSION else None
+    body = encode_export(
+        format, dataset, table.columns, table_batches(table, fiscal_year),
+        fiscal_year=fiscal_year, schema=schema,
+    )
+    sha256 = hashlib.sha256()
+    tmp = directory / f".{dataset}.{format}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        async for chunk in body:
+            sha256.update(chunk)
+            f.write(chunk)
+    digest = sha256.hexdigest()
+    year_slug = (fiscal_year or ALL_YEARS).replace("/", "-")
+    filename = f"{dataset}-{year_slug}-{digest[:16]}.{format}"
+    os.replace(tmp, directory / filename)
+
+    entry = {"file": filename, "hash": digest, "size": (directory / filename).stat().st_size, "encodings": {}}
+    if format in TEXT_FORMATS:
+        data = (directory / filename).read_bytes()
+        for encoding in ENCODINGS:
+            encoded_name = filename + FILE_SUFFIXES[encoding]
+            encoded = await asyncio.to_thread(compress, data, encoding, SNAPSHOT_LEVELS[encoding])
+            (directory / encoded_name).write_bytes(encoded)
+            entry["encodings"][encoding] = {"file": encoded_name, "size": len(encoded)}
+    return entry
+
+
+async def build_export_snapshots(directory: Path = SNAPSHOT_DIR) -> dict:
+    """
+    Render every dataset x format x fiscal year and swap in a new manifest.
+
+    Datasets whose table is empty are skipped (the API keeps serving them
+    live). Files the previous manifest referenced are kept for
+    RETAIN_SECONDS so workers still on it can serve them; older
+    unreferenced files are removed.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    formats = [
+        f for f in EXPORT_FORMATS
+        if f not in COLUMNAR_COMPRESSION or importlib.util.find_spec("pyarrow")
+    ]
+    artifacts: dict[str, dict] = {}
+    for name, table in EXPORT_DATASETS.items():
+        async with AsyncSessionLocal() as session:
+            years = (await session.execute(
+                select(distinct(table.fiscal_year_column)).order_by(table.fiscal_year_column)
+            )).scalars().all()
+        if not years:
+            continue
+        for fiscal_year in [None] + [str(y) for y in years]:
+            for format in formats:
+                artifacts[snapshot_key(name, format, fiscal_year)] = await _write_artifact(
+                    directory, name, format, fiscal_year,
+                )
+
+    version = hashlib.sha256(
+        "".join(f"{k}={v['hash']}" for k, v in sorted(artifacts.items())).encode()
+    ).hexdigest()[:16]
+    manifest = {"version": version, "built_at": datetime.now().isoformat(), "artifacts": artifacts}
+    try:
+        previous = _manifest_files(json.loads((directory / MANIFEST_NAME).read_text()))
+    except (OSError, ValueError):
+        previous = set()
+    tmp = directory / f".{MANIFEST_NAME}.{os.getpid()}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=1))
+    os.replace(tmp, directory / MANIFEST_NAME)
+
+    keep = _manifest_files(manifest) | {MANIFEST_NAME}
+    now = time.time()
+    for path in directory.iterdir():
+        if path.name in keep or path.name.startswith("."):
+            continue
+        if path.name in previous:
+            # Just retired: the mtime marks when, so the sweep below waits RETAIN_SECONDS
+            os.utime(path, (now, now))
+        elif now - path.stat().st_mtime > RETAIN_SECONDS:
+            path.unlink(missing_ok=True)
+    return manifest
+
+
+def _manifest_files(manifest: dict) -> set[str]:
+    files = set()
+    for entry in manifest.get("artifacts", {}).values():
+        files.add(entry["file"])
+        files.update(e["file"] for e in entry["encodings"].values())
+    return files
+
+
+class ExportSnapshots:
+    """Reads manifest.json, reloading it when its mtime changes (checked every ``check_interval``)."""
+
+    def __init__(self, directory: Path, check_interval: float):
+        self.directory = directory
+        self.check_interval = check_interval
+        self._manifest: dict = {}
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+        try:
+            mtime = (self.directory / MANIFEST_NAME).stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+        if not force and mtime == self._mtime:
+            return
+        with self._lock:
+            manifest = {}
+            if mtime is not None:
+                try:
+                    manifest = json.loads((self.directory / MANIFEST_NAME).read_text())
+                except (OSError, ValueError) as exc:
+                    logger.warning("Could not read export manifest: %s", exc)
+            self._manifest, self._mtime = manifest, mtime
+
+    @property
+    def version(self) -> Optional[str]:
+        self.refresh()
+        return self._manifest.get("version")
+
+    def lookup(self, dataset: str, format: str, fiscal_year: Optional[str]) -> Optional[dict]:
+        self.refresh()
+        return self._manifest.get("artifacts", {}).get(snapshot_key(dataset, format, fiscal_year))
+
+
+if __name__ == "__main__":
+    async def main():
+        print("🇧🇸 Bahamas Open Data - Export Snapshot Builder")
+        print("=" * 40)
+        started = time.perf_counter()
+        manifest = await build_export_snapshots()
+        print(f"\n✅ Built {len(manifest['artifacts'])} export artifacts in {time.perf_counter() - started:.1f}s")
+        print(f"   Snapshot version {manifest['version']} -> {SNAPSHOT_DIR}")
+
+    asyncio.run(main())
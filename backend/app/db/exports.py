@@ -0,0 +1,378 @@
+"""Dataset definitions and streaming row sources for /api/v1/export."""
+import asyncio
+import csv
+import io
+import json
+import re
+from typing import Any, AsyncIterator, Optional
+
+from sqlalchemy import Date, DateTime, Float, Integer, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.responses import dumps
+from app.db.database import AsyncSessionLocal
+from app.db.models import (
+    BudgetItem,
+    Creditor,
+    Debt,
+    Document,
+    EconomicIndicator,
+    Ministry,
+    MinistryAllocation,
+    Revenue,
+)
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 2000
+
+EXPORT_FORMATS = {
+    "json": "application/json",
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+DOWNLOAD_NOTE = "Data from Bahamas Open Data - https://bahamasopendata.com"
+DATABASE_SOURCE = "Bahamas Open Data database"
+
+# Compression codecs accepted per columnar format (first is the default)
+COLUMNAR_COMPRESSION = {
+    "parquet": ("zstd", "snappy", "gzip", "none"),
+    "arrow": ("zstd", "lz4", "none"),
+}
+
+
+class ExportDataset:
+    """An exportable table: labelled columns, ordering and fiscal-year filter column."""
+
+    def __init__(self, name: str, description: str, statement: Select, fiscal_year_column, order_by: tuple):
+        self.name = name
+        self.description = description
+        self.statement = statement
+        self.fiscal_year_column = fiscal_year_column
+        self.order_by = order_by
+        self.columns = [c.name for c in statement.selected_columns]
+
+    def query(self, fiscal_years: Optional[list] = None) -> Select:
+        stmt = self.statement
+        if fiscal_years:
+            stmt = stmt.where(self.fiscal_year_column.in_(fiscal_years))
+        return stmt.order_by(*self.order_by)
+
+
+EXPORT_DATASETS: dict[str, ExportDataset] = {
+    d.name: d for d in [
+        ExportDataset(
+            "line_items",
+            "Budget line items for all ministries",
+            select(
+                BudgetItem.fiscal_year,
+                Ministry.code.label("ministry_code"),
+                Ministry.name.label("ministry"),
+                BudgetItem.item_code,
+                BudgetItem.item_name,
+                BudgetItem.category,
+                BudgetItem.amount,
+                BudgetItem.previous_year_amount,
+                Document.filename.label("source_document"),
+                BudgetItem.source_page,
+            )
+            .outerjoin(Ministry, Ministry.id == BudgetItem.ministry_id)
+            .outerjoin(Document, Document.id == BudgetItem.source_document_id),
+            BudgetItem.fiscal_year,
+            (BudgetItem.fiscal_year, BudgetItem.id),
+        ),
+        ExportDataset(
+            "ministries",
+            "Ministry allocations by fiscal year",
+            select(
+                MinistryAllocation.fiscal_year,
+                Ministry.code.label("ministry_code"),
+                Ministry.name.label("ministry"),
+                Ministry.sector,
+                MinistryAllocation.total_allocation,
+                MinistryAllocation.recurrent_expenditure,
+                MinistryAllocation.capital_expenditure,
+                MinistryAllocation.salaries,
+                MinistryAllocation.programs,
+                MinistryAllocation.grants,
+                Document.filename.label("source_document"),
+                MinistryAllocation.source_page,
+            )
+            .join(Ministry, Ministry.id == MinistryAllocation.ministry_id)
+            .outerjoin(Document, Document.id == MinistryAllocation.source_document_id),
+            MinistryAllocation.fiscal_year,
+            (MinistryAllocation.fiscal_year, MinistryAllocation.total_allocation.desc()),
+        ),
+        ExportDataset(
+            "revenue",
+            "Revenue collection by source",
+            select(
+                Revenue.fiscal_year,
+                Revenue.period,
+                Revenue.source_name,
+                Revenue.source_category,
+                Revenue.amount,
+                Revenue.budget_estimate,
+                Document.filename.label("source_document"),
+                Revenue.source_page,
+            ).outerjoin(Document, Document.id == Revenue.source_document_id),
+            Revenue.fiscal_year,
+            (Revenue.fiscal_year, Revenue.id),
+        ),
+        ExportDataset(
+            "debt",
+            "National debt by fiscal year",
+            select(
+                Debt.fiscal_year,
+                Debt.as_of_date,
+                Debt.total_debt,
+                Debt.domestic_debt,
+                Debt.external_debt,
+                Debt.gdp,
+                Debt.debt_to_gdp_ratio,
+                Debt.annual_interest,
+                Document.filename.label("source_document"),
+                Debt.source_page,
+            ).outerjoin(Document, Document.id == Debt.source_document_id),
+            Debt.fiscal_year,
+            (Debt.fiscal_year, Debt.as_of_date),
+        ),
+        ExportDataset(
+            "creditors",
+            "Debt by creditor",
+            select(
+                Creditor.fiscal_year,
+                Creditor.name,
+                Creditor.category,
+                Creditor.amount_owed,
+                Creditor.interest_rate,
+                Creditor.maturity_date,
+                Document.filename.label("source_document"),
+            ).outerjoin(Document, Document.id == Creditor.source_document_id),
+            Creditor.fiscal_year,
+            (Creditor.fiscal_year, Creditor.amount_owed.desc()),
+        ),
+        ExportDataset(
+            "economic_indicators",
+            "Cost of living indicators by island and year",
+            select(
+                EconomicIndicator.year,
+                EconomicIndicator.indicator_type,
+                EconomicIndicator.island,
+                EconomicIndicator.month_amount,
+                EconomicIndicator.annual_amount,
+                EconomicIndicator.breakdown,
+                EconomicIndicator.source_document,
+                EconomicIndicator.author,
+                EconomicIndicator.published_date,
+            ),
+            EconomicIndicator.year,
+            (EconomicIndicator.indicator_type, EconomicIndicator.island, EconomicIndicator.year),
+        ),
+    ]
+}
+
+
+# "2024/25" or a calendar year "2024"
+_FISCAL_YEAR = re.compile(r"\d{4}(/\d{2})?")
+
+
+def parse_fiscal_years(fiscal_year: str) -> list[str]:
+    """
+    Split a comma-separated fiscal_year filter ("2023/24,2024/25").
+
+    Raises ValueError for malformed years; validate before streaming starts.
+    """
+    years = [y.strip() for y in fiscal_year.split(",") if y.strip()]
+    invalid = [y for y in years if not _FISCAL_YEAR.fullmatch(y)]
+    if invalid or not years:
+        raise ValueError(f"Invalid fiscal_year {', '.join(invalid) or repr(fiscal_year)}: expected e.g. 2024/25 or 2024")
+    return years
+
+
+def fiscal_year_values(dataset: ExportDataset, fiscal_year: str) -> list:
+    """parse_fiscal_years, cast to the column's type (economic indicators use int years)."""
+    years = parse_fiscal_years(fiscal_year)
+    if dataset.fiscal_year_column.type.python_type is int:
+        return [int(y[:4]) for y in years]
+    return years
+
+
+async def stream_rows(
+    db: AsyncSession, dataset: ExportDataset, fiscal_year: Optional[str] = None,
+) -> AsyncIterator[list[tuple]]:
+    """Yield batches of rows from a server-side cursor."""
+    stmt = dataset.query(fiscal_year_values(dataset, fiscal_year) if fiscal_year else None)
+    result = await db.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    async for partition in result.partitions():
+        yield partition
+
+
+async def table_batches(dataset: ExportDataset, fiscal_year: Optional[str] = None) -> AsyncIterator[list[tuple]]:
+    """stream_rows on a dedicated session (request sessions close before the body is streamed)."""
+    async with AsyncSessionLocal() as session:
+        async for batch in stream_rows(session, dataset, fiscal_year):
+            yield batch
+
+
+def _csv_value(value: Any):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+async def iter_csv(columns: list[str], batches: AsyncIterator[list[tuple]]) -> AsyncIterator[bytes]:
+    """Encode row batches as CSV, one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue().encode()
+    async for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_value(v) for v in row] for row in rows)
+        yield buffer.getvalue().encode()
+
+
+async def iter_ndjson(columns: list[str], batches: AsyncIterator[list[tuple]]) -> AsyncIterator[bytes]:
+    """Encode row batches as newline-delimited JSON objects."""
+    async for rows in batches:
+        yield b"".join(dumps(dict(zip(columns, row))) + b"\n" for row in rows)
+
+
+async def iter_json(
+    columns: list[str], batches: AsyncIterator[list[tuple]], envelope: dict[str, Any],
+) -> AsyncIterator[bytes]:
+    """Encode row batches as {...envelope, "data": [...]} without buffering the array."""
+    yield dumps(envelope)[:-1] + b',"data":['
+    first = True
+    async for rows in batches:
+        chunk = b",".join(dumps(dict(zip(columns, row))) for row in rows)
+        if chunk:
+            yield chunk if first else b"," + chunk
+            first = False
+    yield b"]}"
+
+
+def arrow_schema(dataset: ExportDataset):
+    """Arrow schema matching the dataset's column types (JSON columns become strings)."""
+    import pyarrow as pa
+
+    def arrow_type(sa_type):
+        if isinstance(sa_type, Integer):
+            return pa.int64()
+        if isinstance(sa_type, Float):
+            return pa.float64()
+        if isinstance(sa_type, DateTime):
+            return pa.timestamp("us")
+        if isinstance(sa_type, Date):
+            return pa.date32()
+        return pa.string()
+
+    return pa.schema([(c.name, arrow_type(c.type)) for c in dataset.statement.selected_columns])
+
+
+def _record_batch(schema, columns: list[str], rows: list[tuple]):
+    import pyarrow as pa
+
+    if schema is None:
+        return pa.RecordBatch.from_pylist([dict(zip(columns, row)) for row in rows])
+    arrays = []
+    for field, values in zip(schema, zip(*rows)):
+        if pa.types.is_string(field.type):
+            values = [v if v is None or isinstance(v, str) else json.dumps(v) for v in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class _ChunkSink:
+    """Write-only file object collecting output so it can be yielded as it is produced."""
+
+    closed = False
+
+    def __init__(self):
+        self.chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+async def iter_columnar(
+    format: str,
+    columns: list[str],
+    batches: AsyncIterator[list[tuple]],
+    schema=None,
+    compression: Optional[str] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Encode row batches as Parquet (one row group per batch) or an Arrow IPC stream.
+
+    Pass ``schema`` (see arrow_schema) for typed output; otherwise it is
+    inferred from the first batch. Encoding runs in a worker thread.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    compression = compression or COLUMNAR_COMPRESSION[format][0]
+    codec = None if compression == "none" else compression
+    sink = _ChunkSink()
+    writer = None
+
+    def open_writer(batch_schema):
+        if format == "parquet":
+            return pq.ParquetWriter(sink, batch_schema, compression=codec or "none")
+        return pa.ipc.new_stream(sink, batch_schema, options=pa.ipc.IpcWriteOptions(compression=codec))
+
+    def write(rows):
+        nonlocal writer
+        batch = _record_batch(schema, columns, rows)
+        if writer is None:
+            writer = open_writer(batch.schema)
+        writer.write_batch(batch)
+        return sink.drain()
+
+    async for rows in batches:
+        if rows:
+            yield await asyncio.to_thread(write, rows)
+    if writer is None:
+        writer = open_writer(schema if schema is not None else pa.schema([(c, pa.string()) for c in columns]))
+    writer.close()
+    yield sink.drain()
+
+
+def encode_export(
+    format: str,
+    dataset: str,
+    columns: list[str],
+    batches: AsyncIterator[list[tuple]],
+    fiscal_year: Optional[str] = None,
+    source: str = DATABASE_SOURCE,
+    schema=None,
+    compression: Optional[str] = None,
+) -> AsyncIterator[bytes]:
+    """Byte stream of an export in the requested format."""
+    if format in COLUMNAR_COMPRESSION:
+        return iter_columnar(format, columns, batches, schema=schema, compression=compression)
+    if format == "csv":
+        return iter_csv(columns, batches)
+    if format == "ndjson":
+        return iter_ndjson(columns, batches)
+    return iter_json(columns, batches, {
+        "dataset": dataset,
+        "fiscal_year": fiscal_year,
+        "source": source,
+        "download_note": DOWNLOAD_NOTE,
+    })
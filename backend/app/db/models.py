@@ -106,6 +106,37 @@ class MinistryAllocation(Base):
     __table_args__ = (
         Index("idx_allocations_year", "fiscal_year"),
         Index("idx_allocations_ministry", "ministry_id"),
+        Index("uq_allocations_ministry_year", "ministry_id", "fiscal_year", unique=True),
+    )
+
+
+class MinistrySummary(Base):
+    """Precomputed per-ministry dashboard aggregates (latest year, YoY, sparkline), refreshed on ingest."""
+    __tablename__ = "ministry_summaries"
+    
+    id = Column(Integer, primary_key=True)
+    ministry_id = Column(Integer, ForeignKey("ministries.id", ondelete="CASCADE"), nullable=False, unique=True)
+    slug = Column(String(50), nullable=False)  # API id, e.g. "health"
+    name = Column(String(255), nullable=False)
+    sector = Column(String(100))
+    fiscal_year = Column(String(10), nullable=False)  # Latest fiscal year
+    allocation = Column(Float, nullable=False)
+    previous_year_allocation = Column(Float)
+    change_percent = Column(Float)
+    salaries = Column(Float)
+    programs = Column(Float)
+    capital_expenditure = Column(Float)
+    grants = Column(Float)
+    sparkline = Column(JSON)  # Allocations in millions, oldest first
+    sparkline_years = Column(JSON)  # Fiscal years matching sparkline
+    history = Column(JSON)  # [{"year": "2024/25", "allocation": 332747117.0}, ...]
+    source_document = Column(String(255))
+    source_page = Column(Integer)
+    refreshed_at = Column(DateTime, default=func.now())
+    
+    __table_args__ = (
+        Index("uq_ministry_summaries_slug", "slug", unique=True),
+        Index("idx_ministry_summaries_allocation", "allocation"),
     )
 
 
@@ -132,9 +163,25 @@ class BudgetItem(Base):
     __table_args__ = (
         Index("idx_items_fiscal_year", "fiscal_year"),
         Index("idx_items_ministry", "ministry_id"),
+        # Keyset pagination for /budget/items: filter prefix + (sort key, id)
+        Index("idx_items_year_ministry_id", "fiscal_year", "ministry_id", "id"),
+        Index("idx_items_year_category_id", "fiscal_year", "category", "id"),
+        Index("idx_items_year_amount_id", "fiscal_year", "amount", "id"),
+        Index("idx_items_amount_id", "amount", "id"),
     )
 
 
+# Upsert key for bulk loads: (fiscal_year, ministry, item_code).
+# COALESCE so items without a ministry still conflict with themselves.
+BUDGET_ITEM_UPSERT_INDEX = Index(
+    "uq_items_year_ministry_code",
+    BudgetItem.fiscal_year,
+    func.coalesce(BudgetItem.ministry_id, 0),
+    BudgetItem.item_code,
+    unique=True,
+)
+
+
 class Revenue(Base):
     """Revenue collection data."""
     __tablename__ = "revenue"
@@ -248,6 +295,15 @@ class EconomicIndicator(Base):
     )
     
 
+class DataVersion(Base):
+    """Single-row counter bumped whenever ingestion changes published data."""
+    __tablename__ = "data_version"
+
+    id = Column(Integer, primary_key=True)  # always 1
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+
 class Poll(Base):
     """Polling questions for public data collection."""
     __tablename__ = "polls"
@@ -267,6 +323,10 @@ class Poll(Base):
     options = relationship("PollOption", back_populates="poll", cascade="all, delete-orphan")
     votes = relationship("PollVote", back_populates="poll", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("idx_polls_status_created_at", "status", "created_at"),
+    )
+
 
 class PollOption(Base):
     """Options for a poll."""
@@ -280,12 +340,27 @@ class PollOption(Base):
 
     poll = relationship("Poll", back_populates="options")
     votes = relationship("PollVote", back_populates="option", cascade="all, delete-orphan")
+    vote_count = relationship("PollOptionCount", uselist=False, cascade="all, delete-orphan")
 
     __table_args__ = (
         Index("idx_poll_options_poll_id", "poll_id"),
     )
 
 
+class PollOptionCount(Base):
+    """Denormalized vote totals per option, kept in step with poll_votes."""
+    __tablename__ = "poll_option_counts"
+
+    option_id = Column(Integer, ForeignKey("poll_options.id", ondelete="CASCADE"), primary_key=True)
+    poll_id = Column(Integer, ForeignKey("polls.id", ondelete="CASCADE"), nullable=False)
+    votes = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("idx_poll_option_counts_poll_id", "poll_id"),
+    )
+
+
 class PollVote(Base):
     """Individual poll votes."""
     __tablename__ = "poll_votes"
@@ -0,0 +1,155 @@
+"""Cross-worker change notifications over Postgres LISTEN/NOTIFY."""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Channel names
+POLL_CHANNEL = "poll_changes"
+POLL_VOTES_CHANNEL = "poll_votes"  # payload: "poll_id:option_id:count[,...]"
+DATA_CHANNEL = "data_changes"  # payload: new data version
+
+
+async def notify(db: AsyncSession, channel: str, payload: str = "") -> None:
+    """
+    Queue a NOTIFY in the session's transaction (delivered on commit).
+
+    No-op on databases other than Postgres, where there is only one process
+    to keep in sync anyway.
+    """
+    if db.bind.dialect.name != "postgresql":
+        return
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": channel, "payload": payload},
+    )
+
+
+# Reconnect backoff after the LISTEN connection drops or cannot be opened
+RECONNECT_MIN_SECONDS = 1.0
+RECONNECT_MAX_SECONDS = 60.0
+# A silently dead connection (e.g. half-open TCP) is found by pinging it
+HEALTH_CHECK_SECONDS = 30.0
+HEALTH_CHECK_TIMEOUT = 10.0
+
+
+class ChangeListener:
+    """
+    Single LISTEN connection per worker dispatching notifications to handlers.
+
+    A supervisor task watches the connection (termination callback plus a
+    periodic ping) and reconnects with exponential backoff. While it is down
+    ``active`` is False, so callers fall back to polling / cache TTLs.
+    Notifications sent meanwhile are lost, so ``on_reconnect`` handlers run
+    after every reconnect to resynchronize.
+    """
+
+    def __init__(self):
+        self._conn = None
+        self._handlers: dict[str, list[Callable[[str], None]]] = {}
+        self._reconnect_handlers: list[Callable[[], Awaitable[None]]] = []
+        self._dropped = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether notifications from other workers are being received."""
+        return self._conn is not None and not self._conn.is_closed()
+
+    def subscribe(self, channel: str, handler: Callable[[str], None]) -> None:
+        """Register a handler called with the payload of each notification."""
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def on_reconnect(self, handler: Callable[[], Awaitable[None]]) -> None:
+        """Register a coroutine run after the connection is re-established."""
+        self._reconnect_handlers.append(handler)
+
+    def _dispatch(self, connection, pid, channel: str, payload: str) -> None:
+        for handler in self._handlers.get(channel, []):
+            try:
+                handler(payload)
+            except Exception as exc:
+                logger.warning("Change handler for %s failed: %s", channel, exc)
+
+    def _on_terminated(self, connection) -> None:
+        if connection is self._conn:
+            logger.warning("Change listener connection lost, relying on cache TTLs until it reconnects")
+            self._drop()
+
+    def _drop(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            conn.terminate()
+        self._dropped.set()
+
+    async def _connect(self) -> bool:
+        import asyncpg
+
+        conn = None
+        try:
+            conn = await asyncpg.connect(settings.DATABASE_URL)
+            conn.add_termination_listener(self._on_terminated)
+            for channel in self._handlers:
+                await conn.add_listener(channel, self._dispatch)
+        except Exception as exc:
+            logger.warning("Change listener unavailable, relying on cache TTLs: %s", exc)
+            if conn is not None:
+                conn.terminate()
+            return False
+        self._conn = conn
+        self._dropped.clear()
+        return True
+
+    async def _resync(self) -> None:
+        for handler in self._reconnect_handlers:
+            try:
+                await handler()
+            except Exception as exc:
+                logger.warning("Change listener resync handler failed: %s", exc)
+
+    async def _supervise(self) -> None:
+        delay = RECONNECT_MIN_SECONDS
+        while True:
+            if self._conn is None:
+                await asyncio.sleep(delay)
+                if not await self._connect():
+                    delay = min(delay * 2, RECONNECT_MAX_SECONDS)
+                    continue
+                logger.info("Change listener reconnected")
+                delay = RECONNECT_MIN_SECONDS
+                await self._resync()
+            try:
+                await asyncio.wait_for(self._dropped.wait(), timeout=HEALTH_CHECK_SECONDS)
+                continue
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await asyncio.wait_for(self._conn.execute("SELECT 1"), timeout=HEALTH_CHECK_TIMEOUT)
+            except Exception as exc:
+                logger.warning("Change listener health check failed: %s", exc)
+                self._drop()
+
+    async def start(self) -> None:
+        """Open the LISTEN connection and start supervising it (Postgres only)."""
+        if not settings.DATABASE_URL.startswith(("postgresql://", "postgres://")):
+            return
+        await self._connect()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._supervise())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            await asyncio.shield(conn.close())
+
+
+change_listener = ChangeListener()
@@ -0,0 +1,82 @@
+"""Precomputed aggregate tables refreshed after ingestion."""
+from datetime import datetime
+from itertools import groupby
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.ministries import ministry_info
+from app.db.models import Document, Ministry, MinistryAllocation, MinistrySummary
+
+# Number of fiscal years kept in each ministry sparkline
+SPARKLINE_YEARS = 5
+
+
+def _change_percent(current: float, previous: float | None) -> float | None:
+    if not previous:
+        return None
+    return round((current - previous) / previous * 100, 1)
+
+
+async def refresh_ministry_summaries(conn: AsyncConnection) -> int:
+    """
+    Rebuild ministry_summaries from ministry_allocations in one pass.
+
+    Reads every allocation once (ordered by ministry and year), derives the
+    latest allocation, YoY change and sparkline per ministry, and replaces
+    the summary rows inside the caller's transaction.
+    """
+    result = await conn.execute(
+        select(
+            Ministry.id,
+            Ministry.code,
+            Ministry.name,
+            Ministry.sector,
+            MinistryAllocation.fiscal_year,
+            MinistryAllocation.total_allocation,
+            MinistryAllocation.salaries,
+            MinistryAllocation.programs,
+            MinistryAllocation.capital_expenditure,
+            MinistryAllocation.grants,
+            MinistryAllocation.source_page,
+            Document.filename,
+        )
+        .join(MinistryAllocation, MinistryAllocation.ministry_id == Ministry.id)
+        .outerjoin(Document, Document.id == MinistryAllocation.source_document_id)
+        .order_by(Ministry.id, MinistryAllocation.fiscal_year)
+    )
+
+    now = datetime.now()
+    summaries = []
+    for ministry_id, rows in groupby(result.all(), key=lambda r: r.id):
+        rows = list(rows)
+        latest = rows[-1]
+        previous = rows[-2].total_allocation if len(rows) > 1 else None
+        recent = rows[-SPARKLINE_YEARS:]
+        slug, _, default_sector = ministry_info(latest.code)
+
+        summaries.append({
+            "ministry_id": ministry_id,
+            "slug": slug,
+            "name": latest.name,
+            "sector": latest.sector or default_sector,
+            "fiscal_year": latest.fiscal_year,
+            "allocation": latest.total_allocation,
+            "previous_year_allocation": previous,
+            "change_percent": _change_percent(latest.total_allocation, previous),
+            "salaries": latest.salaries,
+            "programs": latest.programs,
+            "capital_expenditure": latest.capital_expenditure,
+            "grants": latest.grants,
+            "sparkline": [round(r.total_allocation / 1_000_000, 1) for r in recent],
+            "sparkline_years": [r.fiscal_year for r in recent],
+            "history": [{"year": r.fiscal_year, "allocation": r.total_allocation} for r in rows],
+            "source_document": latest.filename,
+            "source_page": latest.source_page,
+            "refreshed_at": now,
+        })
+
+    await conn.execute(delete(MinistrySummary))
+    if summaries:
+        await conn.execute(insert(MinistrySummary), summaries)
+    return len(summaries)
@@ -8,6 +8,7 @@ from pydantic import BaseModel
 import openai
 from pinecone import Pinecone
 from app.core.config import settings
+from app.core.pdf_pages import page_url
 
 
 class Citation(BaseModel):
@@ -159,7 +160,7 @@ Please answer the question based on the context above. Respond in JSON format.""
                         document=doc["document"],
                         page=doc["page_number"],
                         snippet=doc["content"][:200] + "...",
-                        url=f"/data/raw/{doc['document']}#page={doc['page_number']}",
+                        url=page_url(doc["document"], doc["page_number"]),
                     ))
             
             return RAGResponse(
@@ -0,0 +1 @@
+# Load tests and benchmarks
@@ -0,0 +1,233 @@
+"""
+JSON response benchmark.
+Times real requests per endpoint through the app's router with every
+default-rendered route switched between FastAPI's stock JSONResponse and the
+app's orjson FastJSONResponse. Each request includes what a live one costs:
+the endpoint and its queries, response_model validation or jsonable_encoder,
+and rendering. Middleware (response cache, compression) is bypassed so
+cached bodies don't hide the serialization.
+
+Routes that build their own FastJSONResponse ("direct") are unaffected by
+the switch; for those the stdlib column is the measured request with the
+orjson render swapped for jsonable_encoder + stdlib render of the same body.
+
+Before timing, an empty database is seeded with ministries, allocations and
+--items budget items over three fiscal years, the economic indicators, and
+(as in polls_benchmark) --polls polls with --votes votes.
+
+Usage (from backend/):
+    pip install aiosqlite  # only for the default SQLite stand-in
+    python -m benchmarks.json_benchmark
+    python -m benchmarks.json_benchmark --iterations 200 --database-url postgresql://localhost:5432/bench
+
+Budget data is only seeded when budget_items is empty; benchmark polls are
+deleted afterwards. Point --database-url at a scratch database, never production.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_SQLITE_FILE = BACKEND_DIR / "bench_json.db"
+FISCAL_YEARS = ["2022/23", "2023/24", "2024/25"]
+CATEGORIES = ["Salaries", "Supplies", "Services", "Grants", "Capital"]
+
+ENDPOINTS = [
+    "/api/v1/budget/summary",
+    "/api/v1/budget/historical",
+    "/api/v1/budget/sector-breakdown",
+    "/api/v1/budget/items?limit=1000",
+    "/api/v1/ministries",
+    "/api/v1/revenue",
+    "/api/v1/debt",
+    "/api/v1/debt/creditors",
+    "/api/v1/debt/historical",
+    "/api/v1/economic/indicators",
+    "/api/v1/economic/comparison",
+    "/api/v1/revenue/historical",
+    "/api/v1/polls?limit=200",
+]
+
+
+async def seed_budget(session_factory, items: int) -> int:
+    """Create ministries, budget items and their allocations if budget_items is empty."""
+    from sqlalchemy import func, insert, select
+
+    from app.core.ministries import MINISTRY_REGISTRY
+    from app.db.models import BudgetItem, Ministry, MinistryAllocation
+    from app.db.summaries import refresh_ministry_summaries
+
+    rng = random.Random(0)
+    async with session_factory() as session:
+        if await session.scalar(select(func.count()).select_from(BudgetItem)):
+            return 0
+        existing = dict((await session.execute(select(Ministry.code, Ministry.id))).all())
+        for code, (_, name, sector) in MINISTRY_REGISTRY.items():
+            if code not in existing:
+                ministry = Ministry(code=code, name=name, sector=sector)
+                session.add(ministry)
+                await session.flush()
+                existing[code] = ministry.id
+
+        rows = []
+        totals: dict[tuple[int, str], float] = {}
+        for n in range(items):
+            ministry_id = rng.choice(list(existing.values()))
+            fiscal_year = FISCAL_YEARS[n % len(FISCAL_YEARS)]
+            amount = round(rng.lognormvariate(13, 1.5), 2)
+            rows.append({
+                "ministry_id": ministry_id,
+                "fiscal_year": fiscal_year,
+                "item_code": f"bench-{n}",
+                "item_name": f"Line item {n}",
+                "category": rng.choice(CATEGORIES),
+                "amount": amount,
+                "previous_year_amount": round(amount * rng.uniform(0.8, 1.1), 2),
+                "source_page": rng.randint(1, 600),
+            })
+            totals[(ministry_id, fiscal_year)] = totals.get((ministry_id, fiscal_year), 0.0) + amount
+        for start in range(0, len(rows), 5000):
+            await session.execute(insert(BudgetItem), rows[start:start + 5000])
+        await session.execute(insert(MinistryAllocation), [
+            {"ministry_id": m, "fiscal_year": y, "total_allocation": total} for (m, y), total in totals.items()
+        ])
+        await refresh_ministry_summaries(await session.connection())
+        await session.commit()
+    return len(rows)
+
+
+def use_response_class(app, response_class) -> None:
+    """Re-render every route that uses the app's default response class with ``response_class``."""
+    from fastapi.routing import APIRoute, request_response
+
+    from app.core.responses import FastJSONResponse
+
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.response_class in (FastJSONResponse, response_class):
+            route.response_class = response_class
+            route.app = request_response(route.get_route_handler())
+
+
+def time_render(fn, payload, iterations: int) -> float:
+    """Median-of-5 microseconds per render call."""
+    samples = []
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn(payload)
+        samples.append((time.perf_counter() - started) / iterations * 1e6)
+    return sorted(samples)[2]
+
+
+async def renders_directly(client, path: str) -> bool:
+    """Whether the endpoint returns a FastJSONResponse itself (checked while defaults are stock)."""
+    from app.core.responses import FastJSONResponse
+
+    calls = []
+    original = FastJSONResponse.render
+    FastJSONResponse.render = lambda self, content: calls.append(1) or original(self, content)
+    try:
+        await client.get(path)
+    finally:
+        FastJSONResponse.render = original
+    return bool(calls)
+
+
+async def time_requests(client, path: str, iterations: int) -> tuple[float, int]:
+    """Median-of-5 microseconds per request, and the body size."""
+    response = await client.get(path)
+    samples = []
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await client.get(path)
+        samples.append((time.perf_counter() - started) / iterations * 1e6)
+    return sorted(samples)[2], len(response.content)
+
+
+async def time_endpoints(app, iterations: int) -> list[tuple[str, str, int, float, float]]:
+    import httpx
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+
+    from app.core.responses import FastJSONResponse
+
+    results = []
+    transport = httpx.ASGITransport(app=app.router)  # endpoints only, no middleware
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for path in ENDPOINTS:
+                status = (await client.get(path)).status_code
+                if status != 200:
+                    print(f"   skip {path}: HTTP {status}")
+                    continue
+                use_response_class(app, JSONResponse)
+                direct = await renders_directly(client, path)
+                if not direct:
+                    stock, size = await time_requests(client, path, iterations)
+                use_response_class(app, FastJSONResponse)
+                fast, size = await time_requests(client, path, iterations)
+                if direct:
+                    payload = (await client.get(path)).json()
+                    stock_render = JSONResponse(None).render
+                    stock = fast - time_render(FastJSONResponse(None).render, payload, iterations) + time_render(
+                        lambda p: stock_render(jsonable_encoder(p)), payload, iterations
+                    )
+                results.append((path, "direct" if direct else "default", size, stock, fast))
+    return results
+
+
+async def run(args) -> list[tuple[str, str, int, float, float]]:
+    from app.db.database import AsyncSessionLocal, engine
+    from app.db.models import Base
+    from benchmarks.polls_benchmark import cleanup, seed
+    from main import app
+    from seed_economic_data import seed_economic_data
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    print(f"   Seeding {args.items} budget items, {args.polls} polls and {args.votes} votes...")
+    if not await seed_budget(AsyncSessionLocal, args.items):
+        print("   budget_items is not empty; timing the existing budget data")
+    await seed_economic_data()
+    await seed(AsyncSessionLocal, args.polls, args.votes)
+    try:
+        return await time_endpoints(app, args.iterations)
+    finally:
+        await cleanup(AsyncSessionLocal)
+        await engine.dispose()
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Compare stdlib and orjson responses per endpoint, end to end")
+    parser.add_argument("--database-url", default=f"sqlite+aiosqlite:///{DEFAULT_SQLITE_FILE}")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--items", type=int, default=5000, help="Budget items to seed")
+    parser.add_argument("--polls", type=int, default=50)
+    parser.add_argument("--votes", type=int, default=10000)
+    args = parser.parse_args()
+
+    # Settings are read at import time, so configure the environment first
+    os.environ["DATABASE_URL"] = args.database_url
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    print("🇧🇸 Bahamas Open Data - JSON Response Benchmark")
+    print("=" * 40)
+    if args.database_url.startswith("sqlite") and DEFAULT_SQLITE_FILE.exists():
+        DEFAULT_SQLITE_FILE.unlink()
+    results = asyncio.run(run(args))
+    if args.database_url.startswith("sqlite") and DEFAULT_SQLITE_FILE.exists():
+        DEFAULT_SQLITE_FILE.unlink()
+
+    print(f"\n{'endpoint':<36}{'route':>8}{'bytes':>9}{'stdlib µs':>12}{'orjson µs':>12}{'speedup':>9}")
+    for path, kind, size, stock, fast in results:
+        print(f"{path:<36}{kind:>8}{size:>9}{stock:>12.1f}{fast:>12.1f}{stock / fast:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
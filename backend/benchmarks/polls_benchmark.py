@@ -0,0 +1,214 @@
+"""
+Polls API benchmark.
+Boots the FastAPI app in-process against a local database, seeds N polls and
+M votes, then drives read and vote traffic and reports throughput, latency
+percentiles and DB queries per request for each phase.
+
+Usage (from backend/):
+    pip install aiosqlite  # only for the default SQLite stand-in
+    python -m benchmarks.polls_benchmark --polls 50 --votes 20000
+    python -m benchmarks.polls_benchmark --database-url postgresql://localhost:5432/polls_bench
+    POLL_VOTE_BUFFERING=true python -m benchmarks.polls_benchmark
+
+Benchmark polls are created with a "[benchmark]" prefix and deleted afterwards.
+Point --database-url at a scratch database, never production.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_SQLITE_FILE = BACKEND_DIR / "bench_polls.db"
+BENCH_PREFIX = "[benchmark]"
+OPTIONS_PER_POLL = 4
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class QueryCounter:
+    """Counts SQL statements executed on an engine."""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+
+async def seed(session_factory, polls: int, votes: int) -> list[dict]:
+    """Create benchmark polls and votes; returns [{"id", "options"}]."""
+    from sqlalchemy import insert
+
+    from app.api.polls import reconcile_vote_counts
+    from app.db.models import Poll, PollOption, PollVote
+
+    seeded = []
+    async with session_factory() as session:
+        for i in range(polls):
+            poll = Poll(
+                question=f"{BENCH_PREFIX} Poll {i}",
+                status="active" if i == 0 else "closed",
+                domain="budget",
+            )
+            session.add(poll)
+            await session.flush()
+            options = [PollOption(poll_id=poll.id, option_text=f"Option {j}", display_order=j) for j in range(OPTIONS_PER_POLL)]
+            session.add_all(options)
+            await session.flush()
+            seeded.append({"id": poll.id, "options": [o.id for o in options]})
+
+        rows = []
+        for n in range(votes):
+            poll = random.choice(seeded)
+            rows.append({"poll_id": poll["id"], "option_id": random.choice(poll["options"]), "fingerprint": f"seed-{n}"})
+        for start in range(0, len(rows), 5000):
+            await session.execute(insert(PollVote), rows[start:start + 5000])
+        await session.commit()
+
+        await reconcile_vote_counts(session)
+    return seeded
+
+
+async def cleanup(session_factory) -> None:
+    from sqlalchemy import delete
+
+    from app.db.models import Poll
+
+    async with session_factory() as session:
+        await session.execute(delete(Poll).where(Poll.question.startswith(BENCH_PREFIX)))
+        await session.commit()
+
+
+async def run_phase(name: str, client, counter: QueryCounter, make_request, requests: int, concurrency: int) -> dict:
+    """Issue ``requests`` calls of ``make_request`` with bounded concurrency."""
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for i in remaining:
+            started = time.perf_counter()
+            response = await make_request(client, i)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    queries_before = counter.count
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "phase": name,
+        "requests": requests,
+        "errors": errors,
+        "rps": requests / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "queries_per_request": (counter.count - queries_before) / requests if requests else 0.0,
+    }
+
+
+async def benchmark(args) -> list[dict]:
+    # Settings are read at import time, so configure the environment first
+    os.environ["DATABASE_URL"] = args.database_url
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    import httpx
+
+    from app.db.database import AsyncSessionLocal, engine
+    from app.db.models import Base
+    from main import app
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    print(f"   Seeding {args.polls} polls and {args.votes} votes...")
+    seeded = await seed(AsyncSessionLocal, args.polls, args.votes)
+    active = seeded[0]
+    counter = QueryCounter(engine)
+
+    async def get_active(client, i):
+        return await client.get("/api/v1/polls/active")
+
+    async def list_polls(client, i):
+        return await client.get("/api/v1/polls", params={"limit": 50})
+
+    async def get_poll(client, i):
+        return await client.get(f"/api/v1/polls/{random.choice(seeded)['id']}")
+
+    async def vote(client, i):
+        return await client.post(
+            f"/api/v1/polls/{active['id']}/vote",
+            json={"option_id": random.choice(active["options"]), "fingerprint": f"bench-{uuid.uuid4().hex}"},
+        )
+
+    async def mixed(client, i):
+        # Election-night shape: mostly homepage reads with a stream of votes
+        return await (vote if i % 5 == 0 else get_active)(client, i)
+
+    results = []
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 50000))
+    try:
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                for name, make_request in [
+                    ("GET /polls/active", get_active),
+                    ("GET /polls?limit=50", list_polls),
+                    ("GET /polls/{id}", get_poll),
+                    ("POST /polls/{id}/vote", vote),
+                    ("mixed 80/20 read/vote", mixed),
+                ]:
+                    results.append(await run_phase(name, client, counter, make_request, args.requests, args.concurrency))
+    finally:
+        await cleanup(AsyncSessionLocal)
+        await engine.dispose()
+    return results
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the polls API against a local database")
+    parser.add_argument("--database-url", default=f"sqlite+aiosqlite:///{DEFAULT_SQLITE_FILE}")
+    parser.add_argument("--polls", type=int, default=50)
+    parser.add_argument("--votes", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per phase")
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.database_url.startswith("sqlite") and DEFAULT_SQLITE_FILE.exists():
+        DEFAULT_SQLITE_FILE.unlink()
+
+    print("🇧🇸 Bahamas Open Data - Polls Benchmark")
+    print("=" * 40)
+    print(f"   Database: {args.database_url}")
+    print(f"   Vote buffering: {os.environ.get('POLL_VOTE_BUFFERING', 'false')}")
+
+    results = asyncio.run(benchmark(args))
+
+    print(f"\n{'phase':<24}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries/req':>13}{'errors':>8}")
+    for r in results:
+        print(
+            f"{r['phase']:<24}{r['rps']:>9.0f}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}"
+            f"{r['p99_ms']:>9.1f}{r['queries_per_request']:>13.2f}{r['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
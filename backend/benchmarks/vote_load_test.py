@@ -0,0 +1,84 @@
+"""
+Vote ingestion load test.
+Fires unique votes at a running API and reports throughput and latency, so the
+direct write path can be compared with POLL_VOTE_BUFFERING=true.
+
+Usage:
+    # Terminal 1 (repeat with POLL_VOTE_BUFFERING=true)
+    uvicorn main:app --workers 1
+    # Terminal 2
+    python -m benchmarks.vote_load_test --poll-id 1 --votes 5000 --concurrency 100
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+
+import httpx
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run_load_test(base_url: str, poll_id: int, votes: int, concurrency: int) -> dict:
+    """Cast ``votes`` unique votes with ``concurrency`` parallel clients."""
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        poll = (await client.get(f"/polls/{poll_id}")).raise_for_status().json()
+        option_ids = [opt["id"] for opt in poll["options"]]
+
+        latencies: list[float] = []
+        statuses: dict[int, int] = {}
+        remaining = iter(range(votes))
+
+        async def worker():
+            for _ in remaining:
+                payload = {
+                    "option_id": random.choice(option_ids),
+                    "fingerprint": f"loadtest-{uuid.uuid4().hex}",
+                }
+                started = time.perf_counter()
+                response = await client.post(f"/polls/{poll_id}/vote", json=payload)
+                latencies.append((time.perf_counter() - started) * 1000)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "votes": votes,
+        "seconds": elapsed,
+        "votes_per_second": votes / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "statuses": statuses,
+    }
+
+
+async def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Load test the poll vote endpoint")
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--poll-id", type=int, required=True)
+    parser.add_argument("--votes", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    print("🇧🇸 Bahamas Open Data - Vote Load Test")
+    print("=" * 40)
+    result = await run_load_test(args.base_url, args.poll_id, args.votes, args.concurrency)
+    print(f"   Votes:       {result['votes']} in {result['seconds']:.2f}s")
+    print(f"   Throughput:  {result['votes_per_second']:.0f} votes/s")
+    print(f"   Latency:     p50 {result['p50_ms']:.1f} ms · p95 {result['p95_ms']:.1f} ms · p99 {result['p99_ms']:.1f} ms")
+    print(f"   Statuses:    {result['statuses']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,302 @@
+"""
+Bulk loader for parsed budget line items.
+Streams the *_budget_items.csv files written by ingestion/parser.py into the
+budget_items table with COPY, upserts by (fiscal_year, ministry, item_code),
+refreshes ministry_allocations and ministry_summaries from the loaded items,
+and rebuilds the export snapshots.
+
+Usage:
+    python load_budget_items.py                      # all CSVs in data/processed
+    python load_budget_items.py path/to/file.csv --fiscal-year 2025/26
+"""
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import re
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+
+from app.core.config import settings
+from app.core.ministries import ministry_info
+from app.db.data_version import bump_data_version
+from app.db.database import engine
+from app.db.export_snapshots import build_export_snapshots
+from app.db.models import Base, BudgetItem, MinistryAllocation, BUDGET_ITEM_UPSERT_INDEX
+from app.db.summaries import refresh_ministry_summaries
+
+
+# Configuration
+DATA_DIR = settings.DATA_DIR
+PROCESSED_DIR = DATA_DIR / "processed"
+METADATA_FILE = DATA_DIR / "document_metadata.json"
+
+STAGING_TABLE = "budget_items_staging"
+STAGING_COLUMNS = ["fiscal_year", "ministry_code", "item_code", "item_name", "amount", "source_page"]
+
+# Subtotal / total rows the parser keeps from budget tables ("Total", "Sub-Total",
+# "Grand Total", "Ministry of Health Total"). Written to work both as a Python
+# regex and a Postgres ~* pattern (no \b, which Postgres reads as backspace).
+TOTAL_ROW_PATTERN = r"^\s*(grand\s+|sub-?\s*)?totals?([^a-z]|$)|(^|[^a-z])(sub-?\s*)?totals?\s*:?\s*$"
+_TOTAL_ROW = re.compile(TOTAL_ROW_PATTERN, re.IGNORECASE)
+
+
+def is_total_row(name: str) -> bool:
+    """True for subtotal/total rows, which would double-count their line items."""
+    return _TOTAL_ROW.search(name) is not None
+
+
+def load_metadata() -> dict:
+    """Load document metadata written by the ingestion pipeline."""
+    if METADATA_FILE.exists():
+        with open(METADATA_FILE) as f:
+            return json.load(f)
+    return {"documents": []}
+
+
+def derive_item_code(name: str, source_page: Optional[int]) -> str:
+    """
+    Stable item code for rows without one.
+
+    Parsed tables carry no official item codes, so the code is built from the
+    source page and normalized item name. Reloading the same CSV therefore
+    updates rows in place instead of duplicating them. Identically named
+    items on the same page share a code and are summed on load.
+    """
+    normalized = " ".join(re.sub(r"[^a-z0-9]+", " ", name.lower()).split())
+    digest = hashlib.sha1(normalized.encode()).hexdigest()[:12]
+    return f"p{source_page or 0}-{digest}"
+
+
+def iter_csv_records(csv_path: Path, fiscal_year: str) -> Iterator[tuple]:
+    """Stream staging records from a parsed budget CSV without loading it whole."""
+    with open(csv_path, newline="") as f:
+        for row in csv.DictReader(f):
+            name = (row.get("name") or "").strip()
+            try:
+                amount = float(row.get("amount") or "")
+            except ValueError:
+                continue
+            if not name or is_total_row(name):
+                continue
+            source_page = int(row["source_page"]) if row.get("source_page") else None
+            yield (
+                fiscal_year,
+                row.get("ministry_code") or None,
+                row.get("item_code") or derive_item_code(name, source_page),
+                name[:500],
+                amount,
+                source_page,
+            )
+
+
+async def ensure_indexes():
+    """
+    Create tables, the unique indexes the upserts rely on and the budget_items
+    pagination indexes (no-op if present; create_all skips existing tables).
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(lambda sync_conn: BUDGET_ITEM_UPSERT_INDEX.create(sync_conn, checkfirst=True))
+        indexes = [i for i in MinistryAllocation.__table__.indexes if i.unique]
+        indexes += list(BudgetItem.__table__.indexes)
+        for index in indexes:
+            await conn.run_sync(lambda sync_conn, index=index: index.create(sync_conn, checkfirst=True))
+
+
+async def upsert_document(conn, doc_meta: dict, fiscal_year: str) -> int:
+    """Find or create the Document row for a source PDF and return its id."""
+    document_id = await conn.fetchval(
+        "SELECT id FROM documents WHERE filename = $1 ORDER BY id LIMIT 1",
+        doc_meta["filename"],
+    )
+    if document_id is None:
+        document_id = await conn.fetchval(
+            """
+            INSERT INTO documents (filename, original_url, document_type, fiscal_year,
+                                   file_hash, file_path, extraction_status, downloaded_at)
+            VALUES ($1, $2, $3, $4, $5, $6, 'completed', now())
+            RETURNING id
+            """,
+            doc_meta["filename"],
+            doc_meta.get("original_url"),
+            doc_meta.get("document_type"),
+            fiscal_year,
+            doc_meta.get("file_hash"),
+            str(DATA_DIR / "raw" / doc_meta["filename"]),
+        )
+    else:
+        await conn.execute(
+            "UPDATE documents SET file_hash = COALESCE($2, file_hash), extraction_status = 'completed' WHERE id = $1",
+            document_id,
+            doc_meta.get("file_hash"),
+        )
+    return document_id
+
+
+async def load_csv(csv_path: Path, fiscal_year: Optional[str] = None) -> dict:
+    """Load one parsed budget CSV into budget_items and refresh allocations."""
+    source_file = None
+    with open(csv_path, newline="") as f:
+        first = next(csv.DictReader(f), None)
+        if first:
+            source_file = first.get("source_file")
+    if not source_file:
+        print(f"⊙ Skipping (empty or no source_file column): {csv_path.name}")
+        return {"status": "skipped", "rows": 0}
+
+    metadata = load_metadata()
+    doc_meta = next(
+        (d for d in metadata["documents"] if d.get("filename") == source_file),
+        {"filename": source_file},
+    )
+    fiscal_year = fiscal_year or doc_meta.get("fiscal_year")
+    if not fiscal_year:
+        print(f"⚠ No fiscal year for {source_file}; pass --fiscal-year")
+        return {"status": "missing_fiscal_year", "rows": 0}
+
+    started = time.perf_counter()
+    async with engine.connect() as sa_conn:
+        raw = await sa_conn.get_raw_connection()
+        conn = raw.driver_connection  # asyncpg connection
+
+        async with conn.transaction():
+            document_id = await upsert_document(conn, doc_meta, fiscal_year)
+
+            await conn.execute(f"""
+                CREATE TEMP TABLE {STAGING_TABLE} (
+                    fiscal_year varchar(10),
+                    ministry_code varchar(20),
+                    item_code varchar(50),
+                    item_name varchar(500),
+                    amount double precision,
+                    source_page integer
+                ) ON COMMIT DROP
+            """)
+            await conn.copy_records_to_table(
+                STAGING_TABLE,
+                records=iter_csv_records(csv_path, fiscal_year),
+                columns=STAGING_COLUMNS,
+            )
+
+            # Make sure every referenced ministry exists before resolving ids
+            codes = [r["ministry_code"] for r in await conn.fetch(
+                f"SELECT DISTINCT ministry_code FROM {STAGING_TABLE} WHERE ministry_code IS NOT NULL"
+            )]
+            await conn.executemany(
+                "INSERT INTO ministries (code, name, sector, created_at) VALUES ($1, $2, $3, now()) "
+                "ON CONFLICT (code) DO NOTHING",
+                [(code, *ministry_info(code)[1:]) for code in codes],
+            )
+
+            # Total rows loaded before they were filtered out at parse time
+            await conn.execute(
+                "DELETE FROM budget_items WHERE fiscal_year = $1 AND item_name ~* $2",
+                fiscal_year, TOTAL_ROW_PATTERN,
+            )
+
+            # Rows from an earlier parse of this document that this one no longer produces
+            # (pages shifted or items renamed) would otherwise be counted alongside their replacements
+            stale = await conn.fetchval(f"""
+                WITH deleted AS (
+                    DELETE FROM budget_items b
+                    WHERE b.source_document_id = $1 AND b.fiscal_year = $2
+                      AND NOT EXISTS (
+                          SELECT 1 FROM {STAGING_TABLE} s
+                          LEFT JOIN ministries m ON m.code = s.ministry_code
+                          WHERE s.fiscal_year = b.fiscal_year
+                            AND s.item_code = b.item_code
+                            AND COALESCE(m.id, 0) = COALESCE(b.ministry_id, 0)
+                      )
+                    RETURNING 1
+                )
+                SELECT count(*) FROM deleted
+            """, document_id, fiscal_year)
+
+            # Rows sharing a key (same item name on one page) are separate line items: sum them
+            upserted = await conn.fetchval(f"""
+                WITH upserted AS (
+                    INSERT INTO budget_items (ministry_id, fiscal_year, item_code, item_name, amount,
+                                              source_document_id, source_page, created_at)
+                    SELECT m.id, s.fiscal_year, s.item_code, MIN(s.item_name), SUM(s.amount),
+                           $1, MIN(s.source_page), now()
+                    FROM {STAGING_TABLE} s
+                    LEFT JOIN ministries m ON m.code = s.ministry_code
+                    GROUP BY s.fiscal_year, m.id, s.item_code
+                    ON CONFLICT (fiscal_year, COALESCE(ministry_id, 0), item_code) DO UPDATE SET
+                        item_name = EXCLUDED.item_name,
+                        amount = EXCLUDED.amount,
+                        source_document_id = EXCLUDED.source_document_id,
+                        source_page = EXCLUDED.source_page
+                    RETURNING 1
+                )
+                SELECT count(*) FROM upserted
+            """, document_id)
+
+            allocations = await refresh_ministry_allocations(conn, fiscal_year)
+
+    elapsed = time.perf_counter() - started
+    print(f"  ✓ {csv_path.name}: {upserted} items, {stale} stale removed, {allocations} allocations ({elapsed:.2f}s)")
+    return {"status": "success", "rows": upserted, "stale": stale, "allocations": allocations, "seconds": elapsed}
+
+
+async def refresh_ministry_allocations(conn, fiscal_year: str) -> int:
+    """
+    Recompute ministry_allocations totals for a fiscal year from budget_items
+    (subtotal/total rows excluded so items aren't counted twice).
+    """
+    return await conn.fetchval("""
+        WITH upserted AS (
+            INSERT INTO ministry_allocations (ministry_id, fiscal_year, total_allocation,
+                                              source_document_id, source_page, created_at)
+            SELECT ministry_id, fiscal_year, SUM(amount), MAX(source_document_id), MIN(source_page), now()
+            FROM budget_items
+            WHERE fiscal_year = $1 AND ministry_id IS NOT NULL AND item_name !~* $2
+            GROUP BY ministry_id, fiscal_year
+            ON CONFLICT (ministry_id, fiscal_year) DO UPDATE SET
+                total_allocation = EXCLUDED.total_allocation,
+                source_document_id = EXCLUDED.source_document_id,
+                source_page = EXCLUDED.source_page
+            RETURNING 1
+        )
+        SELECT count(*) FROM upserted
+    """, fiscal_year, TOTAL_ROW_PATTERN)
+
+
+async def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Bulk load parsed budget CSVs into the database")
+    parser.add_argument("csv_files", nargs="*", type=Path, help="CSV files (default: data/processed/*_budget_items.csv)")
+    parser.add_argument("--fiscal-year", help="Override fiscal year, e.g. 2025/26")
+    args = parser.parse_args()
+
+    print("🇧🇸 Bahamas Open Data - Budget Item Loader")
+    print("=" * 40)
+
+    csv_files = args.csv_files or sorted(PROCESSED_DIR.glob("*_budget_items.csv"))
+    if not csv_files:
+        print("No budget item CSVs found. Run ingestion/parser.py first.")
+        return
+
+    await ensure_indexes()
+
+    total = 0
+    for csv_path in csv_files:
+        result = await load_csv(csv_path, args.fiscal_year)
+        total += result["rows"]
+
+    async with engine.begin() as conn:
+        summaries = await refresh_ministry_summaries(conn)
+        version = await bump_data_version(conn)
+
+    manifest = await build_export_snapshots()
+
+    print(f"\n✅ Loaded {total} budget items from {len(csv_files)} file(s)")
+    print(f"   Refreshed {summaries} ministry summaries (data version {version})")
+    print(f"   Built {len(manifest['artifacts'])} export snapshots (version {manifest['version']})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
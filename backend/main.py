@@ -9,6 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api import (
     ask,
     budget,
+    dashboard,
     debt,
     documents,
     economic,
@@ -20,15 +21,43 @@ from app.api import (
 )
 from sqlalchemy import select
 
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.response_cache import ResponseCacheMiddleware
+from app.core.responses import FastJSONResponse
+from app.db.data_version import data_version
 from app.db.database import AsyncSessionLocal, engine
 from app.db.models import Base, Poll, PollOption
+from app.db.notify import change_listener
 
 logger = logging.getLogger(__name__)
 
 MAX_DB_RETRIES = 5
 RETRY_DELAY_SECONDS = 3
 
+# Routers whose data only changes on ingest
+CACHED_ROUTERS = ("budget", "ministries", "revenue", "debt", "economic")
+
+
+async def reconcile_poll_counts_periodically():
+    """Keep poll_option_counts in line with poll_votes (first run at startup)."""
+    while True:
+        try:
+            async with AsyncSessionLocal() as session:
+                fixed = await polls.reconcile_vote_counts(session)
+            if fixed:
+                logger.info("Reconciled %d poll option counters.", fixed)
+        except Exception as exc:
+            logger.warning("Poll counter reconciliation failed: %s", exc)
+        await asyncio.sleep(settings.POLL_COUNTS_RECONCILE_SECONDS)
+
+
+async def save_citations_periodically():
+    """Merge this worker's citation counts into the shared file, so a crash loses little."""
+    while True:
+        await asyncio.sleep(settings.CITATION_SAVE_SECONDS)
+        await asyncio.to_thread(documents.citation_counter.save)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -73,7 +102,22 @@ async def lifespan(app: FastAPI):
     except Exception as exc:
         logger.warning("Could not seed default polls: %s", exc)
 
+    documents.document_index.refresh(force=True)
+    hot_topics.report_index.refresh(force=True)
+    export.export_snapshots.refresh(force=True)
+    prewarm_task = asyncio.create_task(documents.prewarm_most_cited(settings.PAGE_CACHE_PREWARM_PAGES))
+    reconcile_task = asyncio.create_task(reconcile_poll_counts_periodically())
+    citations_task = asyncio.create_task(save_citations_periodically())
+    await change_listener.start()
+    await data_version.reload()
+
     yield
+    reconcile_task.cancel()
+    prewarm_task.cancel()
+    citations_task.cancel()
+    documents.citation_counter.save()
+    await polls.vote_buffer.close()
+    await change_listener.stop()
     print(f"🇧🇸 {settings.APP_NAME} shutting down...")
 
 
@@ -82,6 +126,28 @@ app = FastAPI(
     description="Bahamas Open Data - Public finance data made clear and accessible.",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
+
+# Cache read-only endpoints until ingestion bumps the data version (innermost,
+# so compression reuses its compressed variant by ETag)
+app.add_middleware(
+    ResponseCacheMiddleware,
+    prefixes=tuple(f"{settings.API_V1_PREFIX}/{name}" for name in CACHED_ROUTERS),
+    version=data_version.current,
+    max_age=settings.RESPONSE_CACHE_MAX_AGE,
+    stale_while_revalidate=settings.RESPONSE_CACHE_STALE_SECONDS,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    max_body_bytes=settings.RESPONSE_CACHE_MAX_BODY_BYTES,
+    # Cursor/filter/fields combinations are unbounded; each page is a cheap indexed query
+    exclude=(f"{settings.API_V1_PREFIX}/budget/items",),
+)
+
+# Compression (added before CORS so CORS headers are set on the inner response)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    cache_max_bytes=settings.COMPRESSION_CACHE_MAX_BYTES,
 )
 
 # CORS middleware
@@ -104,6 +170,7 @@ app.include_router(economic.router, prefix=f"{settings.API_V1_PREFIX}/economic",
 app.include_router(documents.router, prefix=f"{settings.API_V1_PREFIX}/documents", tags=["Documents"])
 app.include_router(hot_topics.router, prefix=f"{settings.API_V1_PREFIX}/hot-topics", tags=["Hot Topics"])
 app.include_router(polls.router, prefix=f"{settings.API_V1_PREFIX}/polls", tags=["Polls"])
+app.include_router(dashboard.router, prefix=f"{settings.API_V1_PREFIX}/dashboard", tags=["Dashboard"])
 
 
 @app.get("/")
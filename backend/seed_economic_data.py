@@ -8,12 +8,14 @@ Usage:
 import asyncio
 from datetime import date
 from sqlalchemy import select
+from app.db.data_version import bump_data_version
 from app.db.database import AsyncSessionLocal, engine
+from app.db.export_snapshots import build_export_snapshots
 from app.db.models import Base, EconomicIndicator
 
 
-async def seed_economic_data():
-    """Seed the database with economic indicator data from the 2024 study."""
+async def seed_economic_data() -> int:
+    """Seed the database with economic indicator data from the 2024 study. Returns rows added."""
     async with AsyncSessionLocal() as session:
         try:
             # Check if data already exists
@@ -22,7 +24,7 @@ async def seed_economic_data():
             
             if existing:
                 print("Economic indicator data already exists. Skipping seed.")
-                return
+                return 0
             
             # Data from the 2024 University of The Bahamas study
             indicators = [
@@ -93,8 +95,10 @@ async def seed_economic_data():
             for indicator in indicators:
                 session.add(indicator)
             
+            await bump_data_version(await session.connection())
             await session.commit()
             print(f"✅ Successfully seeded {len(indicators)} economic indicators")
+            return len(indicators)
             
         except Exception as e:
             await session.rollback()
@@ -108,7 +112,10 @@ async def main():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
-    await seed_economic_data()
+    if await seed_economic_data():
+        # economic_indicators snapshots would otherwise serve the old rows until the next ingest
+        manifest = await build_export_snapshots()
+        print(f"   Built {len(manifest['artifacts'])} export snapshots (version {manifest['version']})")
 
 
 if __name__ == "__main__":
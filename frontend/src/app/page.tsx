@@ -12,6 +12,7 @@ import { formatCurrency } from '@/lib/format';
 import {
   Ministry,
   AskResponse,
+  Poll,
   RevenueBreakdown,
   DebtSummary,
   IncomeComparison,
@@ -111,107 +112,69 @@ export default function Home() {
   const [incomeComparisons, setIncomeComparisons] = useState<
     IncomeComparison[] | null
   >(null);
+  const [activePoll, setActivePoll] = useState<Poll | null>(null);
+  const [dashboardLoading, setDashboardLoading] = useState(true);
 
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [
-          budgetRes,
-          historicalRes,
-          sectorRes,
-          ministriesRes,
-          revenueRes,
-          debtRes,
-          economicRes,
-        ] = await Promise.allSettled([
-          fetch(`${API_BASE}/budget/summary`),
-          fetch(`${API_BASE}/budget/historical`),
-          fetch(`${API_BASE}/budget/sector-breakdown`),
-          fetch(`${API_BASE}/ministries`),
-          fetch(`${API_BASE}/revenue`),
-          fetch(`${API_BASE}/debt`),
-          fetch(`${API_BASE}/economic/comparison`),
-        ]);
-
-        if (
-          budgetRes.status === 'fulfilled' &&
-          budgetRes.value.ok
-        ) {
-          const json = await budgetRes.value.json();
+        // One round trip for every homepage section; a section is null if it failed server-side
+        const res = await fetch(`${API_BASE}/dashboard`);
+        if (!res.ok) {
+          return;
+        }
+        const dashboard = await res.json();
+
+        if (dashboard.budget_summary) {
           setBudgetSummary((prev) => ({
             ...prev,
-            ...json,
+            ...dashboard.budget_summary,
           }));
         }
 
-        if (
-          historicalRes.status === 'fulfilled' &&
-          historicalRes.value.ok
-        ) {
-          const json = await historicalRes.value.json();
-          if (Array.isArray(json.years)) {
-            setHistoricalData(
-              json.years.map((y: any) => ({
-                year: y.year,
-                revenue: y.revenue / 1_000_000_000,
-                expenditure: y.expenditure / 1_000_000_000,
-                debt: y.debt / 1_000_000_000,
-                debt_gdp: y.debt_gdp,
-              })),
-            );
-          }
+        if (Array.isArray(dashboard.historical?.years)) {
+          setHistoricalData(
+            dashboard.historical.years.map((y: any) => ({
+              year: y.year,
+              revenue: y.revenue / 1_000_000_000,
+              expenditure: y.expenditure / 1_000_000_000,
+              debt: y.debt / 1_000_000_000,
+              debt_gdp: y.debt_gdp,
+            })),
+          );
         }
 
-        if (
-          sectorRes.status === 'fulfilled' &&
-          sectorRes.value.ok
-        ) {
-          const json = await sectorRes.value.json();
-          if (Array.isArray(json.sectors)) {
-            setSectorData(
-              json.sectors.map((s: any) => ({
-                name: s.name,
-                value: s.amount,
-                color: s.color,
-              })),
-            );
-          }
+        if (Array.isArray(dashboard.sector_breakdown?.sectors)) {
+          setSectorData(
+            dashboard.sector_breakdown.sectors.map((s: any) => ({
+              name: s.name,
+              value: s.amount,
+              color: s.color,
+            })),
+          );
         }
 
-        if (
-          ministriesRes.status === 'fulfilled' &&
-          ministriesRes.value.ok
-        ) {
-          const json = await ministriesRes.value.json();
-          if (Array.isArray(json)) {
-            setMinistries(json);
-          }
+        if (Array.isArray(dashboard.ministries)) {
+          setMinistries(dashboard.ministries);
         }
 
-        if (
-          revenueRes.status === 'fulfilled' &&
-          revenueRes.value.ok
-        ) {
-          const json = await revenueRes.value.json();
-          setRevenue(json);
+        if (dashboard.revenue) {
+          setRevenue(dashboard.revenue);
         }
 
-        if (debtRes.status === 'fulfilled' && debtRes.value.ok) {
-          const json = await debtRes.value.json();
-          setDebt(json);
+        if (dashboard.debt) {
+          setDebt(dashboard.debt);
         }
 
-        if (
-          economicRes.status === 'fulfilled' &&
-          economicRes.value.ok
-        ) {
-          const json = await economicRes.value.json();
-          if (Array.isArray(json)) {
-            setIncomeComparisons(json);
-          }
+        if (Array.isArray(dashboard.economic_comparison)) {
+          setIncomeComparisons(dashboard.economic_comparison);
         }
+
+        setActivePoll(dashboard.active_poll ?? null);
       } catch (err) {
         console.error('Failed to load dashboard data', err);
+      } finally {
+        setDashboardLoading(false);
       }
     };
 
@@ -306,7 +269,7 @@ export default function Home() {
 
       {/* Current Poll Teaser */}
       <div className="mb-8">
-        <CurrentPollWidget />
+        <CurrentPollWidget poll={activePoll} loading={dashboardLoading} />
       </div>
 
       {/* Key Stats Grid */}
@@ -522,7 +485,10 @@ export default function Home() {
           className="bg-white rounded-xl border border-gray-200 p-6 mb-8"
         >
           {(() => {
-            const snapshot = incomeComparisons[0];
+            // Comparisons are ordered by island then year: show the latest New Providence figures
+            const snapshot =
+              incomeComparisons.filter((c) => c.island === 'new_providence').pop() ??
+              incomeComparisons[0];
             const middle = snapshot.middle_class.month_amount;
             const working = snapshot.working_class.month_amount;
             return (
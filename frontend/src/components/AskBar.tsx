@@ -255,9 +255,9 @@ export default function AskBar({ onAsk }: AskBarProps) {
                         </h3>
                         <div className="space-y-2">
                           {response.citations.map((citation, i) => {
-                            // Build PDF URL - browsers support #page=N for PDF navigation
+                            // Link to just the cited page rather than the whole PDF
                             const pdfFilename = encodeURIComponent(citation.document);
-                            const pdfPath = `/api/v1/documents/${pdfFilename}#page=${citation.page}`;
+                            const pdfPath = `/api/v1/documents/${pdfFilename}/pages/${citation.page}`;
                             return (
                               <a
                                 key={i}
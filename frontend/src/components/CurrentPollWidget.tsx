@@ -6,13 +6,30 @@ import type { Poll } from '@/types';
 import { useRouter } from 'next/navigation';
 import { Loader2, MessageCircle } from 'lucide-react';
 
-export default function CurrentPollWidget() {
-  const [poll, setPoll] = useState<Poll | null>(null);
-  const [isLoading, setIsLoading] = useState(true);
+interface CurrentPollWidgetProps {
+  // Provided by a parent that already loaded the poll (e.g. from /dashboard);
+  // when both are omitted the widget fetches the active poll itself.
+  poll?: Poll | null;
+  loading?: boolean;
+}
+
+export default function CurrentPollWidget({
+  poll: providedPoll,
+  loading,
+}: CurrentPollWidgetProps = {}) {
+  const preloaded = providedPoll !== undefined || loading !== undefined;
+  const [fetchedPoll, setPoll] = useState<Poll | null>(null);
+  const [fetching, setIsLoading] = useState(!preloaded);
   const [error, setError] = useState<string | null>(null);
   const router = useRouter();
 
+  const poll = preloaded ? providedPoll ?? null : fetchedPoll;
+  const isLoading = preloaded ? Boolean(loading) : fetching;
+
   useEffect(() => {
+    if (preloaded) {
+      return;
+    }
     const load = async () => {
       try {
         setIsLoading(true);
@@ -28,7 +45,7 @@ export default function CurrentPollWidget() {
       }
     };
     load();
-  }, []);
+  }, [preloaded]);
 
   if (isLoading) {
     return (
@@ -5,9 +5,11 @@ Extracts tables and text from budget documents.
 import os
 import re
 import json
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
+from functools import lru_cache
 import pdfplumber
 import pandas as pd
 from tqdm import tqdm
@@ -20,30 +22,112 @@ PROCESSED_DIR = DATA_DIR / "processed"
 METADATA_FILE = DATA_DIR / "document_metadata.json"
 
 # Ministry name normalization
+# Aliases are matched on normalized text (lowercase, "&" -> "and", punctuation
+# stripped) and the longest matching alias wins, so dict order does not matter.
+# Extend with register_ministry_alias() rather than mutating this dict.
 MINISTRY_ALIASES = {
     "ministry of education": "MOE",
+    "ministry of education and technical training": "MOE",
+    "department of education": "MOE",
     "education": "MOE",
     "ministry of health": "MOH",
+    "ministry of health and wellness": "MOH",
     "health": "MOH",
+    "department of public health": "DPH",
+    "public health": "DPH",
+    "department of environmental health services": "DEHS",
+    "environmental health": "DEHS",
     "ministry of national security": "MNS",
     "national security": "MNS",
+    "royal bahamas police force": "RBPF",
+    "police": "RBPF",
+    "royal bahamas defence force": "RBDF",
+    "defence force": "RBDF",
+    "department of correctional services": "BDCS",
+    "correctional services": "BDCS",
+    "department of immigration": "DOI",
+    "immigration": "DOI",
     "ministry of works": "MOW",
     "works": "MOW",
     "ministry of works and utilities": "MOW",
+    "ministry of works and family island affairs": "MOW",
     "ministry of finance": "MOF",
     "finance": "MOF",
+    "department of inland revenue": "DIR",
+    "inland revenue": "DIR",
+    "customs department": "CUS",
+    "customs": "CUS",
+    "treasury department": "TRE",
+    "public debt servicing": "DEBT",
     "ministry of tourism": "MOT",
+    "ministry of tourism investments and aviation": "MOT",
     "tourism": "MOT",
+    "ministry of foreign affairs": "MFA",
+    "foreign affairs": "MFA",
     "ministry of social services": "MSS",
+    "department of social services": "MSS",
     "social services": "MSS",
     "ministry of agriculture": "MOA",
+    "ministry of agriculture and marine resources": "MOA",
     "agriculture": "MOA",
     "ministry of environment": "MOENV",
+    "ministry of environment and natural resources": "MOENV",
     "environment": "MOENV",
+    "ministry of disaster risk management": "MDRM",
+    "disaster risk management": "MDRM",
+    "ministry of youth sports and culture": "MYSC",
+    "youth sports and culture": "MYSC",
+    "ministry of labour": "MOL",
+    "labour": "MOL",
+    "ministry of housing and urban renewal": "MOHUR",
+    "housing": "MOHUR",
+    "ministry of energy and transport": "MOET",
+    "ministry of transport and energy": "MOET",
+    "ministry of economic affairs": "MEA",
+    "economic affairs": "MEA",
+    "ministry of grand bahama": "MGB",
+    "ministry of the public service": "MPS",
+    "department of public service": "MPS",
+    "department of local government": "DLG",
+    "local government": "DLG",
+    "office of the attorney general": "AG",
+    "attorney general": "AG",
+    "ministry of legal affairs": "AG",
+    "the judiciary": "JUD",
+    "judiciary": "JUD",
+    "registrar general": "RGD",
+    "parliamentary registration department": "PRD",
+    "office of the auditor general": "AUD",
+    "auditor general": "AUD",
+    "cabinet office": "CAB",
+    "governor general": "GG",
+    "the senate": "SEN",
+    "house of assembly": "HOA",
     "office of the prime minister": "PMO",
     "prime minister": "PMO",
 }
 
+# Table detection pre-pass
+# Pages scoring below this are treated as narrative and skipped by table extraction.
+TABLE_SCORE_THRESHOLD = 0.35
+# Horizontal/vertical ruling edges needed for a page to look like a ruled table
+MIN_RULING_EDGES = 4
+# Numeric tokens needed before column alignment is considered meaningful
+MIN_NUMERIC_WORDS = 6
+# Bucket width (points) for grouping right-aligned numeric columns
+ALIGN_TOLERANCE = 3.0
+NUMERIC_TOKEN = re.compile(r"^\(?\$?-?[\d,]+(\.\d+)?\)?%?$")
+
+# Table extraction strategy per document type (see TABLE_STRATEGIES)
+DEFAULT_TABLE_STRATEGY = "pdfplumber"
+DOCUMENT_TABLE_STRATEGIES = {
+    "budget_book": "tabula",
+    "capital_estimates": "tabula",
+    "revenue_estimates": "tabula",
+    "health_strategy": "pdfplumber_text",
+    "procurement_report": "pdfplumber_text",
+}
+
 
 def ensure_dirs():
     """Create necessary directories."""
@@ -64,15 +148,45 @@ def save_metadata(metadata: dict):
         json.dump(metadata, f, indent=2, default=str)
 
 
+def _normalize_alias_text(text: str) -> str:
+    """Lowercase, spell out "&" and collapse punctuation/whitespace for matching."""
+    text = text.lower().replace("&", " and ")
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+def _compile_ministry_matcher(aliases: dict) -> re.Pattern:
+    """Build one alternation regex over all aliases, longest alias first."""
+    patterns = sorted({_normalize_alias_text(a) for a in aliases}, key=lambda a: (-len(a), a))
+    return re.compile(r"\b(?:" + "|".join(re.escape(p) for p in patterns) + r")\b")
+
+
+_MINISTRY_CODES = {_normalize_alias_text(a): code for a, code in MINISTRY_ALIASES.items()}
+_MINISTRY_MATCHER = _compile_ministry_matcher(MINISTRY_ALIASES)
+
+
+def register_ministry_alias(alias: str, code: str):
+    """Add (or override) a ministry alias and rebuild the compiled matcher."""
+    global _MINISTRY_MATCHER
+    MINISTRY_ALIASES[alias] = code
+    _MINISTRY_CODES[_normalize_alias_text(alias)] = code
+    _MINISTRY_MATCHER = _compile_ministry_matcher(MINISTRY_ALIASES)
+    normalize_ministry_name.cache_clear()
+
+
+@lru_cache(maxsize=65536)
 def normalize_ministry_name(name: str) -> Optional[str]:
-    """Normalize ministry names to standard codes."""
+    """
+    Normalize ministry names to standard codes.
+
+    Every alias is matched in a single regex pass and the longest match wins,
+    so "Department of Environmental Health" resolves to DEHS rather than MOH.
+    """
     if not name:
         return None
-    name_lower = name.lower().strip()
-    for pattern, code in MINISTRY_ALIASES.items():
-        if pattern in name_lower:
-            return code
-    return None
+    matches = _MINISTRY_MATCHER.findall(_normalize_alias_text(name))
+    if not matches:
+        return None
+    return _MINISTRY_CODES[max(matches, key=len)]
 
 
 def clean_currency(value: str) -> Optional[float]:
@@ -93,6 +207,17 @@ def clean_currency(value: str) -> Optional[float]:
         return None
 
 
+def clean_currency_series(values: pd.Series) -> pd.Series:
+    """Vectorized clean_currency over a whole column (float64, NaN when unparseable)."""
+    cleaned = values.astype("string").str.strip().str.replace(r"[$B\s,]", "", regex=True)
+    
+    # Handle parentheses for negative numbers
+    negative = cleaned.str.startswith("(") & cleaned.str.endswith(")")
+    cleaned = cleaned.mask(negative.fillna(False), "-" + cleaned.str.slice(1, -1))
+    
+    return pd.to_numeric(cleaned, errors="coerce").astype("float64")
+
+
 def extract_text_from_pdf(pdf_path: Path) -> list[dict]:
     """Extract all text from a PDF by page."""
     pages = []
@@ -112,86 +237,231 @@ def extract_text_from_pdf(pdf_path: Path) -> list[dict]:
     return pages
 
 
-def extract_tables_from_pdf(pdf_path: Path) -> list[dict]:
-    """Extract tables from a PDF."""
+def score_table_likelihood(page) -> float:
+    """
+    Cheaply score (0-1) how likely a page is to contain a table.
+
+    Uses ruling lines (horizontal and vertical edges) and right-aligned
+    numeric columns, both of which are far cheaper than a full
+    ``page.extract_tables()`` pass.
+    """
+    edges = page.edges
+    horizontal = sum(1 for e in edges if e.get("orientation") == "h")
+    vertical = len(edges) - horizontal
+    ruling_score = min(1.0, min(horizontal, vertical) / MIN_RULING_EDGES)
+
+    words = page.extract_words()
+    numeric = [w for w in words if NUMERIC_TOKEN.match(w["text"])]
+    if len(numeric) < MIN_NUMERIC_WORDS:
+        return ruling_score
+
+    # Budget tables right-align amounts, so their x1 positions repeat down the page
+    columns = Counter(round(w["x1"] / ALIGN_TOLERANCE) for w in numeric)
+    aligned = sum(count for count in columns.values() if count >= 3)
+    alignment_score = aligned / len(numeric)
+    numeric_density = len(numeric) / len(words)
+
+    return max(ruling_score, alignment_score * min(1.0, numeric_density * 4))
+
+
+def find_table_pages(pdf, threshold: float = TABLE_SCORE_THRESHOLD) -> list[int]:
+    """Return 1-based page numbers whose table score meets the threshold."""
+    candidates = []
+    for i, page in enumerate(tqdm(pdf.pages, desc="Scoring pages", leave=False)):
+        try:
+            score = score_table_likelihood(page)
+        except Exception:
+            # Scoring is only a filter; never drop a page because of it
+            score = 1.0
+        if score >= threshold:
+            candidates.append(i + 1)
+        page.flush_cache()
+    return candidates
+
+
+def _pdfplumber_tables(pdf_path: Path, pdf, page_numbers: list[int], table_settings: Optional[dict] = None) -> list[tuple[int, list]]:
+    """Extract raw tables with pdfplumber from the given pages."""
+    raw_tables = []
+    for page_number in tqdm(page_numbers, desc="Extracting tables", leave=False):
+        page = pdf.pages[page_number - 1]
+        for table in page.extract_tables(table_settings or {}):
+            raw_tables.append((page_number, table))
+        page.flush_cache()
+    return raw_tables
+
+
+def _pdfplumber_text_tables(pdf_path: Path, pdf, page_numbers: list[int]) -> list[tuple[int, list]]:
+    """pdfplumber using text alignment instead of ruling lines (unruled tables)."""
+    return _pdfplumber_tables(pdf_path, pdf, page_numbers, {
+        "vertical_strategy": "text",
+        "horizontal_strategy": "text",
+    })
+
+
+def _tabula_tables(pdf_path: Path, pdf, page_numbers: list[int]) -> list[tuple[int, list]]:
+    """Extract raw tables with tabula-py (one JVM call for all candidate pages)."""
+    try:
+        import tabula
+        results = tabula.read_pdf(
+            str(pdf_path),
+            pages=page_numbers,
+            multiple_tables=True,
+            output_format="json",
+            silent=True,
+        )
+    except Exception as e:
+        print(f"  ⚠ tabula unavailable ({e}), falling back to pdfplumber")
+        return _pdfplumber_tables(pdf_path, pdf, page_numbers)
+
+    raw_tables = []
+    for result in results:
+        rows = [[cell.get("text") or None for cell in row] for row in result.get("data", [])]
+        raw_tables.append((result.get("page_number"), rows))
+    return raw_tables
+
+
+# Pluggable table extraction strategies: name -> fn(pdf_path, pdf, page_numbers)
+TABLE_STRATEGIES = {
+    "pdfplumber": _pdfplumber_tables,
+    "pdfplumber_text": _pdfplumber_text_tables,
+    "tabula": _tabula_tables,
+}
+
+
+def get_table_strategy(document_type: Optional[str] = None) -> str:
+    """Pick the table extraction strategy for a document type."""
+    return DOCUMENT_TABLE_STRATEGIES.get(document_type or "", DEFAULT_TABLE_STRATEGY)
+
+
+def extract_tables_from_pdf(
+    pdf_path: Path,
+    strategy: Optional[str] = None,
+    document_type: Optional[str] = None,
+    detect_tables: bool = True,
+) -> list[dict]:
+    """
+    Extract tables from a PDF.
+
+    A cheap pre-pass (score_table_likelihood) selects candidate pages so the
+    full extraction strategy only runs where a table is likely.
+    """
     all_tables = []
+    strategy = strategy or get_table_strategy(document_type)
+    if strategy not in TABLE_STRATEGIES:
+        raise ValueError(f"Unknown table strategy '{strategy}'. Available: {list(TABLE_STRATEGIES)}")
     
     try:
         with pdfplumber.open(pdf_path) as pdf:
-            for i, page in enumerate(tqdm(pdf.pages, desc="Extracting tables", leave=False)):
-                tables = page.extract_tables()
-                
-                for j, table in enumerate(tables):
-                    if not table or len(table) < 2:
-                        continue
-                    
-                    # Convert to DataFrame for easier processing
-                    df = pd.DataFrame(table[1:], columns=table[0])
-                    
-                    # Skip empty or invalid tables
-                    if df.empty or len(df.columns) < 2:
-                        continue
-                    
-                    all_tables.append({
-                        "page_number": i + 1,
-                        "table_index": j,
-                        "columns": list(df.columns),
-                        "row_count": len(df),
-                        "data": df.to_dict(orient="records"),
-                    })
+            if detect_tables:
+                page_numbers = find_table_pages(pdf)
+            else:
+                page_numbers = list(range(1, len(pdf.pages) + 1))
+            print(f"  ✓ {len(page_numbers)}/{len(pdf.pages)} pages look tabular (strategy: {strategy})")
+            
+            raw_tables = TABLE_STRATEGIES[strategy](pdf_path, pdf, page_numbers) if page_numbers else []
     except Exception as e:
         print(f"Error extracting tables from {pdf_path}: {e}")
+        return all_tables
+    
+    table_counts = Counter()
+    for page_number, table in raw_tables:
+        j = table_counts[page_number]
+        table_counts[page_number] += 1
+        
+        if not table or len(table) < 2:
+            continue
+        
+        # Convert to DataFrame for easier processing
+        df = pd.DataFrame(table[1:], columns=table[0])
+        
+        # Skip empty or invalid tables
+        if df.empty or len(df.columns) < 2:
+            continue
+        
+        all_tables.append({
+            "page_number": page_number,
+            "table_index": j,
+            "strategy": strategy,
+            "columns": list(df.columns),
+            "row_count": len(df),
+            "data": df.to_dict(orient="records"),
+        })
     
     return all_tables
 
 
-def parse_budget_table(table_data: dict) -> Optional[dict]:
-    """Parse a budget allocation table into structured data."""
-    columns = [str(c).lower() if c else "" for c in table_data.get("columns", [])]
-    rows = table_data.get("data", [])
-    
-    # Look for common budget table patterns
+def detect_budget_columns(columns: list) -> tuple[Optional[int], Optional[int]]:
+    """Find the (amount, name) column positions of a budget table from its headers."""
     # Columns might be: Item, Description, Amount, Previous Year, etc.
-    
     amount_col = None
     name_col = None
     
-    for i, col in enumerate(columns):
+    for i, col in enumerate(str(c).lower() if c else "" for c in columns):
         if any(term in col for term in ["amount", "allocation", "budget", "estimate", "total"]):
             amount_col = i
         if any(term in col for term in ["item", "description", "name", "head", "ministry"]):
             name_col = i
     
+    return amount_col, name_col
+
+
+def normalize_budget_table(table_data: dict) -> Optional[pd.DataFrame]:
+    """
+    Columnar normalization of a budget table.
+
+    Returns a typed frame (name: string, amount: float64, ministry_code:
+    string, source_page: int64) built with whole-column string ops.
+    """
+    amount_col, name_col = detect_budget_columns(table_data.get("columns", []))
     if amount_col is None or name_col is None:
         return None
     
-    parsed_items = []
-    for row in rows:
-        values = list(row.values())
-        if len(values) <= max(amount_col, name_col):
-            continue
-        
-        name = str(values[name_col]) if values[name_col] else ""
-        amount = clean_currency(str(values[amount_col]) if values[amount_col] else "")
-        
-        if name and amount:
-            ministry_code = normalize_ministry_name(name)
-            parsed_items.append({
-                "name": name.strip(),
-                "amount": amount,
-                "ministry_code": ministry_code,
-            })
+    rows = table_data.get("data", [])
+    if not rows:
+        return None
     
-    if not parsed_items:
+    frame = pd.DataFrame.from_records(rows)
+    if len(frame.columns) <= max(amount_col, name_col):
         return None
     
+    names = frame.iloc[:, name_col].astype("string").str.strip()
+    amounts = clean_currency_series(frame.iloc[:, amount_col])
+    
+    keep = (names.fillna("") != "") & amounts.notna() & (amounts != 0)
+    if not keep.any():
+        return None
+    names = names[keep].reset_index(drop=True)
+    
+    # Classify each distinct name once rather than every cell
+    unique_names = names.unique()
+    codes = dict(zip(unique_names, map(normalize_ministry_name, unique_names)))
+    
+    return pd.DataFrame({
+        "name": names,
+        "amount": amounts[keep].reset_index(drop=True),
+        "ministry_code": names.map(codes).astype("string"),
+        "source_page": pd.Series(table_data["page_number"], index=names.index, dtype="int64"),
+    })
+
+
+def budget_frame_to_dict(frame: pd.DataFrame, table_data: dict) -> dict:
+    """Convert a normalized budget frame to the JSON-friendly parsed table format."""
+    items = frame[["name", "amount", "ministry_code"]].astype(object)
     return {
-        "items": parsed_items,
+        "items": items.where(items.notna(), None).to_dict(orient="records"),
         "page_number": table_data["page_number"],
         "table_index": table_data["table_index"],
     }
 
 
+def parse_budget_table(table_data: dict) -> Optional[dict]:
+    """Parse a budget allocation table into structured data."""
+    frame = normalize_budget_table(table_data)
+    if frame is None:
+        return None
+    return budget_frame_to_dict(frame, table_data)
+
+
 def process_document(doc_meta: dict) -> dict:
     """Process a single document."""
     filename = doc_meta["filename"]
@@ -206,15 +476,18 @@ def process_document(doc_meta: dict) -> dict:
     # Extract text
     pages = extract_text_from_pdf(pdf_path)
     
-    # Extract tables
-    tables = extract_tables_from_pdf(pdf_path)
+    # Extract tables (only on pages the pre-pass marks as tabular)
+    tables = extract_tables_from_pdf(pdf_path, document_type=doc_meta.get("document_type"))
     
     # Parse budget tables
+    budget_frames = []
     parsed_budgets = []
     for table in tables:
-        parsed = parse_budget_table(table)
-        if parsed:
-            parsed_budgets.append(parsed)
+        frame = normalize_budget_table(table)
+        if frame is None:
+            continue
+        budget_frames.append(frame)
+        parsed_budgets.append(budget_frame_to_dict(frame, table))
     
     # Save processed data
     base_name = pdf_path.stem
@@ -239,21 +512,13 @@ def process_document(doc_meta: dict) -> dict:
         }, f, indent=2)
     
     # Save as CSV if we have budget data
-    if parsed_budgets:
-        all_items = []
-        for budget in parsed_budgets:
-            for item in budget["items"]:
-                all_items.append({
-                    **item,
-                    "source_page": budget["page_number"],
-                    "source_file": filename,
-                })
+    if budget_frames:
+        df = pd.concat(budget_frames, ignore_index=True)
+        df["source_file"] = filename
         
-        if all_items:
-            csv_file = PROCESSED_DIR / f"{base_name}_budget_items.csv"
-            df = pd.DataFrame(all_items)
-            df.to_csv(csv_file, index=False)
-            print(f"  ✓ Saved {len(all_items)} budget items to CSV")
+        csv_file = PROCESSED_DIR / f"{base_name}_budget_items.csv"
+        df.to_csv(csv_file, index=False)
+        print(f"  ✓ Saved {len(df)} budget items to CSV")
     
     return {
         "status": "success",